@@ -5,8 +5,23 @@ d = { 'settings': { 'branch': 'master',
                 'doc_host': 'https://jnareb.github.io',
                 'git_url': 'https://github.com/jnareb/git-commit-graph-ext/tree/master/',
                 'lib_path': 'git_commit_graph_ext'},
-  'syms': { 'git_commit_graph_ext.checkpoint': { 'git_commit_graph_ext.checkpoint._out_basename': ( 'checkpoint.html#_out_basename',
+  'syms': { 'git_commit_graph_ext._testing': { 'git_commit_graph_ext._testing._commit': ( 'git.html#_commit',
+                                                                                          'git_commit_graph_ext/_testing.py'),
+                                               'git_commit_graph_ext._testing._create_test_repo': ( 'git.html#_create_test_repo',
+                                                                                                    'git_commit_graph_ext/_testing.py'),
+                                               'git_commit_graph_ext._testing._git': ('git.html#_git', 'git_commit_graph_ext/_testing.py')},
+            'git_commit_graph_ext.checkpoint': { 'git_commit_graph_ext.checkpoint._dtype_from_json': ( 'checkpoint.html#_dtype_from_json',
+                                                                                                       'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint._dtype_to_json': ( 'checkpoint.html#_dtype_to_json',
+                                                                                                     'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint._load_arrays_bin': ( 'checkpoint.html#_load_arrays_bin',
+                                                                                                       'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint._new_node_ids': ( 'checkpoint.html#_new_node_ids',
+                                                                                                    'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint._out_basename': ( 'checkpoint.html#_out_basename',
                                                                                                     'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint._save_arrays_bin': ( 'checkpoint.html#_save_arrays_bin',
+                                                                                                       'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint._savefile_name': ( 'checkpoint.html#_savefile_name',
                                                                                                      'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.compute_cached_df': ( 'checkpoint.html#compute_cached_df',
@@ -25,6 +40,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                          'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.dataframe_to_reachability_labels': ( 'checkpoint.html#dataframe_to_reachability_labels',
                                                                                                                        'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint.full_relabel_worthwhile': ( 'checkpoint.html#full_relabel_worthwhile',
+                                                                                                              'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.graph_data_to_dataframe': ( 'checkpoint.html#graph_data_to_dataframe',
                                                                                                               'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.graph_to_dataframe': ( 'checkpoint.html#graph_to_dataframe',
@@ -33,34 +50,142 @@ d = { 'settings': { 'branch': 'master',
                                                                                                    'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.load_df_from_file': ( 'checkpoint.html#load_df_from_file',
                                                                                                         'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint.load_graph_bin': ( 'checkpoint.html#load_graph_bin',
+                                                                                                     'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.load_graph_df': ( 'checkpoint.html#load_graph_df',
                                                                                                     'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.save_df_to_file': ( 'checkpoint.html#save_df_to_file',
                                                                                                       'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.save_graph': ( 'checkpoint.html#save_graph',
                                                                                                  'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint.save_graph_bin': ( 'checkpoint.html#save_graph_bin',
+                                                                                                     'git_commit_graph_ext/checkpoint.py'),
                                                  'git_commit_graph_ext.checkpoint.save_graph_df': ( 'checkpoint.html#save_graph_df',
-                                                                                                    'git_commit_graph_ext/checkpoint.py')},
-            'git_commit_graph_ext.commit_graph': { 'git_commit_graph_ext.commit_graph._commit_graph_name': ( 'git.html#_commit_graph_name',
+                                                                                                    'git_commit_graph_ext/checkpoint.py'),
+                                                 'git_commit_graph_ext.checkpoint.update_reachability_labels': ( 'checkpoint.html#update_reachability_labels',
+                                                                                                                 'git_commit_graph_ext/checkpoint.py')},
+            'git_commit_graph_ext.commit_graph': { 'git_commit_graph_ext.commit_graph._clone_and_scan': ( 'git.html#_clone_and_scan',
+                                                                                                          'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._commit_graph_name': ( 'git.html#_commit_graph_name',
                                                                                                              'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._error_message': ( 'git.html#_error_message',
+                                                                                                         'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._independent_tips': ( 'git.html#_independent_tips',
+                                                                                                            'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._label_graph_bin': ( 'git.html#_label_graph_bin',
+                                                                                                           'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._parse_adjlist_lines': ( 'git.html#_parse_adjlist_lines',
+                                                                                                               'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._read_tips': ( 'git.html#_read_tips',
+                                                                                                     'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph._repo_basename': ( 'git.html#_repo_basename',
                                                                                                          'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._repo_branch_tips': ( 'git.html#_repo_branch_tips',
+                                                                                                            'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._repo_dates_savefile': ( 'git.html#_repo_dates_savefile',
+                                                                                                               'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph._repo_graph_name': ( 'git.html#_repo_graph_name',
                                                                                                            'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph._repo_graph_savefile': ( 'git.html#_repo_graph_savefile',
                                                                                                                'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._repo_rescan_adjlist': ( 'git.html#_repo_rescan_adjlist',
+                                                                                                               'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._repo_tips_savefile': ( 'git.html#_repo_tips_savefile',
+                                                                                                              'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._repo_update_adjlist': ( 'git.html#_repo_update_adjlist',
+                                                                                                               'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._skip_date': ( 'git.html#_skip_date',
+                                                                                                     'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._split_dates_lines': ( 'git.html#_split_dates_lines',
+                                                                                                             'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph._write_tips': ( 'git.html#_write_tips',
+                                                                                                      'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.commit_graph': ( 'git.html#commit_graph',
                                                                                                        'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.commit_graphs_pipeline': ( 'git.html#commit_graphs_pipeline',
+                                                                                                                 'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.get_repo': ( 'git.html#get_repo',
                                                                                                    'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.repo_adjlist_to_graph': ( 'git.html#repo_adjlist_to_graph',
                                                                                                                 'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.repo_commit_dates': ( 'git.html#repo_commit_dates',
+                                                                                                            'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.repo_generate_adjlist': ( 'git.html#repo_generate_adjlist',
                                                                                                                 'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.repo_to_arrays': ( 'git.html#repo_to_arrays',
+                                                                                                         'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.repo_to_csr_graph': ( 'git.html#repo_to_csr_graph',
+                                                                                                            'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.repo_to_graph': ( 'git.html#repo_to_graph',
                                                                                                         'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.repo_update_adjlist': ( 'git.html#repo_update_adjlist',
+                                                                                                              'git_commit_graph_ext/commit_graph.py'),
+                                                   'git_commit_graph_ext.commit_graph.repo_update_graph': ( 'git.html#repo_update_graph',
+                                                                                                            'git_commit_graph_ext/commit_graph.py'),
                                                    'git_commit_graph_ext.commit_graph.sparse_clone': ( 'git.html#sparse_clone',
                                                                                                        'git_commit_graph_ext/commit_graph.py')},
+            'git_commit_graph_ext.commit_graph_file': { 'git_commit_graph_ext.commit_graph_file._concat_commit_graph_layers': ( 'commit_graph_file.html#_concat_commit_graph_layers',
+                                                                                                                                'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file._objects_info_dir': ( 'commit_graph_file.html#_objects_info_dir',
+                                                                                                                      'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file._read_chunk_table': ( 'commit_graph_file.html#_read_chunk_table',
+                                                                                                                      'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file.commit_graph_oids': ( 'commit_graph_file.html#commit_graph_oids',
+                                                                                                                      'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file.read_commit_graph': ( 'commit_graph_file.html#read_commit_graph',
+                                                                                                                      'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file.read_commit_graph_file': ( 'commit_graph_file.html#read_commit_graph_file',
+                                                                                                                           'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file.read_commit_graph_labels': ( 'commit_graph_file.html#read_commit_graph_labels',
+                                                                                                                             'git_commit_graph_ext/commit_graph_file.py'),
+                                                        'git_commit_graph_ext.commit_graph_file.write_commit_graph_labels': ( 'commit_graph_file.html#write_commit_graph_labels',
+                                                                                                                              'git_commit_graph_ext/commit_graph_file.py')},
+            'git_commit_graph_ext.csr_graph': { 'git_commit_graph_ext.csr_graph.CSRGraph': ( 'csr_graph.html#csrgraph',
+                                                                                             'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.__contains__': ( 'csr_graph.html#csrgraph.__contains__',
+                                                                                                          'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.__init__': ( 'csr_graph.html#csrgraph.__init__',
+                                                                                                      'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.__iter__': ( 'csr_graph.html#csrgraph.__iter__',
+                                                                                                      'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.__len__': ( 'csr_graph.html#csrgraph.__len__',
+                                                                                                     'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.__repr__': ( 'csr_graph.html#csrgraph.__repr__',
+                                                                                                      'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.add_commits': ( 'csr_graph.html#csrgraph.add_commits',
+                                                                                                         'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.clear': ( 'csr_graph.html#csrgraph.clear',
+                                                                                                   'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.from_networkx': ( 'csr_graph.html#csrgraph.from_networkx',
+                                                                                                           'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.in_degree': ( 'csr_graph.html#csrgraph.in_degree',
+                                                                                                       'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.is_directed': ( 'csr_graph.html#csrgraph.is_directed',
+                                                                                                         'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.node_id': ( 'csr_graph.html#csrgraph.node_id',
+                                                                                                     'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.nodes': ( 'csr_graph.html#csrgraph.nodes',
+                                                                                                   'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.number_of_edges': ( 'csr_graph.html#csrgraph.number_of_edges',
+                                                                                                             'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.number_of_nodes': ( 'csr_graph.html#csrgraph.number_of_nodes',
+                                                                                                             'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.oid_names': ( 'csr_graph.html#csrgraph.oid_names',
+                                                                                                       'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.out_degree': ( 'csr_graph.html#csrgraph.out_degree',
+                                                                                                        'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.predecessors': ( 'csr_graph.html#csrgraph.predecessors',
+                                                                                                          'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.reverse_arrays': ( 'csr_graph.html#csrgraph.reverse_arrays',
+                                                                                                            'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.successors': ( 'csr_graph.html#csrgraph.successors',
+                                                                                                        'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph.CSRGraph.to_networkx': ( 'csr_graph.html#csrgraph.to_networkx',
+                                                                                                         'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph._csr_dfs': ( 'csr_graph.html#_csr_dfs',
+                                                                                             'git_commit_graph_ext/csr_graph.py'),
+                                                'git_commit_graph_ext.csr_graph._first_parent_chains': ( 'csr_graph.html#_first_parent_chains',
+                                                                                                         'git_commit_graph_ext/csr_graph.py')},
             'git_commit_graph_ext.example_graphs': { 'git_commit_graph_ext.example_graphs.RCH_graph': ( 'example_graphs.html#rch_graph',
                                                                                                         'git_commit_graph_ext/example_graphs.py'),
                                                      'git_commit_graph_ext.example_graphs.commit_graph_Stolee': ( 'example_graphs.html#commit_graph_stolee',
@@ -74,24 +199,210 @@ d = { 'settings': { 'branch': 'master',
                                                      'git_commit_graph_ext.example_graphs.tree_DAG': ( 'example_graphs.html#tree_dag',
                                                                                                        'git_commit_graph_ext/example_graphs.py')},
             'git_commit_graph_ext.graph_datasets': {},
-            'git_commit_graph_ext.labelling.dfs_intervals': { 'git_commit_graph_ext.labelling.dfs_intervals.find_dfs_intervals': ( 'interval_labels.html#find_dfs_intervals',
+            'git_commit_graph_ext.label_encoding': { 'git_commit_graph_ext.label_encoding.BitPackedArray': ( 'label_encoding.html#bitpackedarray',
+                                                                                                             'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.BitPackedArray.__getitem__': ( 'label_encoding.html#bitpackedarray.__getitem__',
+                                                                                                                         'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.BitPackedArray.__init__': ( 'label_encoding.html#bitpackedarray.__init__',
+                                                                                                                      'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.BitPackedArray.__len__': ( 'label_encoding.html#bitpackedarray.__len__',
+                                                                                                                     'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.BitPackedArray.nbytes': ( 'label_encoding.html#bitpackedarray.nbytes',
+                                                                                                                    'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.BitPackedArray.to_numpy': ( 'label_encoding.html#bitpackedarray.to_numpy',
+                                                                                                                      'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray': ( 'label_encoding.html#varintarray',
+                                                                                                          'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray.__getitem__': ( 'label_encoding.html#varintarray.__getitem__',
+                                                                                                                      'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray.__init__': ( 'label_encoding.html#varintarray.__init__',
+                                                                                                                   'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray.__len__': ( 'label_encoding.html#varintarray.__len__',
+                                                                                                                  'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray.nbytes': ( 'label_encoding.html#varintarray.nbytes',
+                                                                                                                 'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.VarintArray.to_numpy': ( 'label_encoding.html#varintarray.to_numpy',
+                                                                                                                   'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.label_encoding_sizes': ( 'label_encoding.html#label_encoding_sizes',
+                                                                                                                   'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.zigzag_decode': ( 'label_encoding.html#zigzag_decode',
+                                                                                                            'git_commit_graph_ext/label_encoding.py'),
+                                                     'git_commit_graph_ext.label_encoding.zigzag_encode': ( 'label_encoding.html#zigzag_encode',
+                                                                                                            'git_commit_graph_ext/label_encoding.py')},
+            'git_commit_graph_ext.labelling.bitmaps': { 'git_commit_graph_ext.labelling.bitmaps._bitmaps_lookup': ( 'bitmaps.html#_bitmaps_lookup',
+                                                                                                                    'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps._mask_to_runs': ( 'bitmaps.html#_mask_to_runs',
+                                                                                                                  'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps._next_bitmap_gap': ( 'bitmaps.html#_next_bitmap_gap',
+                                                                                                                     'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps._reachability_bitmaps': ( 'bitmaps.html#_reachability_bitmaps',
+                                                                                                                          'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps._select_bitmap_commits': ( 'bitmaps.html#_select_bitmap_commits',
+                                                                                                                           'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps.find_reachability_bitmaps': ( 'bitmaps.html#find_reachability_bitmaps',
+                                                                                                                              'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps.load_reachability_bitmaps': ( 'bitmaps.html#load_reachability_bitmaps',
+                                                                                                                              'git_commit_graph_ext/labelling/bitmaps.py'),
+                                                        'git_commit_graph_ext.labelling.bitmaps.save_reachability_bitmaps': ( 'bitmaps.html#save_reachability_bitmaps',
+                                                                                                                              'git_commit_graph_ext/labelling/bitmaps.py')},
+            'git_commit_graph_ext.labelling.bloom_filters': { 'git_commit_graph_ext.labelling.bloom_filters._bits_to_array': ( 'bloom_filters.html#_bits_to_array',
+                                                                                                                               'git_commit_graph_ext/labelling/bloom_filters.py'),
+                                                              'git_commit_graph_ext.labelling.bloom_filters._bloom_filter_bits': ( 'bloom_filters.html#_bloom_filter_bits',
+                                                                                                                                   'git_commit_graph_ext/labelling/bloom_filters.py'),
+                                                              'git_commit_graph_ext.labelling.bloom_filters.find_bloom_filter_labels': ( 'bloom_filters.html#find_bloom_filter_labels',
+                                                                                                                                         'git_commit_graph_ext/labelling/bloom_filters.py')},
+            'git_commit_graph_ext.labelling.chains': { 'git_commit_graph_ext.labelling.chains._chain_labels': ( 'chains.html#_chain_labels',
+                                                                                                                'git_commit_graph_ext/labelling/chains.py'),
+                                                       'git_commit_graph_ext.labelling.chains._greedy_chains': ( 'chains.html#_greedy_chains',
+                                                                                                                 'git_commit_graph_ext/labelling/chains.py'),
+                                                       'git_commit_graph_ext.labelling.chains._minimum_chains': ( 'chains.html#_minimum_chains',
+                                                                                                                  'git_commit_graph_ext/labelling/chains.py'),
+                                                       'git_commit_graph_ext.labelling.chains.find_chain_cover_labels': ( 'chains.html#find_chain_cover_labels',
+                                                                                                                          'git_commit_graph_ext/labelling/chains.py')},
+            'git_commit_graph_ext.labelling.corrected_dates': { 'git_commit_graph_ext.labelling.corrected_dates._find_corrected_dates_csr': ( 'corrected_dates.html#_find_corrected_dates_csr',
+                                                                                                                                              'git_commit_graph_ext/labelling/corrected_dates.py'),
+                                                                'git_commit_graph_ext.labelling.corrected_dates.corrected_date_offsets': ( 'corrected_dates.html#corrected_date_offsets',
+                                                                                                                                           'git_commit_graph_ext/labelling/corrected_dates.py'),
+                                                                'git_commit_graph_ext.labelling.corrected_dates.find_corrected_dates': ( 'corrected_dates.html#find_corrected_dates',
+                                                                                                                                         'git_commit_graph_ext/labelling/corrected_dates.py')},
+            'git_commit_graph_ext.labelling.dfs_intervals': { 'git_commit_graph_ext.labelling.dfs_intervals._dfs_labels': ( 'interval_labels.html#_dfs_labels',
+                                                                                                                            'git_commit_graph_ext/labelling/dfs_intervals.py'),
+                                                              'git_commit_graph_ext.labelling.dfs_intervals._dfs_labels_of_new_nodes': ( 'interval_labels.html#_dfs_labels_of_new_nodes',
+                                                                                                                                         'git_commit_graph_ext/labelling/dfs_intervals.py'),
+                                                              'git_commit_graph_ext.labelling.dfs_intervals.find_dfs_intervals': ( 'interval_labels.html#find_dfs_intervals',
                                                                                                                                    'git_commit_graph_ext/labelling/dfs_intervals.py'),
                                                               'git_commit_graph_ext.labelling.dfs_intervals.find_dfs_intervals_extra': ( 'interval_labels.html#find_dfs_intervals_extra',
                                                                                                                                          'git_commit_graph_ext/labelling/dfs_intervals.py'),
                                                               'git_commit_graph_ext.labelling.dfs_intervals.find_dfs_spanning': ( 'interval_labels.html#find_dfs_spanning',
-                                                                                                                                  'git_commit_graph_ext/labelling/dfs_intervals.py')},
-            'git_commit_graph_ext.labelling.levels': { 'git_commit_graph_ext.labelling.levels.find_levels': ( 'levels.html#find_levels',
-                                                                                                              'git_commit_graph_ext/labelling/levels.py')},
-            'git_commit_graph_ext.reachability': { 'git_commit_graph_ext.reachability.generic_is_reachable': ( 'reach.html#generic_is_reachable',
+                                                                                                                                  'git_commit_graph_ext/labelling/dfs_intervals.py'),
+                                                              'git_commit_graph_ext.labelling.dfs_intervals.update_dfs_intervals_extra': ( 'interval_labels.html#update_dfs_intervals_extra',
+                                                                                                                                           'git_commit_graph_ext/labelling/dfs_intervals.py')},
+            'git_commit_graph_ext.labelling.feline': { 'git_commit_graph_ext.labelling.feline._feline_coordinates': ( 'feline.html#_feline_coordinates',
+                                                                                                                      'git_commit_graph_ext/labelling/feline.py'),
+                                                       'git_commit_graph_ext.labelling.feline.find_feline_index': ( 'feline.html#find_feline_index',
+                                                                                                                    'git_commit_graph_ext/labelling/feline.py')},
+            'git_commit_graph_ext.labelling.grail': { 'git_commit_graph_ext.labelling.grail._grail_traversal': ( 'grail.html#_grail_traversal',
+                                                                                                                 'git_commit_graph_ext/labelling/grail.py'),
+                                                      'git_commit_graph_ext.labelling.grail.find_grail_intervals': ( 'grail.html#find_grail_intervals',
+                                                                                                                     'git_commit_graph_ext/labelling/grail.py')},
+            'git_commit_graph_ext.labelling.landmarks': { 'git_commit_graph_ext.labelling.landmarks._labels_to_csr': ( 'landmarks.html#_labels_to_csr',
+                                                                                                                       'git_commit_graph_ext/labelling/landmarks.py'),
+                                                          'git_commit_graph_ext.labelling.landmarks._landmark_order': ( 'landmarks.html#_landmark_order',
+                                                                                                                        'git_commit_graph_ext/labelling/landmarks.py'),
+                                                          'git_commit_graph_ext.labelling.landmarks._pruned_landmark_labels': ( 'landmarks.html#_pruned_landmark_labels',
+                                                                                                                                'git_commit_graph_ext/labelling/landmarks.py'),
+                                                          'git_commit_graph_ext.labelling.landmarks._trailing_zeros': ( 'landmarks.html#_trailing_zeros',
+                                                                                                                        'git_commit_graph_ext/labelling/landmarks.py'),
+                                                          'git_commit_graph_ext.labelling.landmarks.find_landmark_labels': ( 'landmarks.html#find_landmark_labels',
+                                                                                                                             'git_commit_graph_ext/labelling/landmarks.py')},
+            'git_commit_graph_ext.labelling.levels': { 'git_commit_graph_ext.labelling.levels._find_levels_csr': ( 'levels.html#_find_levels_csr',
+                                                                                                                   'git_commit_graph_ext/labelling/levels.py'),
+                                                       'git_commit_graph_ext.labelling.levels._find_levels_frontier': ( 'levels.html#_find_levels_frontier',
+                                                                                                                        'git_commit_graph_ext/labelling/levels.py'),
+                                                       'git_commit_graph_ext.labelling.levels._levels_of_new_nodes': ( 'levels.html#_levels_of_new_nodes',
+                                                                                                                       'git_commit_graph_ext/labelling/levels.py'),
+                                                       'git_commit_graph_ext.labelling.levels.find_levels': ( 'levels.html#find_levels',
+                                                                                                              'git_commit_graph_ext/labelling/levels.py'),
+                                                       'git_commit_graph_ext.labelling.levels.update_levels': ( 'levels.html#update_levels',
+                                                                                                                'git_commit_graph_ext/labelling/levels.py')},
+            'git_commit_graph_ext.labelling.preach': { 'git_commit_graph_ext.labelling.preach._contraction_ranks': ( 'preach.html#_contraction_ranks',
+                                                                                                                     'git_commit_graph_ext/labelling/preach.py'),
+                                                       'git_commit_graph_ext.labelling.preach.find_contraction_ranks': ( 'preach.html#find_contraction_ranks',
+                                                                                                                         'git_commit_graph_ext/labelling/preach.py'),
+                                                       'git_commit_graph_ext.labelling.preach.find_preach_index': ( 'preach.html#find_preach_index',
+                                                                                                                    'git_commit_graph_ext/labelling/preach.py')},
+            'git_commit_graph_ext.query_cache': { 'git_commit_graph_ext.query_cache.ReachabilityCache': ( 'query_cache.html#reachabilitycache',
+                                                                                                          'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.__init__': ( 'query_cache.html#reachabilitycache.__init__',
+                                                                                                                   'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.__len__': ( 'query_cache.html#reachabilitycache.__len__',
+                                                                                                                  'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.__repr__': ( 'query_cache.html#reachabilitycache.__repr__',
+                                                                                                                   'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._check_version': ( 'query_cache.html#reachabilitycache._check_version',
+                                                                                                                         'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._coldest': ( 'query_cache.html#reachabilitycache._coldest',
+                                                                                                                   'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._evict': ( 'query_cache.html#reachabilitycache._evict',
+                                                                                                                 'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._put': ( 'query_cache.html#reachabilitycache._put',
+                                                                                                               'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._touch': ( 'query_cache.html#reachabilitycache._touch',
+                                                                                                                 'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache._walk_facts': ( 'query_cache.html#reachabilitycache._walk_facts',
+                                                                                                                      'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.clear': ( 'query_cache.html#reachabilitycache.clear',
+                                                                                                                'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.graph_version': ( 'query_cache.html#reachabilitycache.graph_version',
+                                                                                                                        'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.hit_rate': ( 'query_cache.html#reachabilitycache.hit_rate',
+                                                                                                                   'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.is_reachable': ( 'query_cache.html#reachabilitycache.is_reachable',
+                                                                                                                       'git_commit_graph_ext/query_cache.py'),
+                                                  'git_commit_graph_ext.query_cache.ReachabilityCache.update': ( 'query_cache.html#reachabilitycache.update',
+                                                                                                                 'git_commit_graph_ext/query_cache.py')},
+            'git_commit_graph_ext.reachability': { 'git_commit_graph_ext.reachability._batch_field': ( 'reach.html#_batch_field',
+                                                                                                       'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._batch_labels': ( 'reach.html#_batch_labels',
+                                                                                                        'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._batch_search': ( 'reach.html#_batch_search',
+                                                                                                        'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._batch_search_init': ( 'reach.html#_batch_search_init',
+                                                                                                             'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._batch_search_one': ( 'reach.html#_batch_search_one',
+                                                                                                            'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._bits_subset': ( 'reach.html#_bits_subset',
+                                                                                                       'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._chain_label_position': ( 'reach.html#_chain_label_position',
+                                                                                                                'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._generation_key': ( 'reach.html#_generation_key',
+                                                                                                          'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._grail_excludes': ( 'reach.html#_grail_excludes',
+                                                                                                          'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._has_label_field': ( 'reach.html#_has_label_field',
+                                                                                                           'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._has_labels': ( 'reach.html#_has_labels',
+                                                                                                      'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._is_dfs_extra': ( 'reach.html#_is_dfs_extra',
+                                                                                                        'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._label_field': ( 'reach.html#_label_field',
+                                                                                                       'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._landmark_label': ( 'reach.html#_landmark_label',
+                                                                                                          'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability._runs_contain': ( 'reach.html#_runs_contain',
+                                                                                                        'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.ahead_behind': ( 'reach.html#ahead_behind',
+                                                                                                       'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.batch_is_reachable': ( 'reach.html#batch_is_reachable',
+                                                                                                             'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.bitmap_count_reachable': ( 'reach.html#bitmap_count_reachable',
+                                                                                                                 'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.bitmap_is_reachable': ( 'reach.html#bitmap_is_reachable',
+                                                                                                              'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.chain_is_reachable': ( 'reach.html#chain_is_reachable',
+                                                                                                             'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.generic_is_reachable': ( 'reach.html#generic_is_reachable',
                                                                                                                'git_commit_graph_ext/reachability.py'),
                                                    'git_commit_graph_ext.reachability.generic_is_reachable_bfs': ( 'reach.html#generic_is_reachable_bfs',
                                                                                                                    'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.generic_is_reachable_bidir': ( 'reach.html#generic_is_reachable_bidir',
+                                                                                                                     'git_commit_graph_ext/reachability.py'),
                                                    'git_commit_graph_ext.reachability.generic_is_reachable_dfs': ( 'reach.html#generic_is_reachable_dfs',
                                                                                                                    'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.generic_is_reachable_heap': ( 'reach.html#generic_is_reachable_heap',
+                                                                                                                    'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.landmark_is_reachable': ( 'reach.html#landmark_is_reachable',
+                                                                                                                'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.merge_bases': ( 'reach.html#merge_bases',
+                                                                                                      'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.preach_is_reachable': ( 'reach.html#preach_is_reachable',
+                                                                                                              'git_commit_graph_ext/reachability.py'),
                                                    'git_commit_graph_ext.reachability.reachable_negative_cut': ( 'reach.html#reachable_negative_cut',
                                                                                                                  'git_commit_graph_ext/reachability.py'),
                                                    'git_commit_graph_ext.reachability.reachable_positive_cut': ( 'reach.html#reachable_positive_cut',
                                                                                                                  'git_commit_graph_ext/reachability.py'),
+                                                   'git_commit_graph_ext.reachability.tips_contain': ( 'reach.html#tips_contain',
+                                                                                                       'git_commit_graph_ext/reachability.py'),
                                                    'git_commit_graph_ext.reachability.walk_spanning': ( 'reach.html#walk_spanning',
                                                                                                         'git_commit_graph_ext/reachability.py')},
             'git_commit_graph_ext.reachability_evaluation': {}}}
@@ -0,0 +1,63 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../09_git.ipynb.
+
+# %% auto 0
+__all__ = []
+
+# %% ../09_git.ipynb 72
+# helpers for tests: calling git commands with fixed identity and dates
+import os
+import subprocess
+
+
+def _git(repo_path, *args, date=None):
+    """Run git command in repository, with fixed identity and optionally given date
+
+    This is a helper function for creating test repositories with known
+    history, here and in tests of `commit_graph_file`; returns the output
+    of the command, stripped.
+    """
+    env = dict(os.environ,
+               GIT_AUTHOR_NAME='A U Thor', GIT_AUTHOR_EMAIL='author@example.com',
+               GIT_COMMITTER_NAME='C O Mitter', GIT_COMMITTER_EMAIL='committer@example.com')
+    if date is not None:
+        env['GIT_AUTHOR_DATE'] = env['GIT_COMMITTER_DATE'] = '{:d} +0000'.format(date)
+    return subprocess.run(['git', '-C', str(repo_path)] + list(args), env=env, check=True,
+                          stdout=subprocess.PIPE).stdout.decode('utf-8').strip()
+
+
+def _commit(repo_path, msg, date):
+    """Create empty commit with given message and date, see `_git()`"""
+    _git(repo_path, 'commit', '--quiet', '--allow-empty', '-m', msg, date=date)
+
+
+def _create_test_repo(repo_path):
+    """Create test repository with 10 commits on 4 branches
+
+        A---B---C-------F---G---O   (master)
+             \         /       /|
+              D-------E       / |   (topic)
+               \             /  |
+                H-----------'   |   (side)
+                                |
+        I-----------------------'   (other, unrelated history)
+    """
+    subprocess.run(['git', 'init', '--quiet', '--initial-branch=master', str(repo_path)], check=True)
+    _commit(repo_path, 'A', 1000000000)
+    _commit(repo_path, 'B', 1000000100)
+    _git(repo_path, 'checkout', '--quiet', '-b', 'topic')
+    _commit(repo_path, 'D', 1000000200)
+    _git(repo_path, 'checkout', '--quiet', '-b', 'side')
+    _commit(repo_path, 'H', 1000000250)
+    _git(repo_path, 'checkout', '--quiet', 'topic')
+    _commit(repo_path, 'E', 1000000300)
+    _git(repo_path, 'checkout', '--quiet', 'master')
+    _commit(repo_path, 'C', 1000000150)
+    _git(repo_path, 'merge', '--quiet', '--no-ff', '-m', 'F', 'topic', date=1000000400)
+    _commit(repo_path, 'G', 1000000500)
+    _git(repo_path, 'checkout', '--quiet', '--orphan', 'other')
+    _commit(repo_path, 'I', 1000000050)
+    _git(repo_path, 'checkout', '--quiet', 'master')
+    # octopus merge of unrelated histories needs plumbing commands
+    octopus = _git(repo_path, 'commit-tree', 'master^{tree}', '-m', 'O',
+                   '-p', 'master', '-p', 'side', '-p', 'other', date=1000000600)
+    _git(repo_path, 'update-ref', 'refs/heads/master', octopus)
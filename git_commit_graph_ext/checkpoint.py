@@ -2,20 +2,26 @@
 
 # %% auto 0
 __all__ = ['graph_to_dataframe', 'dataframe_to_graph', 'guess_format', 'save_df_to_file', 'save_graph_df', 'save_graph',
-           'load_df_from_file', 'load_graph_df', 'compute_reachability_labels', 'graph_data_to_dataframe',
-           'compute_cached_df', 'compute_cached_graph_df', 'compute_cached_reachability_labels_df',
-           'dataframe_to_reachability_labels', 'compute_cached_graph', 'compute_cached_reachability_labels']
+           'load_df_from_file', 'load_graph_df', 'compute_reachability_labels', 'full_relabel_worthwhile',
+           'update_reachability_labels', 'graph_data_to_dataframe', 'compute_cached_df', 'compute_cached_graph_df',
+           'compute_cached_reachability_labels_df', 'dataframe_to_reachability_labels', 'compute_cached_graph',
+           'compute_cached_reachability_labels', 'save_graph_bin', 'load_graph_bin']
 
 # %% ../10_checkpoint.ipynb 3
 # creating graphs in Python
 import networkx as nx
+from .csr_graph import CSRGraph
+# binary memory-mapped format for graphs
+import json
+import numpy as np
 # checking for existence of paths, and manipulating paths
 from pathlib import Path, PurePath
 # data analysis and manipulation
 import pandas as pd
 # reachability labels
-from .labelling.levels import find_levels
-from .labelling.dfs_intervals import find_dfs_intervals, find_dfs_intervals_extra
+from .labelling.levels import find_levels, update_levels
+from .labelling.dfs_intervals import (
+    find_dfs_intervals, find_dfs_intervals_extra, update_dfs_intervals_extra)
 
 # %% ../10_checkpoint.ipynb 9
 def _savefile_name(graph_name, out_dir='datasets', kind='df_edgelist', file_format='csv.gz'):
@@ -143,20 +149,125 @@ def compute_reachability_labels(graph, recompute=False):
         graph.lvl = find_levels(graph)
     if recompute or not hasattr(graph, 'mpi_ext'):
         graph.mpi_ext = find_dfs_intervals_extra(graph)
+        # no commits labelled incrementally yet, see update_reachability_labels()
+        graph.mpi_updated = 0
     return graph
 
-# %% ../10_checkpoint.ipynb 29
+# %% ../10_checkpoint.ipynb 30
+def _new_node_ids(graph, new_nodes):
+    """Nodes of new commits, given as nodes or as `(commit, parents)` tuples
+
+    Tuples are returned by `repo_update_graph()`; for CSRGraph commits
+    given by name are translated to node identifiers.
+    """
+    new_nodes = [node[0] if isinstance(node, tuple) else node for node in new_nodes]
+    if isinstance(graph, CSRGraph):
+        new_nodes = [node if isinstance(node, (int, np.integer)) else graph.node_id(node)
+                     for node in new_nodes]
+    return new_nodes
+
+
+def full_relabel_worthwhile(graph, new_nodes, max_ratio=0.05):
+    """Whether to recompute reachability labels from scratch after adding new commits
+
+    Parameters
+    ----------
+    graph : nx.DiGraph or CSRGraph
+        Graph with reachability labels stored as attributes (see
+        `compute_reachability_labels()`), with new commits already added.
+
+    new_nodes : iterable
+        Commits added to the graph, or `(commit, parents)` tuples returned
+        by `repo_update_graph()`; for CSRGraph they must be all commits
+        from the number of labelled nodes onwards, like those added with
+        `CSRGraph.add_commits()`, given by node identifier or by name.
+
+    max_ratio : float, optional (default=0.05)
+        Maximal number of commits labelled incrementally since the last
+        full labelling, including new commits, as a fraction of the number
+        of all commits.
+
+    Returns
+    -------
+    bool
+        True if labels were not computed yet, if they are not labels of
+        all old commits (for example if the whole history was rescanned),
+        if some old commit has a new commit as its parent (so that labels
+        of old commits would change), or if there would be more than
+        `max_ratio` commits labelled incrementally per commit.
+    """
+    if not hasattr(graph, 'lvl') or not hasattr(graph, 'mpi_ext'):
+        return True
+    new_nodes = _new_node_ids(graph, new_nodes)
+    n_old = len(graph.lvl)
+    if n_old + len(new_nodes) != graph.number_of_nodes():
+        return True
+    n_updated = getattr(graph, 'mpi_updated', 0) + len(new_nodes)
+    if n_updated > max_ratio * (n_old + len(new_nodes)):
+        return True
+
+    if isinstance(graph, CSRGraph):
+        old_parents = graph.parents[:graph.offsets[n_old]]
+        return bool(len(old_parents) > 0 and old_parents.max() >= n_old)
+    new_set = set(new_nodes)
+    return any(pred not in new_set
+               for node in new_nodes for pred in graph.predecessors(node))
+
+
+def update_reachability_labels(graph, new_nodes, full_relabel=None):
+    """Update reachability labels stored as attributes of graph after adding new commits
+
+    Parameters
+    ----------
+    graph : nx.DiGraph or CSRGraph
+        Graph with reachability labels stored as attributes (see
+        `compute_reachability_labels()`), with new commits already added.
+
+    new_nodes : iterable
+        Commits added to the graph, or `(commit, parents)` tuples returned
+        by `repo_update_graph()`; see `full_relabel_worthwhile()`.
+
+    full_relabel : bool or None, optional (default=None)
+        Whether to recompute labels from scratch; by default it is
+        decided with `full_relabel_worthwhile()`.
+
+    Returns
+    -------
+    nx.DiGraph or CSRGraph
+        The `graph`, with updated 'lvl', 'mpi_ext' and 'mpi_updated'
+        attributes.
+    """
+    new_nodes = _new_node_ids(graph, new_nodes)
+    if full_relabel is None:
+        full_relabel = full_relabel_worthwhile(graph, new_nodes)
+    if full_relabel:
+        return compute_reachability_labels(graph, recompute=True)
+
+    graph.lvl = update_levels(graph, graph.lvl, new_nodes)
+    graph.mpi_ext = update_dfs_intervals_extra(graph, graph.mpi_ext, new_nodes)
+    graph.mpi_updated = getattr(graph, 'mpi_updated', 0) + len(new_nodes)
+    return graph
+
+# %% ../10_checkpoint.ipynb 38
 def graph_data_to_dataframe(graph, append_to=None):
     compute_reachability_labels(graph)
 
-    # create the DataFrame and name its index
-    df = pd.DataFrame.from_dict(graph.mpi_ext, orient='index', columns=['f_min', 'min', 'post'])
-    df.index.name = 'node'
-    # add other reachability labels
-    df['level'] = pd.Series(graph.lvl)
-    # add and compute other data
-    df['in degree'] = pd.Series(dict(graph.in_degree()))
-    df['out degree'] = pd.Series(dict(graph.out_degree()))
+    if isinstance(graph, CSRGraph):
+        # labels are arrays indexed by node identifier
+        df = pd.DataFrame({name: graph.mpi_ext[name] for name in ['f_min', 'min', 'post']},
+                          index=pd.Index(graph.oid_names(), name='node'))
+        df['level'] = graph.lvl
+        df['in degree'] = graph.in_degree()
+        df['out degree'] = graph.out_degree()
+    else:
+        # create the DataFrame and name its index
+        df = pd.DataFrame.from_dict(graph.mpi_ext, orient='index', columns=['f_min', 'min', 'post'])
+        df.index.name = 'node'
+        # add other reachability labels
+        df['level'] = pd.Series(graph.lvl)
+        # add and compute other data
+        df['in degree'] = pd.Series(dict(graph.in_degree()))
+        df['out degree'] = pd.Series(dict(graph.out_degree()))
     df['degree'] = df['in degree'] + df['out degree']
 
     # append if needed
@@ -165,7 +276,7 @@ def graph_data_to_dataframe(graph, append_to=None):
 
     return df
 
-# %% ../10_checkpoint.ipynb 33
+# %% ../10_checkpoint.ipynb 44
 def compute_cached_df(code, filename, file_format=None, dont_save=False):
     """Compute `DataFrame`, or retrieve it from a given file if it exists
 
@@ -195,7 +306,7 @@ def compute_cached_df(code, filename, file_format=None, dont_save=False):
             save_df_to_file(df, filename, output_format=file_format)
         return df
 
-# %% ../10_checkpoint.ipynb 42
+# %% ../10_checkpoint.ipynb 53
 def compute_cached_graph_df(graph_generator, graph_name,
                             datasets_dir='datasets', file_format='csv.gz'):
     filename = _savefile_name(graph_name, out_dir=datasets_dir,
@@ -218,7 +329,7 @@ def compute_cached_reachability_labels_df(graph, graph_name=None, append_to=None
     # return computer or retrieved dataframe
     return compute_cached_df(lambda: graph_data_to_dataframe(graph, append_to=append_to), filename)
 
-# %% ../10_checkpoint.ipynb 46
+# %% ../10_checkpoint.ipynb 57
 def dataframe_to_reachability_labels(df, graph, recompute=False):
     #print('..dataframe_to_reachability_labels({}, {!r}, {})'.format(type(df), graph, recompute))
     if recompute or not hasattr(graph, 'lvl'):
@@ -229,7 +340,7 @@ def dataframe_to_reachability_labels(df, graph, recompute=False):
         graph.mpi_ext = df[['f_min', 'min', 'post']].to_dict(orient='index')
     return graph
 
-# %% ../10_checkpoint.ipynb 49
+# %% ../10_checkpoint.ipynb 60
 def compute_cached_graph(graph_generator, graph_name, datasets_dir='datasets', file_format='csv.gz'):
     filename = _savefile_name(graph_name, out_dir=datasets_dir,
                               kind='df_edgelist', file_format=file_format)
@@ -265,3 +376,167 @@ def compute_cached_reachability_labels(graph, graph_name=None, add_missing_nodes
         graph.add_nodes_from(set(graph.df_nodedata.index) - set(graph.nodes))
     
     return graph
+
+# %% ../10_checkpoint.ipynb 67
+_BIN_MAGIC = b'GCGXCSR\0'
+_BIN_VERSION = 1
+_BIN_ALIGN = 64
+
+
+def _dtype_to_json(dtype):
+    """Describe NumPy dtype (plain or structured) in a JSON-serializable way"""
+    if dtype.names is None:
+        return dtype.str
+    return [[name, dtype.fields[name][0].str] for name in dtype.names]
+
+
+def _dtype_from_json(descr):
+    """Recreate NumPy dtype from `_dtype_to_json()` description"""
+    if isinstance(descr, str):
+        return np.dtype(descr)
+    return np.dtype([(name, field_dtype) for name, field_dtype in descr])
+
+
+def _save_arrays_bin(filename, name, arrays):
+    """Write named arrays to a file in the binary format, each aligned to _BIN_ALIGN bytes
+
+    This is a helper function used, among others, in `save_graph_bin()`.
+    """
+    # lay out arrays, to compute offsets to put in the header; the header
+    # size depends on offsets, so leave room for 20 digits for each offset
+    table = {}
+    for array_name, values in arrays.items():
+        table[array_name] = {'dtype': _dtype_to_json(values.dtype),
+                             'shape': list(values.shape), 'offset': 0}
+    header = {'name': name, 'arrays': table}
+    header_size = len(json.dumps(header).encode('utf-8')) + 20 * len(table)
+    offset = -(-(len(_BIN_MAGIC) + 8 + header_size) // _BIN_ALIGN) * _BIN_ALIGN
+    for array_name, values in arrays.items():
+        table[array_name]['offset'] = offset
+        offset += -(-values.nbytes // _BIN_ALIGN) * _BIN_ALIGN
+    header_bytes = json.dumps(header).encode('utf-8')
+
+    with open(filename, 'wb') as f:
+        f.write(_BIN_MAGIC)
+        f.write(np.array([_BIN_VERSION, len(header_bytes)], dtype='<u4').tobytes())
+        f.write(header_bytes)
+        for array_name, values in arrays.items():
+            f.write(b'\0' * (table[array_name]['offset'] - f.tell()))
+            f.write(np.ascontiguousarray(values).tobytes())
+
+
+def _load_arrays_bin(filename, mmap=True):
+    """Read file written by `_save_arrays_bin()`, optionally memory-mapping it
+
+    Returns
+    -------
+    tuple (dict, dict of numpy.ndarray)
+        The header, with the name under 'name' key, and arrays keyed by name.
+    """
+    if mmap:
+        data = np.memmap(filename, dtype=np.uint8, mode='r')
+    else:
+        data = np.fromfile(filename, dtype=np.uint8)
+
+    start = len(_BIN_MAGIC)
+    if bytes(data[:start]) != _BIN_MAGIC:
+        raise ValueError("'{}' is not a file in the binary format (bad signature)".format(filename))
+    version, header_len = data[start:start + 8].view('<u4').tolist()
+    if version != _BIN_VERSION:
+        raise NotImplementedError("Graph file format version {:d} is not supported".format(version))
+    header = json.loads(bytes(data[start + 8:start + 8 + header_len]).decode('utf-8'))
+
+    arrays = {}
+    for name, info in header['arrays'].items():
+        dtype = _dtype_from_json(info['dtype'])
+        shape = tuple(info['shape'])
+        nbytes = dtype.itemsize * int(np.prod(shape))
+        offset = info['offset']
+        arrays[name] = data[offset:offset + nbytes].view(dtype).reshape(shape)
+
+    return header, arrays
+
+
+def save_graph_bin(graph, labels=None, graph_name=None, datasets_dir='datasets', overwrite=False):
+    """Save graph and its labels in the binary format, suitable for memory-mapping
+
+    Parameters
+    ----------
+    graph : CSRGraph or NetworkX DiGraph
+        Graph to save; DiGraph is converted to CSRGraph first.
+
+    labels : dict of numpy.ndarray or None, optional (default=None)
+        Reachability labels and other per-node data to store with the graph,
+        as arrays indexed by node identifier (e.g. results of `find_levels()`
+        or `find_dfs_intervals_extra()` for CSRGraph), keyed by label name.
+
+    graph_name : str or None, optional (default=None)
+        Name of the graph, used to create the name of the file.  If not set,
+        `graph.name` is used.
+
+    datasets_dir : str, optional (default='datasets')
+        Directory where to save the file.
+
+    overwrite : bool, optional (default=False)
+        Whether to overwrite the file if it already exists.
+
+    Returns
+    -------
+    Path
+        Path to the file storing graph and its labels.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
+    if graph_name is None:
+        if not graph.name:
+            raise RuntimeError("Neither 'graph_name' parameter given, nor 'graph' has 'name' attribute")
+        graph_name = graph.name
+    filename = _savefile_name(graph_name, out_dir=datasets_dir,
+                              kind='csr', file_format='bin')
+    if not overwrite and Path(filename).is_file():
+        return filename
+
+    arrays = {'offsets': graph.offsets, 'parents': graph.parents}
+    if graph.oids is not None:
+        arrays['oids'] = np.asarray(graph.oids, dtype='S')
+    for name, values in (labels or {}).items():
+        values = np.asarray(values)
+        if name in arrays:
+            raise ValueError("Label name '{}' is reserved".format(name))
+        if len(values) != graph.number_of_nodes():
+            raise ValueError("Label '{}' has {:d} entries, expected {:d}"
+                             .format(name, len(values), graph.number_of_nodes()))
+        arrays[name] = values
+
+    _save_arrays_bin(filename, graph_name, arrays)
+
+    return filename
+
+
+def load_graph_bin(graph_name, datasets_dir='datasets', mmap=True):
+    """Load graph and its labels saved with `save_graph_bin()`
+
+    Parameters
+    ----------
+    graph_name : str
+        Name of the graph, used to create the name of the file.
+
+    datasets_dir : str, optional (default='datasets')
+        Directory where the file is stored.
+
+    mmap : bool, optional (default=True)
+        Whether to memory-map the file read-only, so that arrays are
+        loaded lazily and pages are shared between processes; otherwise
+        the whole file is read into memory.
+
+    Returns
+    -------
+    tuple (CSRGraph, dict of numpy.ndarray)
+        The graph, and its labels keyed by label name.
+    """
+    filename = _savefile_name(graph_name, out_dir=datasets_dir,
+                              kind='csr', file_format='bin')
+    header, arrays = _load_arrays_bin(filename, mmap=mmap)
+    graph = CSRGraph(arrays.pop('offsets'), arrays.pop('parents'),
+                     oids=arrays.pop('oids', None), name=header['name'])
+    return graph, arrays
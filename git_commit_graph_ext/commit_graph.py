@@ -1,12 +1,19 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../09_git.ipynb.
 
 # %% auto 0
-__all__ = ['sparse_clone', 'get_repo', 'repo_generate_adjlist', 'repo_adjlist_to_graph', 'repo_to_graph', 'commit_graph']
+__all__ = ['sparse_clone', 'get_repo', 'repo_generate_adjlist', 'repo_adjlist_to_graph', 'repo_commit_dates',
+           'repo_to_graph', 'commit_graph', 'repo_to_arrays', 'repo_to_csr_graph', 'repo_update_adjlist',
+           'repo_update_graph', 'commit_graphs_pipeline']
 
 # %% ../09_git.ipynb 4
 # creating graphs in Python
 import networkx as nx
+# compact integer arrays for large graphs
+import numpy as np
+from array import array
+from .csr_graph import CSRGraph
 # calling git commands
+import os
 import subprocess
 # checking for existence of paths, and manipulating paths
 from pathlib import Path
@@ -215,8 +222,60 @@ def _repo_graph_savefile(repo_path, out_dir='datasets'):
     graph_name = _repo_graph_name(repo_path)
     return _savefile_name(graph_name, out_dir=out_dir, kind='adjlist', file_format='txt')
 
-# %% ../09_git.ipynb 54
-def repo_generate_adjlist(repo_path, out_dir="datasets", refresh=False):
+# %% ../09_git.ipynb 55
+def _repo_tips_savefile(repo_path, out_dir='datasets'):
+    """Create filename for storing scanned branch tips out of repository path
+
+    Examples:
+    ---------
+    >>>> _repo_tips_savefile('repos/hellogitworld.git')
+    Path('datasets/hellogitworld-commit_graph.tips.txt')
+    """
+    graph_name = _repo_graph_name(repo_path)
+    return _savefile_name(graph_name, out_dir=out_dir, kind='tips', file_format='txt')
+
+
+def _repo_dates_savefile(repo_path, out_dir='datasets'):
+    """Create filename for storing commit dates out of repository path
+
+    Examples:
+    ---------
+    >>>> _repo_dates_savefile('repos/hellogitworld.git')
+    Path('datasets/hellogitworld-commit_graph.dates.txt')
+    """
+    graph_name = _repo_graph_name(repo_path)
+    return _savefile_name(graph_name, out_dir=out_dir, kind='dates', file_format='txt')
+
+
+def _split_dates_lines(lines, adjlist_file, dates_file):
+    """Split `git log --format='%h %ct %p'` output into adjacency list and dates files"""
+    for fields in (line.split() for line in lines):
+        if not fields:
+            continue
+        commit, date, *parents = fields
+        adjlist_file.write(commit + ' ' + ' '.join(parents) + '\n')
+        dates_file.write(commit + ' ' + date + '\n')
+
+
+def _repo_branch_tips(repo_path):
+    """Return sorted list of full object identifiers of all branch tips"""
+    result = subprocess.run(['git', '-C', str(repo_path),
+                             'for-each-ref', '--format=%(objectname)', 'refs/heads/'],
+                            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    return sorted(set(result.stdout.split()))
+
+
+def _read_tips(tips_pathname):
+    with Path(tips_pathname).open() as infile:
+        return infile.read().split()
+
+
+def _write_tips(tips_pathname, tips):
+    with Path(tips_pathname).open("w") as outfile:
+        outfile.writelines(tip + '\n' for tip in tips)
+
+# %% ../09_git.ipynb 57
+def repo_generate_adjlist(repo_path, out_dir="datasets", refresh=False, dates=False):
     """Generate graph of revisions in the adjacency list format
 
     Can be read with `nx.read_adjlist()`; don't forget to ensure that
@@ -228,6 +287,16 @@ def repo_generate_adjlist(repo_path, out_dir="datasets", refresh=False):
     By default it does not recreate the file if it exists already,
     unless `refresh=True` argument is passed.
 
+    Branch tips used for the scan are saved alongside the adjacency list
+    (in the '*.tips.txt' file), so that later `repo_update_adjlist()` can
+    append only the commits added since.
+
+    With `dates=True` committer dates of commits are extracted in the same
+    `git log` run, and saved alongside the adjacency list (in the '*.dates.txt'
+    file, with lines consisting of commit and its date); they can be read
+    with `repo_commit_dates()`.  Regenerating the file without dates
+    removes the file with dates, as it would no longer match the graph.
+
     Format
     ------
     The adjacency list format consists of lines with node labels.  The first
@@ -256,6 +325,10 @@ def repo_generate_adjlist(repo_path, out_dir="datasets", refresh=False):
         Whether to regenerate the file with the commit graph in adjacency
         format if it exists.  Defaults to false.
 
+    dates : bool
+        Whether to also save commit dates (committer timestamps), needed
+        for corrected commit dates.  Defaults to false.
+
     Returns
     -------
     Path
@@ -263,15 +336,31 @@ def repo_generate_adjlist(repo_path, out_dir="datasets", refresh=False):
         can be found.
     """
     out_pathname = _repo_graph_savefile(repo_path, out_dir=out_dir)
+    dates_pathname = _repo_dates_savefile(repo_path, out_dir=out_dir)
     # generate the adjacency list using git-log command; note: skip pull requests
-    if refresh or not out_pathname.exists():
+    if refresh or not out_pathname.exists() or (dates and not dates_pathname.exists()):
+        # list commits reachable from the same branch tips that get recorded
+        tips = _repo_branch_tips(repo_path)
+        if not dates and dates_pathname.exists():
+            # stale dates would be appended to by `repo_update_adjlist()`
+            dates_pathname.unlink()
         with out_pathname.open("w") as outfile:
-            subprocess.run(['git', '-C', repo_path,
-                            'log', '--format=%h %p', '--topo-order', '--branches'],
-                           stdout=outfile)
+            if not dates:
+                subprocess.run(['git', '-C', repo_path,
+                                'log', '--format=%h %p', '--topo-order', '--stdin'],
+                               input='\n'.join(tips), stdout=outfile, universal_newlines=True)
+            else:
+                result = subprocess.run(['git', '-C', repo_path,
+                                         'log', '--format=%h %ct %p', '--topo-order', '--stdin'],
+                                        input='\n'.join(tips), stdout=subprocess.PIPE,
+                                        universal_newlines=True)
+                with dates_pathname.open("w") as datesfile:
+                    _split_dates_lines(result.stdout.splitlines(), outfile, datesfile)
+        # remember what was scanned, for `repo_update_adjlist()`
+        _write_tips(_repo_tips_savefile(repo_path, out_dir=out_dir), tips)
     return out_pathname
 
-# %% ../09_git.ipynb 56
+# %% ../09_git.ipynb 59
 def repo_adjlist_to_graph(repo_path, datasets_dir="datasets"):
     """Create `DiGraph` out of adjacency list file created from it
 
@@ -295,13 +384,39 @@ def repo_adjlist_to_graph(repo_path, datasets_dir="datasets"):
     out_pathname = _repo_graph_savefile(repo_path, out_dir=datasets_dir)
     return nx.read_adjlist(out_pathname, create_using=nx.DiGraph)
 
-# %% ../09_git.ipynb 58
-def repo_to_graph(repo_path, datasets_dir="datasets", refresh=False):
+# %% ../09_git.ipynb 61
+def repo_commit_dates(repo_path, datasets_dir="datasets"):
+    """Read commit dates saved by `repo_generate_adjlist(..., dates=True)`
+
+    Parameters
+    ----------
+    repo_path : str
+        Path to the Git repository
+
+    datasets_dir : str
+        Directory where extracted commit graph data is stored.
+        Defaults to "datasets".
+
+    Returns
+    -------
+    dict
+        Commit dates (committer timestamps, as seconds since epoch),
+        keyed by shortened object identifiers of commits, the same as
+        used as nodes in the graph of commits.
+    """
+    dates_pathname = _repo_dates_savefile(repo_path, out_dir=datasets_dir)
+    with dates_pathname.open() as infile:
+        return {commit: int(date)
+                for commit, date in (line.split() for line in infile)}
+
+# %% ../09_git.ipynb 63
+def repo_to_graph(repo_path, datasets_dir="datasets", refresh=False, update=False):
     """Create a graph of commits for given local repository
 
     It uses existing file with the commit graph in the adjacency list file
     format, unless refresh is requested with `refresh=True`.  Automatically
-    generates such file if it does not exist.
+    generates such file if it does not exist.  With `update=True` commits
+    added since the last scan are appended to the existing file first.
 
     Parameters
     ----------
@@ -316,18 +431,26 @@ def repo_to_graph(repo_path, datasets_dir="datasets", refresh=False):
         Whether to regenerate the file with the commit graph in adjacency
         format if it exists.  Defaults to false.
 
+    update : bool
+        Whether to append commits added since the last scan to the file
+        with the commit graph, see `repo_update_adjlist()`.  Ignored if
+        `refresh` is true.  Defaults to false.
+
     Returns
     -------
     nx.DiGraph
         Directed graph of revisions as NetworkX's `DiGraph`
     """
-    out_pathname = repo_generate_adjlist(repo_path, out_dir=datasets_dir, refresh=refresh)
+    if update and not refresh:
+        out_pathname, _ = repo_update_adjlist(repo_path, out_dir=datasets_dir)
+    else:
+        out_pathname = repo_generate_adjlist(repo_path, out_dir=datasets_dir, refresh=refresh)
     return nx.read_adjlist(out_pathname, create_using=nx.DiGraph)
 
 
 def commit_graph(url, repo_name,
                  repos_dir="repos", datasets_dir="datasets",
-                 reclone=False, rescan=False):
+                 reclone=False, rescan=False, update=False):
     """Create a graph of commits for given remote repository, stored locally
 
     Given a Git repository `url`, clone it as `repo_name` in `repo_dir`
@@ -336,7 +459,9 @@ def commit_graph(url, repo_name,
     Avoids re-cloning of the remote repository unless `reclone=True` is
     passed, and avoids rescanning the local copy of the repository if file
     in the adjacency list format with the commit graph information exists
-    unless `rescan=True` is passed.
+    unless `rescan=True` is passed.  With `update=True` only the commits
+    added since the last scan (for example by fetch) are scanned, and
+    appended to that file.
 
     Parameters
     ----------
@@ -364,6 +489,10 @@ def commit_graph(url, repo_name,
         Whether to regenerate the file with the commit graph in adjacency
         format if it exists.  Defaults to false.
 
+    update : bool
+        Whether to incrementally update the file with the commit graph
+        with commits added since the last scan.  Defaults to false.
+
     Returns
     -------
     nx.DiGraph
@@ -371,6 +500,443 @@ def commit_graph(url, repo_name,
     """
     repo_path = Path(repos_dir) / repo_name
     get_repo(url, repo_path, refresh=reclone)
-    graph = repo_to_graph(repo_path, datasets_dir=datasets_dir, refresh=rescan)
+    graph = repo_to_graph(repo_path, datasets_dir=datasets_dir, refresh=rescan, update=update)
     graph.name = _commit_graph_name(repo_name)
     return graph
+
+# %% ../09_git.ipynb 70
+def repo_to_arrays(repo_path, adjlist_path=None):
+    """Stream the commit graph of a repository into compact integer arrays
+
+    Runs `git log` over all branch tips (the same ones that are recorded by
+    `repo_generate_adjlist()`), and parses its output while it is
+    being generated, in a single pass, without writing the intermediate
+    file with the adjacency list, and without creating NetworkX graph.
+
+    Commits are listed in reverse topological order, so that all parents
+    of a commit are seen before the commit itself.  This means that node
+    identifiers are assigned in the topological order of parents before
+    children: for every edge (commit, parent) we have parent < commit.
+
+    The commit graph is returned in the compressed sparse row (CSR) format:
+    parents of the commit with integer identifier `i` are given by
+    `parents[offsets[i]:offsets[i+1]]`, and its shortened object identifier
+    (shortened SHA-1) is `oids[i]`.
+
+    Parameters
+    ----------
+    repo_path : str
+        Path to the Git repository
+
+    adjlist_path : str or Path or None, optional (default=None)
+        If set, save the commit graph also in the adjacency list format
+        to this file, like `repo_generate_adjlist()` does (though with
+        lines in the reverse order).  By default no file is written.
+
+    Returns
+    -------
+    tuple (oids, offsets, parents)
+        List of shortened object identifiers of commits (indexed by node
+        identifier), and two `numpy.ndarray` of int32 with CSR offsets
+        (of size `len(oids)+1`) and with parents of commits.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the `git log` command fails, for example if `repo_path` is not
+        a Git repository.
+    """
+    oids = []
+    index = {}
+    offsets = array('i', [0])
+    parents = array('i')
+
+    # list commits reachable from the same branch tips as `repo_generate_adjlist()`
+    tips = _repo_branch_tips(repo_path)
+    cmd = ['git', '-C', str(repo_path),
+           'log', '--format=%h %p', '--reverse', '--topo-order', '--stdin']
+    outfile = open(adjlist_path, 'w') if adjlist_path is not None else None
+    try:
+        with subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                              universal_newlines=True) as proc:
+            # git reads all of standard input before it starts the output
+            proc.stdin.write('\n'.join(tips))
+            proc.stdin.close()
+            for line in proc.stdout:
+                if outfile is not None:
+                    outfile.write(line)
+                commit, *commit_parents = line.split()
+
+                parent_ids = []
+                for parent in commit_parents:
+                    if parent not in index:
+                        # parent not in the listed history, for example at
+                        # the shallow clone boundary; add it as parentless
+                        index[parent] = len(oids)
+                        oids.append(parent)
+                        offsets.append(len(parents))
+                    parent_ids.append(index[parent])
+
+                index[commit] = len(oids)
+                oids.append(commit)
+                parents.extend(parent_ids)
+                offsets.append(len(parents))
+    finally:
+        if outfile is not None:
+            outfile.close()
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    return oids, np.array(offsets, dtype=np.int32), np.array(parents, dtype=np.int32)
+
+# %% ../09_git.ipynb 77
+def repo_to_csr_graph(repo_path, adjlist_path=None):
+    """Create compact `CSRGraph` of commits for given local repository
+
+    Parameters
+    ----------
+    repo_path : str
+        Path to the Git repository
+
+    adjlist_path : str or Path or None, optional (default=None)
+        If set, save the commit graph also in the adjacency list format
+        to this file; see `repo_to_arrays()`.
+
+    Returns
+    -------
+    CSRGraph
+        Graph of commits, with node identifiers in the topological order
+        (parents first), and shortened SHA-1 identifiers in `oids`.
+    """
+    oids, offsets, parents = repo_to_arrays(repo_path, adjlist_path=adjlist_path)
+    return CSRGraph(offsets, parents, oids=oids, name=_repo_graph_name(repo_path))
+
+# %% ../09_git.ipynb 81
+def _independent_tips(repo_path, tips):
+    """Reduce list of tips to those not reachable from other tips
+
+    Tips that no longer exist in the repository (e.g. after forced update
+    and garbage collection) are skipped.
+    """
+    result = subprocess.run(['git', '-C', str(repo_path), 'cat-file', '--batch-check'],
+                            input='\n'.join(tips) + '\n',
+                            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    existing = [line.split()[0] for line in result.stdout.splitlines()
+                if not line.endswith(' missing')]
+    if len(existing) <= 1:
+        return existing
+    result = subprocess.run(['git', '-C', str(repo_path), 'merge-base', '--independent'] + existing,
+                            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    return sorted(result.stdout.split())
+
+
+def _skip_date(fields):
+    """Remove the commit date from fields of `git log --format='%h %ct %p'` line"""
+    commit, *rest = fields
+    if not rest or not rest[0].isdigit():
+        raise ValueError("Missing commit date for commit {}".format(commit))
+    return [commit] + rest[1:]
+
+
+def _parse_adjlist_lines(lines, dates=False):
+    # skip empty lines
+    fields = (f for f in (line.split() for line in lines) if f)
+    if dates:
+        fields = (_skip_date(f) for f in fields)
+    return [(commit, parents)
+            for commit, *parents in fields]
+
+
+def _repo_update_adjlist(repo_path, out_dir="datasets"):
+    """Append new commits to the adjacency list file, see `repo_update_adjlist()`
+
+    Returns also whether the whole history was rescanned, in which case
+    the list of new commits consists of all commits.
+    """
+    out_pathname = _repo_graph_savefile(repo_path, out_dir=out_dir)
+    tips_pathname = _repo_tips_savefile(repo_path, out_dir=out_dir)
+    dates_pathname = _repo_dates_savefile(repo_path, out_dir=out_dir)
+    dates = dates_pathname.exists()
+    if not out_pathname.exists() or not tips_pathname.exists():
+        # nothing to update incrementally, all commits are new
+        return _repo_rescan_adjlist(repo_path, out_dir=out_dir, dates=dates)
+
+    old_tips = _read_tips(tips_pathname)
+    new_tips = _repo_branch_tips(repo_path)
+
+    new_commits = []
+    if not set(new_tips) <= set(old_tips):
+        cmd = ['git', '-C', str(repo_path), 'log',
+               '--format=%h %ct %p' if dates else '--format=%h %p', '--topo-order']
+        # keep the abbreviation length of object identifiers already stored
+        with out_pathname.open() as infile:
+            first_line = infile.readline().split()
+        if first_line:
+            cmd.append('--abbrev={:d}'.format(len(first_line[0])))
+        # old tips may be missing after forced update and garbage collection
+        cmd.extend(['--ignore-missing', '--stdin'])
+        revs = new_tips + ['^' + tip for tip in old_tips]
+        result = subprocess.run(cmd, input='\n'.join(revs) + '\n',
+                                stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        lines = result.stdout.splitlines()
+        new_commits = _parse_adjlist_lines(lines, dates=dates)
+        # git uses longer abbreviation for object identifiers whose prefix
+        # became ambiguous, and those would not match the ones already stored
+        if first_line and any(len(oid) != len(first_line[0])
+                              for commit, parents in new_commits for oid in [commit] + parents):
+            return _repo_rescan_adjlist(repo_path, out_dir=out_dir, dates=dates)
+        with out_pathname.open("a") as outfile:
+            if dates:
+                with dates_pathname.open("a") as datesfile:
+                    _split_dates_lines(lines, outfile, datesfile)
+            else:
+                outfile.write(result.stdout)
+
+    _write_tips(tips_pathname, _independent_tips(repo_path, old_tips + new_tips))
+    return out_pathname, new_commits, False
+
+
+def _repo_rescan_adjlist(repo_path, out_dir="datasets", dates=False):
+    """Scan the whole history, returning all commits as new, see `_repo_update_adjlist()`"""
+    out_pathname = repo_generate_adjlist(repo_path, out_dir=out_dir, refresh=True, dates=dates)
+    with out_pathname.open() as infile:
+        return out_pathname, _parse_adjlist_lines(infile), True
+
+
+def repo_update_adjlist(repo_path, out_dir="datasets"):
+    """Append commits added since the last scan to the adjacency list file
+
+    Lists only commits reachable from the current branch tips, but not
+    reachable from branch tips recorded at the last scan, and appends
+    them to the file with the commit graph in the adjacency list format;
+    everything already stored is left untouched.  If there is no file
+    with the commit graph, or no record of scanned tips, the whole history
+    is scanned with `repo_generate_adjlist()`.
+
+    The shortened object identifiers of new commits use the same
+    abbreviation length as is used in the existing file.  If git needs
+    longer abbreviations to keep them unique, the whole history is
+    rescanned instead, and all commits are returned.  If commit dates
+    were saved (see `repo_generate_adjlist()`), dates of new commits are
+    appended to the file with dates.
+
+    Parameters
+    ----------
+    repo_path : str
+        Path to the Git repository
+
+    out_dir : str
+        Directory where extracted commit graph data is stored.
+        Defaults to "datasets".
+
+    Returns
+    -------
+    tuple (Path, list)
+        Path where the commit graph in the adjacency file format can be
+        found, and list of newly added commits as `(commit, parents)`
+        tuples, children before parents.
+    """
+    out_pathname, new_commits, _ = _repo_update_adjlist(repo_path, out_dir=out_dir)
+    return out_pathname, new_commits
+
+
+def repo_update_graph(graph, repo_path, datasets_dir="datasets"):
+    """Add commits created since the last scan to the graph of commits
+
+    Updates the file with the commit graph in the adjacency list format
+    with `repo_update_adjlist()`, and adds new commits and their edges
+    to the `graph` in place.  If the whole history had to be rescanned,
+    the graph is rebuilt in place from scratch.  New commits are added to
+    `CSRGraph` with `CSRGraph.add_commits()`, so that they get node
+    identifiers after all old commits.
+
+    Parameters
+    ----------
+    graph : nx.DiGraph or CSRGraph
+        Directed graph of revisions, e.g. result of `repo_to_graph()`
+        or of `repo_to_csr_graph()`
+
+    repo_path : str
+        Path to the local Git repository
+
+    datasets_dir : str
+        Directory where extracted commit graph data is stored.
+        Defaults to "datasets".
+
+    Returns
+    -------
+    list
+        List of newly added commits as `(commit, parents)` tuples,
+        or of all commits if the whole history was rescanned.
+    """
+    _, new_commits, rescanned = _repo_update_adjlist(repo_path, out_dir=datasets_dir)
+    if rescanned:
+        # stored commits may be named differently after the full rescan
+        graph.clear()
+    if isinstance(graph, CSRGraph):
+        graph.add_commits(new_commits)
+        return new_commits
+    for commit, parents in new_commits:
+        graph.add_node(commit)
+        graph.add_edges_from((commit, parent) for parent in parents)
+    return new_commits
+
+# %% ../09_git.ipynb 88
+# running stages of the pipeline concurrently, and measuring their time
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import pandas as pd
+from .checkpoint import save_graph_bin, load_graph_bin, save_df_to_file
+from .labelling.levels import find_levels
+from .labelling.dfs_intervals import find_dfs_intervals_extra
+
+# %% ../09_git.ipynb 89
+def _clone_and_scan(url, repo_path, datasets_dir="datasets", reclone=False):
+    """Clone repository if needed, and save its commit graph with `save_graph_bin()`
+
+    Returns the name of the graph, its number of nodes, and the time
+    taken by each stage (in seconds) as a dict.
+    """
+    times = {}
+    start = time.perf_counter()
+    get_repo(url, repo_path, refresh=reclone)
+    times['clone'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph = repo_to_csr_graph(repo_path)
+    times['scan'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    save_graph_bin(graph, datasets_dir=datasets_dir, overwrite=True)
+    times['save graph'] = time.perf_counter() - start
+
+    return graph.name, graph.number_of_nodes(), times
+
+
+def _label_graph_bin(graph_name, datasets_dir="datasets"):
+    """Compute reachability labels of graph saved with `save_graph_bin()`, and save them with it
+
+    This is run in worker process; returns the time taken by each stage
+    (in seconds) as a dict.
+    """
+    times = {}
+    start = time.perf_counter()
+    # read into memory, as the file is overwritten afterwards
+    graph, _ = load_graph_bin(graph_name, datasets_dir=datasets_dir, mmap=False)
+    times['load graph'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels = {'lvl': find_levels(graph), 'mpi_ext': find_dfs_intervals_extra(graph)}
+    times['label'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    save_graph_bin(graph, labels=labels, graph_name=graph_name,
+                   datasets_dir=datasets_dir, overwrite=True)
+    times['save labels'] = time.perf_counter() - start
+
+    return times
+
+
+def _error_message(err):
+    """Describe exception raised in a stage of `commit_graphs_pipeline()`"""
+    return '{}: {}'.format(type(err).__name__, err)
+
+
+def commit_graphs_pipeline(repos, repos_dir="repos", datasets_dir="datasets",
+                           max_clones=4, max_labellers=None, reclone=False,
+                           timings_path=None):
+    """Clone, scan, and label commit graphs of many repositories concurrently
+
+    Cloning and scanning of repositories (see `get_repo()` and
+    `repo_to_csr_graph()`) runs in a pool of at most `max_clones` threads.
+    Each scanned commit graph is saved with `save_graph_bin()`, and is then
+    labelled with levels and extended DFS intervals (see `find_levels()`
+    and `find_dfs_intervals_extra()`) in a pool of `max_labellers` worker
+    processes, while other repositories are still being cloned and scanned.
+    The labels are saved in the same file as the graph, and can be loaded
+    with `load_graph_bin()`.
+
+    Parameters
+    ----------
+    repos : iterable of (str, str)
+        Repositories to process, as `(url, repo_name)` pairs, where `url`
+        is the repository to be cloned, and `repo_name` is the name of its
+        local clone (see `commit_graph()`).
+
+    repos_dir : str
+        The directory where to put cloned repositories into.
+        By default "repos" is used.
+
+    datasets_dir : str
+        Directory where the commit graphs and their labels are stored.
+        Defaults to "datasets".
+
+    max_clones : int, optional (default=4)
+        Maximum number of repositories cloned and scanned at the same time.
+
+    max_labellers : int or None, optional (default=None)
+        Number of worker processes computing labels; if None, it is
+        the number of processors on the machine.
+
+    reclone : bool
+        Whether to re-clone the repository if the local clone exists.
+        Default is false, to not perform a clone if not needed.
+
+    timings_path : str or Path or None, optional (default=None)
+        If set, save the per-stage timings also to this CSV file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Time in seconds spent in each stage of the pipeline, one row per
+        repository, in the order of `repos`, together with the name of the
+        graph and the number of its nodes.  If processing of a repository
+        failed, the 'error' column holds the description of the exception
+        (it is None, that is a missing value, for repositories processed
+        successfully), and the times of stages that did not
+        finish are NaN.  The wall-clock time of the whole run is stored in the
+        `wall_time` entry of its `attrs`.
+    """
+    repos = list(repos)
+    if max_labellers is None:
+        max_labellers = os.cpu_count() or 1
+    if max_clones < 1 or max_labellers < 1:
+        raise ValueError("Number of workers must be positive")
+
+    records = {}
+    wall_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_labellers) as labellers:
+        # start worker processes before any thread runs `git`, so that
+        # forked workers do not inherit pipes of `git` subprocesses
+        labellers.submit(os.getpid).result()
+        with ThreadPoolExecutor(max_workers=max_clones) as scanners:
+            scans = {scanners.submit(_clone_and_scan, url, Path(repos_dir) / repo_name,
+                                     datasets_dir=datasets_dir, reclone=reclone): repo_name
+                     for url, repo_name in repos}
+            labelling = {}
+            for future in as_completed(scans):
+                repo_name = scans[future]
+                # failure of one repository should not stop processing the others
+                try:
+                    graph_name, nodes, times = future.result()
+                except Exception as err:
+                    records[repo_name] = {'repo': repo_name, 'error': _error_message(err)}
+                    continue
+                records[repo_name] = {'repo': repo_name, 'graph': graph_name, 'nodes': nodes,
+                                      **times, 'error': None}
+                labelling[labellers.submit(_label_graph_bin, graph_name,
+                                           datasets_dir=datasets_dir)] = repo_name
+            for future in as_completed(labelling):
+                record = records[labelling[future]]
+                try:
+                    record.update(future.result())
+                except Exception as err:
+                    record['error'] = _error_message(err)
+
+    timings = pd.DataFrame([records[repo_name] for _, repo_name in repos
+                            if repo_name in records])
+    timings.attrs['wall_time'] = time.perf_counter() - wall_start
+    if timings_path is not None:
+        save_df_to_file(timings, timings_path, output_format=None)
+    return timings
@@ -0,0 +1,371 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../09a_commit_graph_file.ipynb.
+
+# %% auto 0
+__all__ = ['read_commit_graph_file', 'read_commit_graph', 'commit_graph_oids', 'write_commit_graph_labels',
+           'read_commit_graph_labels']
+
+# %% ../09a_commit_graph_file.ipynb 4
+# numerical arrays, and memory-mapping files
+import numpy as np
+# checksums of written files
+import hashlib
+# checking for existence of paths, and manipulating paths
+from pathlib import Path
+
+# %% ../09a_commit_graph_file.ipynb 7
+_SIGNATURE = b'CGPH'
+_HASH_LEN = {1: 20, 2: 32}  # SHA-1, SHA-256
+_PARENT_NONE = 0x70000000
+_HIGH_BIT = 0x80000000      # octopus merge, last extra edge, or overflow
+_POSITION_MASK = 0x7FFFFFFF
+
+
+def _read_chunk_table(data, num_chunks, start=8):
+    """Read table of contents of chunk-based file
+
+    Parameters
+    ----------
+    data : numpy.ndarray of uint8
+        Contents of the file, for example as `numpy.memmap`
+
+    num_chunks : int
+        Number of chunks, as stored in the file header.
+
+    start : int, optional (default=8)
+        Where the table of contents begins, i.e. the size of the header.
+
+    Returns
+    -------
+    dict
+        Dictionary where keys are chunk identifiers (as str), and values
+        are `(offset, end)` tuples.
+    """
+    toc = data[start:start + 12 * (num_chunks + 1)].view(
+        np.dtype([('id', 'S4'), ('offset', '>u8')]))
+    return {chunk_id.decode('ascii'): (int(offset), int(end))
+            for (chunk_id, offset), (_, end) in zip(toc[:-1], toc[1:])}
+
+# %% ../09a_commit_graph_file.ipynb 8
+def read_commit_graph_file(path):
+    """Read Git's commit-graph file into graph arrays, using memory mapping
+
+    Commits are identified by their graph position, that is position in
+    the sorted list of object identifiers of commits (in the whole chain
+    of files for split commit-graph).
+
+    The commit graph is returned in the compressed sparse row (CSR) format,
+    like in `commit_graph.repo_to_arrays()`: parents of the commit with
+    position `i` are `parents[offsets[i]:offsets[i+1]]`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the commit-graph file, for example
+        '.git/objects/info/commit-graph'.
+
+    Returns
+    -------
+    dict
+        Dictionary with the following keys:
+         * 'oids' - (N, hash length) array of uint8, with binary object
+           identifiers of commits (a view into the memory-mapped file)
+         * 'offsets', 'parents' - int32 arrays, commit graph in CSR format
+         * 'level' - int32 array with topological levels; note that here
+           root commits have level 0, like in `find_levels()`, while Git
+           generation numbers start at 1
+         * 'date' - int64 array with commit dates (committer timestamps)
+         * 'corrected_date' - int64 array with corrected commit dates
+           (generation number v2), only if the GDA2 chunk is present
+         * 'base' - list of hexadecimal identifiers of base commit-graph
+           files (empty if this is not a part of split commit-graph)
+
+    Raises
+    ------
+    ValueError
+        If the file is not a commit-graph file.
+
+    NotImplementedError
+        If version of the file format, or the hash version, is not supported.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    if data[:4].tobytes() != _SIGNATURE:
+        raise ValueError("'{}' is not a commit-graph file (bad signature)".format(path))
+    version, hash_version, num_chunks, num_bases = (int(byte) for byte in data[4:8])
+    if version != 1:
+        raise NotImplementedError("commit-graph version {} is not supported".format(version))
+    if hash_version not in _HASH_LEN:
+        raise NotImplementedError("commit-graph hash version {} is not supported".format(hash_version))
+    hash_len = _HASH_LEN[hash_version]
+    chunks = _read_chunk_table(data, num_chunks)
+
+    def chunk(chunk_id, dtype):
+        offset, end = chunks[chunk_id]
+        return data[offset:end].view(dtype)
+
+    num_commits = int(chunk('OIDF', '>u4')[-1])
+    oids = chunk('OIDL', np.uint8).reshape(num_commits, hash_len)
+    cdat = chunk('CDAT', np.dtype([('tree', 'V{:d}'.format(hash_len)),
+                                   ('parent1', '>u4'), ('parent2', '>u4'),
+                                   ('level_date', '>u4'), ('date', '>u4')]))
+
+    # parents, in the CSR format
+    parent1 = cdat['parent1'].astype(np.int64)
+    parent2 = cdat['parent2'].astype(np.int64)
+    has_parent1 = parent1 != _PARENT_NONE
+    is_octopus = (parent2 & _HIGH_BIT) != 0
+    has_parent2 = (parent2 != _PARENT_NONE) & ~is_octopus
+    counts = has_parent1.astype(np.int64) + has_parent2
+
+    # third and further parents of octopus merges, from the EDGE chunk
+    extra_parents = {}
+    if is_octopus.any():
+        edges = chunk('EDGE', '>u4')
+        for i in np.flatnonzero(is_octopus):
+            pos = int(parent2[i]) & _POSITION_MASK
+            rest = []
+            while True:
+                edge = int(edges[pos])
+                rest.append(edge & _POSITION_MASK)
+                pos += 1
+                if edge & _HIGH_BIT:
+                    break
+            extra_parents[i] = rest
+            counts[i] += len(rest)
+
+    offsets = np.zeros(num_commits + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum(counts)
+    parents = np.empty(offsets[-1], dtype=np.int32)
+    parents[offsets[:-1][has_parent1]] = parent1[has_parent1]
+    parents[offsets[:-1][has_parent2] + 1] = parent2[has_parent2]
+    for i, rest in extra_parents.items():
+        start = offsets[i] + 1
+        parents[start:start + len(rest)] = rest
+
+    # topological level uses top 30 bits, commit date remaining 34 bits
+    level_date = cdat['level_date'].astype(np.int64)
+    result = {
+        'oids': oids,
+        'offsets': offsets,
+        'parents': parents,
+        'level': (level_date >> 2).astype(np.int32) - 1,
+        'date': ((level_date & 0x3) << 32) | cdat['date'].astype(np.int64),
+        'base': [],
+    }
+
+    # corrected commit date offsets (generation number v2)
+    if 'GDA2' in chunks:
+        date_offset = chunk('GDA2', '>u4').astype(np.int64)
+        overflow = (date_offset & _HIGH_BIT) != 0
+        if overflow.any():
+            overflow_offsets = chunk('GDO2', '>u8').astype(np.int64)
+            date_offset[overflow] = overflow_offsets[date_offset[overflow] & _POSITION_MASK]
+        result['corrected_date'] = result['date'] + date_offset
+
+    if num_bases > 0:
+        base = chunk('BASE', np.uint8).reshape(num_bases, hash_len)
+        result['base'] = [oid.tobytes().hex() for oid in base]
+
+    return result
+
+# %% ../09a_commit_graph_file.ipynb 11
+def _objects_info_dir(repo_path):
+    """Find 'objects/info' directory of bare or non-bare Git repository"""
+    repo_path = Path(repo_path)
+    if (repo_path / '.git').is_dir():
+        repo_path = repo_path / '.git'
+    return repo_path / 'objects' / 'info'
+
+
+def _concat_commit_graph_layers(layers):
+    """Join data from files of split commit-graph chain, base first"""
+    if len(layers) == 1:
+        return layers[0]
+
+    num_edges = np.cumsum([0] + [len(layer['parents']) for layer in layers])
+    result = {
+        'oids': np.concatenate([layer['oids'] for layer in layers]),
+        'offsets': np.concatenate([layers[0]['offsets'][:1]] +
+                                  [layer['offsets'][1:] + shift
+                                   for layer, shift in zip(layers, num_edges)]),
+        'parents': np.concatenate([layer['parents'] for layer in layers]),
+        'level': np.concatenate([layer['level'] for layer in layers]),
+        'date': np.concatenate([layer['date'] for layer in layers]),
+        'base': [],
+    }
+    # Git uses corrected commit dates only if all layers have them
+    if all('corrected_date' in layer for layer in layers):
+        result['corrected_date'] = np.concatenate([layer['corrected_date'] for layer in layers])
+    return result
+
+
+def read_commit_graph(repo_path):
+    """Read commit-graph of a Git repository into graph arrays
+
+    Reads either single 'objects/info/commit-graph' file, or the chain of
+    split commit-graph files, using `read_commit_graph_file()`.  The result
+    has the same format as the result of that function.
+
+    NOTE: only commits stored in the commit-graph are included; commits
+    created after the last `git commit-graph write` (or `git gc`, or `git
+    fetch` with `fetch.writeCommitGraph`) are not present.
+
+    Parameters
+    ----------
+    repo_path : str or Path
+        Path to the Git repository (bare, or with working directory)
+
+    Returns
+    -------
+    dict
+        Dictionary with commit graph arrays, see `read_commit_graph_file()`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the repository does not have commit-graph.
+    """
+    info_dir = _objects_info_dir(repo_path)
+    single_file = info_dir / 'commit-graph'
+    chain_file = info_dir / 'commit-graphs' / 'commit-graph-chain'
+    if single_file.is_file():
+        return read_commit_graph_file(single_file)
+    if not chain_file.is_file():
+        raise FileNotFoundError("repository '{}' has no commit-graph".format(repo_path))
+
+    layers = []
+    for graph_hash in chain_file.read_text().split():
+        layer = read_commit_graph_file(info_dir / 'commit-graphs' / 'graph-{}.graph'.format(graph_hash))
+        if len(layer['base']) != len(layers):
+            raise ValueError("commit-graph chain '{}' is inconsistent".format(chain_file))
+        layers.append(layer)
+    return _concat_commit_graph_layers(layers)
+
+
+def commit_graph_oids(graph_data):
+    """List hexadecimal object identifiers of commits, in graph position order"""
+    oids = graph_data['oids']
+    width = 2 * oids.shape[1]
+    hex_oids = oids.tobytes().hex()
+    return [hex_oids[i:i + width] for i in range(0, len(hex_oids), width)]
+
+# %% ../09a_commit_graph_file.ipynb 23
+_LABELS_SIGNATURE = b'CGLB'
+# name of label: (chunk identifier, data type of row)
+_LABEL_CHUNKS = {
+    'level': ('GLVL', np.dtype('>u4')),
+    'min_post': ('MPST', np.dtype(('>u4', 2))),
+    'f_min': ('FMIN', np.dtype('>u4')),
+}
+
+
+def write_commit_graph_labels(path, labels, hash_version=1):
+    """Write reachability labels in commit-graph order, as chunks of chunk-based file
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the file to write.
+
+    labels : dict
+        Dictionary where keys are names of known labels ('level', 'min_post',
+        'f_min'), or 4-character chunk identifiers for other labels, and
+        values are arrays of labels in commit-graph order, with one row
+        per commit.  Arrays for known labels are converted to their data
+        type, other arrays are written with their data type, in network
+        byte order.
+
+    hash_version : int, optional (default=1)
+        Hash version, as in the commit-graph file: 1 for SHA-1, 2 for SHA-256;
+        it selects the hash function used for the trailing checksum.
+
+    Returns
+    -------
+    dict
+        Dictionary where keys are chunk identifiers, and values are sizes
+        of chunks in bytes.
+
+    Raises
+    ------
+    ValueError
+        If the chunk identifier is not 4 characters long, or if arrays
+        have different number of rows.
+    """
+    if hash_version not in _HASH_LEN:
+        raise NotImplementedError("commit-graph hash version {} is not supported".format(hash_version))
+
+    chunks = []
+    for name, values in labels.items():
+        chunk_id, dtype = _LABEL_CHUNKS.get(name, (name, None))
+        if len(chunk_id.encode('ascii')) != 4:
+            raise ValueError("chunk identifier {!r} is not 4 characters long".format(chunk_id))
+        values = np.asarray(values)
+        if dtype is None:
+            values = values.astype(values.dtype.newbyteorder('>'))
+        else:
+            values = values.astype(dtype.base).reshape((len(values),) + dtype.shape)
+        chunks.append((chunk_id, values))
+    if len({len(values) for _, values in chunks}) > 1:
+        raise ValueError("labels have different number of rows: {}".format(
+            {chunk_id: len(values) for chunk_id, values in chunks}))
+
+    header = _LABELS_SIGNATURE + bytes([1, hash_version, len(chunks), 0])
+    toc = np.zeros(len(chunks) + 1, dtype=np.dtype([('id', 'S4'), ('offset', '>u8')]))
+    offset = len(header) + toc.nbytes
+    for entry, (chunk_id, values) in zip(toc, chunks):
+        entry['id'], entry['offset'] = chunk_id.encode('ascii'), offset
+        offset += values.nbytes
+    toc[-1]['offset'] = offset
+
+    checksum = hashlib.sha1() if hash_version == 1 else hashlib.sha256()
+    with open(path, 'wb') as outfile:
+        for data in [header, toc.tobytes()] + [values.tobytes() for _, values in chunks]:
+            checksum.update(data)
+            outfile.write(data)
+        outfile.write(checksum.digest())
+
+    return {chunk_id: values.nbytes for chunk_id, values in chunks}
+
+
+def read_commit_graph_labels(path, dtypes=None):
+    """Read reachability labels written by `write_commit_graph_labels()`, using memory mapping
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the file with labels.
+
+    dtypes : dict or None, optional (default=None)
+        Data types of rows of other than known labels, with chunk identifiers
+        as keys (in network byte order, whatever byte order is given); chunks
+        of unknown type are returned as arrays of bytes.
+
+    Returns
+    -------
+    dict
+        Dictionary where keys are names of known labels, or chunk identifiers
+        for other labels, and values are arrays of labels (views into the
+        memory-mapped file, in network byte order).
+
+    Raises
+    ------
+    ValueError
+        If the file is not a file with commit-graph labels.
+
+    NotImplementedError
+        If version of the file format is not supported.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    if data[:4].tobytes() != _LABELS_SIGNATURE:
+        raise ValueError("'{}' is not a commit-graph labels file (bad signature)".format(path))
+    version, _, num_chunks, _ = (int(byte) for byte in data[4:8])
+    if version != 1:
+        raise NotImplementedError("commit-graph labels version {} is not supported".format(version))
+
+    names = {chunk_id: (name, dtype) for name, (chunk_id, dtype) in _LABEL_CHUNKS.items()}
+    for chunk_id, dtype in (dtypes or {}).items():
+        names[chunk_id] = (chunk_id, np.dtype(dtype).newbyteorder('>'))
+    labels = {}
+    for chunk_id, (offset, end) in _read_chunk_table(data, num_chunks).items():
+        name, dtype = names.get(chunk_id, (chunk_id, np.dtype(np.uint8)))
+        labels[name] = data[offset:end].view(dtype.base).reshape((-1,) + dtype.shape)
+    return labels
@@ -0,0 +1,317 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../01a_csr_graph.ipynb.
+
+# %% auto 0
+__all__ = ['CSRGraph']
+
+# %% ../01a_csr_graph.ipynb 4
+# conversion to and from NetworkX graphs
+import networkx as nx
+# compact integer arrays
+import numpy as np
+
+# %% ../01a_csr_graph.ipynb 7
+class CSRGraph:
+    """Directed graph of commits stored in compact integer arrays (CSR format)
+
+    Nodes are consecutive integers from 0 to `number_of_nodes()-1`, and
+    successors (parents of commit) of node `u` are given by
+    `parents[offsets[u]:offsets[u+1]]`.  Optionally object identifiers
+    of commits can be given in `oids`, for translating between node
+    identifiers and commit names, and for converting to NetworkX graph.
+
+    Implements subset of NetworkX `DiGraph` interface needed by labelling
+    and reachability functions from this project.
+
+    Parameters
+    ----------
+    offsets : array-like of ints
+        Offsets into `parents` array, of size `number_of_nodes()+1`.
+
+    parents : array-like of ints
+        Concatenated lists of successors (parents) of all nodes.
+
+    oids : list of str or NumPy array of bytes, optional (default=None)
+        Names of nodes (e.g. shortened SHA-1 identifiers of commits);
+        fixed-width bytes array can be memory-mapped from a file.
+
+    name : str, optional (default=None)
+        Name of the graph, like `DiGraph.name`.
+    """
+
+    def __init__(self, offsets, parents, oids=None, name=None):
+        self.offsets = np.asarray(offsets, dtype=np.int32)
+        self.parents = np.asarray(parents, dtype=np.int32)
+        self.oids = oids
+        self.name = '' if name is None else name
+        # reverse edges (children), and name to node lookup, on demand
+        self._child_offsets = None
+        self._children = None
+        self._node_ids = None
+
+    def __repr__(self):
+        return '<CSRGraph {!r} with {:d} nodes and {:d} edges>'.format(
+            self.name, self.number_of_nodes(), self.number_of_edges())
+
+    # NetworkX-like interface
+    def is_directed(self):
+        return True
+
+    def number_of_nodes(self):
+        return len(self.offsets) - 1
+
+    def number_of_edges(self):
+        return len(self.parents)
+
+    def __len__(self):
+        return self.number_of_nodes()
+
+    def __iter__(self):
+        return iter(range(self.number_of_nodes()))
+
+    def __contains__(self, node):
+        return isinstance(node, (int, np.integer)) and 0 <= node < self.number_of_nodes()
+
+    @property
+    def nodes(self):
+        return range(self.number_of_nodes())
+
+    def successors(self, u):
+        """Return successors (parents of commit) of node `u` as an array"""
+        return self.parents[self.offsets[u]:self.offsets[u + 1]]
+
+    def predecessors(self, u):
+        """Return predecessors (children of commit) of node `u` as an array"""
+        child_offsets, children = self.reverse_arrays()
+        return children[child_offsets[u]:child_offsets[u + 1]]
+
+    def out_degree(self, u=None):
+        """Number of successors of node `u`, or array of them for all nodes"""
+        if u is None:
+            return np.diff(self.offsets)
+        return int(self.offsets[u + 1] - self.offsets[u])
+
+    def in_degree(self, u=None):
+        """Number of predecessors of node `u`, or array of them for all nodes"""
+        child_offsets, _ = self.reverse_arrays()
+        if u is None:
+            return np.diff(child_offsets)
+        return int(child_offsets[u + 1] - child_offsets[u])
+
+    def reverse_arrays(self):
+        """Return reverse edges (children of commits) in the CSR format
+
+        Computed on first use, and cached.
+
+        Returns
+        -------
+        tuple (child_offsets, children)
+            Predecessors of node `u` are `children[child_offsets[u]:child_offsets[u+1]]`
+        """
+        if self._children is None:
+            n = self.number_of_nodes()
+            counts = np.bincount(self.parents, minlength=n)
+            child_offsets = np.zeros(n + 1, dtype=np.int32)
+            child_offsets[1:] = np.cumsum(counts)
+            sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(self.offsets))
+            # stable sort keeps children of each node in node order
+            self._children = sources[np.argsort(self.parents, kind='stable')]
+            self._child_offsets = child_offsets
+        return self._child_offsets, self._children
+
+    def oid_names(self):
+        """Return names of nodes as list of str (or range, if there are no names)"""
+        if self.oids is None:
+            return range(self.number_of_nodes())
+        if isinstance(self.oids, np.ndarray):
+            return self.oids.astype(str).tolist()
+        return self.oids
+
+    def node_id(self, oid):
+        """Return integer node identifier for given object identifier"""
+        if self._node_ids is None:
+            self._node_ids = {name: i for i, name in enumerate(self.oid_names())}
+        return self._node_ids[oid]
+
+    # adding commits, like NetworkX `DiGraph.add_edges_from()`
+    def add_commits(self, commits):
+        """Add new commits, with edges to their parents, in place
+
+        New commits get consecutive node identifiers from `number_of_nodes()`
+        onwards, parents before children, so that labels of old nodes stay
+        valid and can be extended with `update_levels()` and
+        `update_dfs_intervals_extra()`.
+
+        Parameters
+        ----------
+        commits : list of tuples (commit, parents)
+            New commits and lists of their parents, named like in `oids`,
+            children before parents, for example as returned by
+            `commit_graph.repo_update_adjlist()`.  Parents can be old
+            commits, or new commits that come later in the list.
+
+        Returns
+        -------
+        list of int
+            Node identifiers of new commits, in the order of `commits`.
+
+        Raises
+        ------
+        ValueError
+            If graph has no node names, or if some parent is not in graph.
+        """
+        if self.oids is None:
+            raise ValueError("cannot add commits to CSRGraph without node names")
+        n = self.number_of_nodes()
+        new_ids = {}
+        offsets = []
+        parents = []
+        for commit, commit_parents in reversed(commits):
+            for parent in commit_parents:
+                if parent in new_ids:
+                    parents.append(new_ids[parent])
+                    continue
+                try:
+                    parents.append(self.node_id(parent))
+                except KeyError:
+                    raise ValueError("parent {} of commit {} is not in graph".format(parent, commit)) from None
+            new_ids[commit] = n + len(new_ids)
+            offsets.append(len(parents))
+
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.array(offsets, dtype=np.int32)])
+        self.parents = np.concatenate([self.parents, np.array(parents, dtype=np.int32)])
+        if isinstance(self.oids, np.ndarray):
+            self.oids = np.concatenate([self.oids, np.array(list(new_ids), dtype='S')])
+        else:
+            self.oids = list(self.oids) + list(new_ids)
+        if self._node_ids is not None:
+            self._node_ids.update(new_ids)
+        # reverse edges have to be recomputed
+        self._child_offsets = None
+        self._children = None
+        return [new_ids[commit] for commit, _ in commits]
+
+    def clear(self):
+        """Remove all nodes and edges from the graph, keeping its name"""
+        self.offsets = np.zeros(1, dtype=np.int32)
+        self.parents = np.zeros(0, dtype=np.int32)
+        self.oids = []
+        self._child_offsets = None
+        self._children = None
+        self._node_ids = None
+
+    # conversion to and from NetworkX
+    @classmethod
+    def from_networkx(cls, DG):
+        """Create `CSRGraph` out of NetworkX `DiGraph`
+
+        Nodes are numbered in the `DG` iteration order, and the order of
+        successors is preserved, so that depth-first search visits nodes
+        in the same order for both graphs.  Node names are stored in `oids`.
+        """
+        oids = list(DG)
+        node_ids = {name: i for i, name in enumerate(oids)}
+        offsets = np.zeros(len(oids) + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum([DG.out_degree(node) for node in oids])
+        parents = np.fromiter((node_ids[w] for node in oids for w in DG.successors(node)),
+                              dtype=np.int32, count=offsets[-1])
+        graph = cls(offsets, parents, oids=oids, name=getattr(DG, 'name', None))
+        graph._node_ids = node_ids
+        return graph
+
+    def to_networkx(self):
+        """Convert to NetworkX `DiGraph`, with node names from `oids` if present"""
+        names = self.oid_names()
+        DG = nx.DiGraph(name=self.name)
+        DG.add_nodes_from(names)
+        sources = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.offsets))
+        DG.add_edges_from((names[u], names[w]) for u, w in zip(sources.tolist(), self.parents.tolist()))
+        return DG
+
+# %% ../01a_csr_graph.ipynb 9
+def _csr_dfs(G):
+    """Iterative depth-first search of whole `CSRGraph`
+
+    Roots of the DFS are tried in node order, and successors of each node
+    are visited in the order they are stored.
+
+    Returns
+    -------
+    tuple (postorder, tree_parent, acyclic)
+        List of nodes in the DFS post-order, list with parent of each node
+        in the DFS spanning forest (-1 for roots), and whether there were
+        no back edges, i.e. whether the graph is acyclic.
+    """
+    n = G.number_of_nodes()
+    # plain lists are faster than NumPy arrays for scalar access
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+
+    state = bytearray(n)  # 0 = not visited, 1 = on stack, 2 = finished
+    tree_parent = [-1] * n
+    postorder = []
+    acyclic = True
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack_nodes = [root]
+        stack_pos = [offsets[root]]
+        while stack_nodes:
+            u = stack_nodes[-1]
+            pos = stack_pos[-1]
+            if pos < offsets[u + 1]:
+                stack_pos[-1] = pos + 1
+                w = parents[pos]
+                if state[w] == 0:
+                    state[w] = 1
+                    tree_parent[w] = u
+                    stack_nodes.append(w)
+                    stack_pos.append(offsets[w])
+                elif state[w] == 1:
+                    acyclic = False
+            else:
+                stack_nodes.pop()
+                stack_pos.pop()
+                state[u] = 2
+                postorder.append(u)
+
+    return postorder, tree_parent, acyclic
+
+# %% ../01a_csr_graph.ipynb 11
+def _first_parent_chains(G):
+    """Decompose `CSRGraph` into disjoint chains following first parents
+
+    Each chain starts at the first node in topological order (children
+    before parents) that is not yet in any chain, and follows first parents
+    until it reaches a node that is already in some chain, or a root.
+
+    Returns
+    -------
+    tuple (chain, position)
+        Arrays of int32 indexed by node identifier: number of the chain
+        the node belongs to, and position of the node in that chain
+        (0 for the start of the chain, i.e. for its newest commit).
+    """
+    n = G.number_of_nodes()
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    postorder, _, _ = _csr_dfs(G)
+
+    chain = [-1] * n
+    position = [0] * n
+    n_chains = 0
+    for start in reversed(postorder):
+        if chain[start] >= 0:
+            continue
+        u, pos = start, 0
+        while True:
+            chain[u], position[u] = n_chains, pos
+            pos += 1
+            if offsets[u] == offsets[u + 1]:
+                break
+            u = parents[offsets[u]]
+            if chain[u] >= 0:
+                break
+        n_chains += 1
+
+    return np.array(chain, dtype=np.int32), np.array(position, dtype=np.int32)
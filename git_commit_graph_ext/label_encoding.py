@@ -0,0 +1,205 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../10a_label_encoding.ipynb.
+
+# %% auto 0
+__all__ = ['zigzag_encode', 'zigzag_decode', 'BitPackedArray', 'VarintArray', 'label_encoding_sizes']
+
+# %% ../10a_label_encoding.ipynb 5
+import numpy as np
+import pandas as pd
+
+# %% ../10a_label_encoding.ipynb 6
+def zigzag_encode(values):
+    """Map signed integers to unsigned ones: 0, -1, 1, -2, ... to 0, 1, 2, 3, ..."""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def zigzag_decode(codes):
+    """Inverse of `zigzag_encode()`"""
+    codes = np.asarray(codes, dtype=np.uint64)
+    return ((codes >> np.uint64(1)).astype(np.int64)) ^ -((codes & np.uint64(1)).astype(np.int64))
+
+# %% ../10a_label_encoding.ipynb 9
+class BitPackedArray:
+    """Array of integers bit-packed with fixed width, with random access
+
+    Parameters
+    ----------
+    values : array-like of ints
+        Values to encode; they must be non-negative unless `signed` is true.
+
+    signed : bool, optional (default=False)
+        Whether to zigzag-encode values, allowing negative values.
+    """
+
+    def __init__(self, values, signed=False):
+        values = np.asarray(values, dtype=np.int64)
+        if signed:
+            codes = zigzag_encode(values)
+        elif len(values) > 0 and values.min() < 0:
+            raise ValueError("negative values in unsigned BitPackedArray")
+        else:
+            codes = values.astype(np.uint64)
+        self.signed = signed
+        self.size = len(codes)
+        self.width = max(int(codes.max()).bit_length() if self.size > 0 else 0, 1)
+        bits = (codes[:, None] >> np.arange(self.width, dtype=np.uint64)) & np.uint64(1)
+        self.data = np.packbits(bits.astype(np.uint8).ravel(), bitorder='little')
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Size of encoded values in bytes"""
+        return self.data.nbytes
+
+    def __getitem__(self, i):
+        if not -self.size <= i < self.size:
+            raise IndexError("BitPackedArray index out of range")
+        bit = (i % self.size) * self.width
+        chunk = self.data[bit // 8:(bit + self.width + 7) // 8 + 1].tobytes()
+        code = (int.from_bytes(chunk, 'little') >> (bit % 8)) & ((1 << self.width) - 1)
+        if self.signed:
+            return (code >> 1) ^ -(code & 1)
+        return code
+
+    def to_numpy(self):
+        """Decode all values, as an array of int64"""
+        bits = np.unpackbits(self.data, bitorder='little')[:self.size * self.width]
+        codes = (bits.reshape(self.size, self.width).astype(np.uint64)
+                 << np.arange(self.width, dtype=np.uint64)).sum(axis=1, dtype=np.uint64)
+        return zigzag_decode(codes) if self.signed else codes.astype(np.int64)
+
+# %% ../10a_label_encoding.ipynb 12
+class VarintArray:
+    """Array of integers encoded as varints (LEB128), with random access via block index
+
+    Parameters
+    ----------
+    values : array-like of ints
+        Values to encode; they must be non-negative unless `signed` is true.
+
+    signed : bool, optional (default=False)
+        Whether to zigzag-encode values, allowing negative values.
+
+    block_size : int, optional (default=64)
+        Number of values per block; byte offset of each block is stored
+        as 4-byte integer, for random access.
+    """
+
+    def __init__(self, values, signed=False, block_size=64):
+        values = np.asarray(values, dtype=np.int64)
+        if signed:
+            codes = zigzag_encode(values)
+        elif len(values) > 0 and values.min() < 0:
+            raise ValueError("negative values in unsigned VarintArray")
+        else:
+            codes = values.astype(np.uint64)
+        self.signed = signed
+        self.size = len(codes)
+        self.block_size = block_size
+
+        # number of 7-bit groups of each value, at least one
+        bit_length = np.zeros(self.size, dtype=np.int64)
+        nonzero = codes > 0
+        bit_length[nonzero] = np.floor(np.log2(codes[nonzero].astype(np.float64))).astype(np.int64) + 1
+        # float log2 can be off by one for values near powers of two
+        bit_length[nonzero] += (codes[nonzero] >> bit_length[nonzero].astype(np.uint64)) > 0
+        num_bytes = np.maximum((bit_length + 6) // 7, 1)
+
+        ends = np.cumsum(num_bytes)
+        group = np.arange(int(ends[-1]) if self.size > 0 else 0) - np.repeat(ends - num_bytes, num_bytes)
+        data = (np.repeat(codes, num_bytes) >> (7 * group).astype(np.uint64)) & np.uint64(0x7F)
+        data[np.repeat(num_bytes, num_bytes) - 1 > group] |= np.uint64(0x80)
+        self.data = data.astype(np.uint8)
+        self.index = np.r_[0, ends][:self.size:block_size].astype(np.uint32)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Size of encoded values in bytes, including the block index"""
+        return self.data.nbytes + self.index.nbytes
+
+    def __getitem__(self, i):
+        if not -self.size <= i < self.size:
+            raise IndexError("VarintArray index out of range")
+        block, skip = divmod(i % self.size, self.block_size)
+        pos = int(self.index[block])
+        data = self.data
+        while skip > 0:
+            if data[pos] < 0x80:
+                skip -= 1
+            pos += 1
+        code, shift = 0, 0
+        while True:
+            byte = int(data[pos])
+            code |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            pos += 1
+            shift += 7
+        if self.signed:
+            return (code >> 1) ^ -(code & 1)
+        return code
+
+    def to_numpy(self):
+        """Decode all values, as an array of int64"""
+        if self.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        ends = np.flatnonzero(self.data < 0x80) + 1
+        starts = np.r_[0, ends[:-1]]
+        group = np.arange(len(self.data)) - np.repeat(starts, ends - starts)
+        parts = (self.data & 0x7F).astype(np.uint64) << (7 * group).astype(np.uint64)
+        codes = np.add.reduceat(parts, starts).astype(np.uint64)
+        return zigzag_decode(codes) if self.signed else codes.astype(np.int64)
+
+# %% ../10a_label_encoding.ipynb 20
+_LABEL_COLUMNS = ('level', 'post', 'min', 'f_min')
+
+
+def label_encoding_sizes(df, columns=_LABEL_COLUMNS, reference='post', block_size=64):
+    """Size of labels in bytes per commit, for different encodings
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Labels of commits, one commit per row, for example the result of
+        `graph_data_to_dataframe()`.
+
+    columns : sequence of str, optional
+        Columns of `df` with labels to encode; by default labels created
+        by `graph_data_to_dataframe()`.
+
+    reference : str or None, optional (default='post')
+        Column to compute deltas against; if None, deltas are not computed.
+
+    block_size : int, optional (default=64)
+        Number of values per block of the varint encoding.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Bytes per commit, with labels as rows, and encodings as columns:
+        'int64', 'bit-packed', 'varint', 'delta bit-packed' and 'delta varint'
+        (NaN for the reference column itself), and with 'bits' column giving
+        the width of bit-packed values.
+    """
+    n = len(df)
+    sizes = []
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.int64)
+        bitpacked = BitPackedArray(values, signed=bool((values < 0).any()))
+        row = {'label': column, 'bits': bitpacked.width, 'int64': 8.0,
+               'bit-packed': bitpacked.nbytes / n,
+               'varint': VarintArray(values, signed=bitpacked.signed, block_size=block_size).nbytes / n,
+               'delta bit-packed': np.nan, 'delta varint': np.nan}
+        if reference is not None and column != reference:
+            delta = df[reference].to_numpy(dtype=np.int64) - values
+            signed = bool((delta < 0).any())
+            row['delta bit-packed'] = BitPackedArray(delta, signed=signed).nbytes / n
+            row['delta varint'] = VarintArray(delta, signed=signed, block_size=block_size).nbytes / n
+        sizes.append(row)
+    return pd.DataFrame(sizes).set_index('label')
@@ -0,0 +1,263 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07f_bitmaps.ipynb.
+
+# %% auto 0
+__all__ = ['find_reachability_bitmaps', 'save_reachability_bitmaps', 'load_reachability_bitmaps']
+
+# %% ../../07f_bitmaps.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs
+from ..checkpoint import _savefile_name, _save_arrays_bin, _load_arrays_bin
+
+# %% ../../07f_bitmaps.ipynb 8
+# like MIN_REGION in next_commit_index() in Git's pack-bitmap-write.c
+_BITMAP_MIN_REGION = 20000
+
+
+def _next_bitmap_gap(distance, interval=100, max_interval=5000, recent=100):
+    """Number of commits to skip before the next selected commit, like in Git"""
+    if distance <= recent:
+        return 0
+    if distance <= _BITMAP_MIN_REGION:
+        return min(distance - recent, interval)
+    return max(min(distance - _BITMAP_MIN_REGION, max_interval), interval)
+
+
+def _select_bitmap_commits(G, tips, interval=100, max_interval=5000, recent=100):
+    """Select commits of CSRGraph G for bitmaps, as a sorted list of node identifiers"""
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    walked = bytearray(G.number_of_nodes())
+
+    selected = set(tips)
+    for tip in tips:
+        # first-parent history of tip, not walked from earlier tips
+        history = []
+        w = tip
+        while not walked[w]:
+            walked[w] = 1
+            history.append(w)
+            if offsets[w] == offsets[w + 1]:
+                break
+            w = parents[offsets[w]]
+
+        i = 0
+        while i < len(history):
+            gap = _next_bitmap_gap(i, interval=interval,
+                                   max_interval=max_interval, recent=recent)
+            if i + gap >= len(history):
+                break
+            # prefer the last merge commit in the interval, like Git
+            chosen = history[i + gap]
+            for w in history[i:i + gap + 1]:
+                if offsets[w + 1] - offsets[w] > 1:
+                    chosen = w
+            selected.add(chosen)
+            i += gap + 1
+
+    return sorted(selected)
+
+# %% ../../07f_bitmaps.ipynb 10
+def _mask_to_runs(mask):
+    """Compress boolean array into sorted int32 array of boundaries of runs of set bits"""
+    padded = np.zeros(len(mask) + 2, dtype=np.int8)
+    padded[1:-1] = mask
+    return np.flatnonzero(np.diff(padded)).astype(np.int32)
+
+
+def _reachability_bitmaps(G, selected, bit):
+    """Compute run-length compressed bitmaps for selected nodes of CSRGraph G
+
+    Returns
+    -------
+    tuple (offsets, runs)
+        Bitmap of the i-th selected node is `runs[offsets[i]:offsets[i+1]]`.
+    """
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    bits = bit.tolist()
+    mask = bytearray(G.number_of_nodes())
+    mask_np = np.frombuffer(mask, dtype=np.bool_)
+
+    bitmaps = {}
+    for s in selected:
+        mask_np[:] = False
+        mask[bits[s]] = 1
+        stack = [s]
+        while stack:
+            w = stack.pop()
+            for x in parents[offsets[w]:offsets[w + 1]]:
+                if mask[bits[x]]:
+                    continue
+                if x in bitmaps:
+                    # all commits reachable from x are in its bitmap
+                    for start, end in bitmaps[x].reshape(-1, 2).tolist():
+                        mask_np[start:end] = True
+                else:
+                    mask[bits[x]] = 1
+                    stack.append(x)
+        bitmaps[s] = _mask_to_runs(mask_np)
+
+    runs_offsets = np.zeros(len(selected) + 1, dtype=np.int32)
+    runs_offsets[1:] = np.cumsum([len(bitmaps[s]) for s in selected])
+    runs = np.concatenate([bitmaps[s] for s in selected] + [np.empty(0, dtype=np.int32)])
+    return runs_offsets, runs
+
+
+def _bitmaps_lookup(commits, offsets, runs):
+    """Dictionary from selected commit to its bitmap (view into runs)"""
+    return {commit: runs[offsets[i]:offsets[i + 1]]
+            for i, commit in enumerate(commits)}
+
+# %% ../../07f_bitmaps.ipynb 11
+def find_reachability_bitmaps(DG, tips=None, interval=100, max_interval=5000, recent=100,
+                              check_acyclic=True):
+    """Find reachability bitmaps of selected commits (bitmap index) in graph G
+
+    Commits are selected like in Git's bitmap index: all tips, and commits
+    along the first-parent history of each tip: every commit among the
+    `recent` ones, then every `interval` commits, with the interval growing
+    up to `max_interval` commits for old history, preferring merge commits.
+
+    For each selected commit 'u' its bitmap has set bits of all vertices
+    reachable from 'u', including 'u'.  Bit of vertex 'w' is its DFS post-order
+    number minus one, and bitmaps are compressed as sorted lists of boundaries
+    of runs of set bits: bits in [b_0, b_1), [b_2, b_3), ... are set.
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    tips : list of nodes or None, optional (default=None)
+        Ref tips, always selected; by default all vertices without
+        predecessors (commits without children), i.e. branch heads.
+
+    interval : int, optional (default=100)
+        Distance between selected commits outside of the most recent region,
+        like MIN_COMMITS in Git.
+
+    max_interval : int, optional (default=5000)
+        Maximal distance between selected commits, for old history, like
+        MAX_COMMITS in Git.
+
+    recent : int, optional (default=100)
+        Size of the region near tips where all commits are selected,
+        like MUST_REGION in Git.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict
+        Dictionary with the following keys:
+         * 'bit' - bit of each vertex, as dict with nodes as keys, or for
+           CSRGraph as an int32 array indexed by node identifier
+         * 'commits' - selected commits, as list of nodes, or for CSRGraph
+           as an int32 array of node identifiers
+         * 'offsets', 'runs' - int32 arrays, the bitmap of the i-th selected
+           commit is runs[offsets[i]:offsets[i+1]]
+         * 'bitmaps' - dict with selected commits as keys, and their bitmaps
+           (views into 'runs') as values
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "Reachability bitmaps are not defined on undirected graphs.")
+
+    G = DG if isinstance(DG, CSRGraph) else CSRGraph.from_networkx(DG)
+    n = G.number_of_nodes()
+    postorder, _, acyclic = _csr_dfs(G)
+    if check_acyclic and not acyclic:
+        raise nx.NetworkXNotImplemented(
+            "Reachability bitmaps are not defined on directed graphs with loops")
+    bit = np.empty(n, dtype=np.int32)
+    bit[postorder] = np.arange(n, dtype=np.int32)
+
+    if tips is None:
+        tips = np.flatnonzero(G.in_degree() == 0).tolist()
+    elif not isinstance(DG, CSRGraph):
+        tips = [G.node_id(tip) for tip in tips]
+    selected = _select_bitmap_commits(G, [int(tip) for tip in tips], interval=interval,
+                                      max_interval=max_interval, recent=recent)
+    # parents before children, so that bitmaps can be reused
+    selected.sort(key=lambda s: bit[s])
+    offsets, runs = _reachability_bitmaps(G, selected, bit)
+
+    if isinstance(DG, CSRGraph):
+        commits = np.array(selected, dtype=np.int32)
+        bit_labels = bit
+    else:
+        commits = [G.oids[s] for s in selected]
+        bit_labels = dict(zip(G.oids, bit.tolist()))
+    return {'bit': bit_labels, 'commits': commits,
+            'offsets': offsets, 'runs': runs,
+            'bitmaps': _bitmaps_lookup(commits, offsets, runs)}
+
+# %% ../../07f_bitmaps.ipynb 22
+_BITMAP_ARRAYS = ('bit', 'commits', 'offsets', 'runs')
+
+
+def save_reachability_bitmaps(index, graph_name, datasets_dir='datasets', overwrite=False):
+    """Save reachability bitmaps in the binary format, suitable for memory-mapping
+
+    Parameters
+    ----------
+    index : dict
+        Bitmap index for CSRGraph, result of `find_reachability_bitmaps()`.
+
+    graph_name : str
+        Name of the graph, used to create the name of the file.
+
+    datasets_dir : str, optional (default='datasets')
+        Directory where to save the file.
+
+    overwrite : bool, optional (default=False)
+        Whether to overwrite the file if it already exists.
+
+    Returns
+    -------
+    Path
+        Path to the file storing the bitmap index.
+    """
+    if not isinstance(index['bit'], np.ndarray):
+        raise ValueError("Only bitmap index computed for CSRGraph can be saved")
+    filename = _savefile_name(graph_name, out_dir=datasets_dir,
+                              kind='bitmaps', file_format='bin')
+    if not overwrite and filename.is_file():
+        return filename
+
+    _save_arrays_bin(filename, graph_name,
+                     {name: np.asarray(index[name], dtype=np.int32) for name in _BITMAP_ARRAYS})
+    return filename
+
+
+def load_reachability_bitmaps(graph_name, datasets_dir='datasets', mmap=True):
+    """Load reachability bitmaps saved with `save_reachability_bitmaps()`
+
+    Parameters
+    ----------
+    graph_name : str
+        Name of the graph, used to create the name of the file.
+
+    datasets_dir : str, optional (default='datasets')
+        Directory where the file is stored.
+
+    mmap : bool, optional (default=True)
+        Whether to memory-map the file read-only; otherwise the whole file
+        is read into memory.
+
+    Returns
+    -------
+    dict
+        Bitmap index, like the result of `find_reachability_bitmaps()`
+        for CSRGraph.
+    """
+    filename = _savefile_name(graph_name, out_dir=datasets_dir,
+                              kind='bitmaps', file_format='bin')
+    _, arrays = _load_arrays_bin(filename, mmap=mmap)
+    index = {name: arrays[name] for name in _BITMAP_ARRAYS}
+    index['bitmaps'] = _bitmaps_lookup(index['commits'].tolist(), index['offsets'], index['runs'])
+    return index
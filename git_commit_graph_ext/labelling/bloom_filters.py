@@ -0,0 +1,119 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07e_bloom_filters.ipynb.
+
+# %% auto 0
+__all__ = ['find_bloom_filter_labels']
+
+# %% ../../07e_bloom_filters.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs
+
+# %% ../../07e_bloom_filters.ipynb 8
+def _bloom_filter_bits(G, width, hashing='dfs', seed=None):
+    """Compute Bloom filter labels of CSRGraph G as lists of Python ints
+
+    Returns
+    -------
+    tuple (L_out, L_in, acyclic)
+        Lists of bit vectors (as ints) indexed by node identifier, and
+        whether the graph is acyclic.
+    """
+    n = G.number_of_nodes()
+    offsets, parents = G.offsets.tolist(), G.parents.tolist()
+    postorder, _, acyclic = _csr_dfs(G)
+    if hashing == 'dfs':
+        # the same bit for vertices close in DFS post-order
+        post = np.empty(n, dtype=np.int64)
+        post[postorder] = np.arange(n)
+        hashes = post * width // max(n, 1)
+    elif hashing == 'random':
+        hashes = np.random.RandomState(seed).randint(width, size=n)
+    else:
+        raise ValueError("unknown hashing {!r}, expected 'dfs' or 'random'".format(hashing))
+    bit = [1 << h for h in hashes.tolist()]
+
+    L_out = bit[:]
+    for u in postorder:
+        for w in parents[offsets[u]:offsets[u + 1]]:
+            L_out[u] |= L_out[w]
+    L_in = bit[:]
+    for u in reversed(postorder):
+        for w in parents[offsets[u]:offsets[u + 1]]:
+            L_in[w] |= L_in[u]
+
+    return L_out, L_in, acyclic
+
+
+def _bits_to_array(bits, width):
+    """Convert list of ints with given number of bits to (N, width/64) array of uint64"""
+    nbytes = width // 8
+    buffer = b''.join(b.to_bytes(nbytes, 'little') for b in bits)
+    return np.frombuffer(buffer, dtype='<u8').reshape(len(bits), width // 64).copy()
+
+# %% ../../07e_bloom_filters.ipynb 9
+def find_bloom_filter_labels(DG, width=256, hashing='dfs', seed=None, check_acyclic=True):
+    """Find Bloom filter labels (BFL) of descendants and ancestors of all vertices in graph G
+
+    Each vertex 'w' is hashed to one of `width` bits.  Label L_out(u)
+    has set bits of all vertices reachable from 'u', and label L_in(u)
+    has set bits of all vertices from which 'u' is reachable (both sets
+    include 'u' itself).  If v is reachable from u, then bits of L_out(v)
+    are a subset of bits of L_out(u), and bits of L_in(u) are a subset
+    of bits of L_in(v).
+
+    This is based on BFL from [1]; by default vertices are hashed by their
+    DFS post-order number, so that vertices close in DFS order share bits.
+
+    References:
+    -----------
+    [1] Jiao Su, Qing Zhu, Hao Wei, Jeffrey Xu Yu "Reachability Querying:
+        Can It Be Even Faster?" (2017) IEEE Transactions on Knowledge and
+        Data Engineering 29(3), pp. 683-697
+        https://doi.org/10.1109/TKDE.2016.2631160
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    width : int, optional (default=256)
+        Width of each Bloom filter in bits, a positive multiple of 64;
+        labels take 2*width/8 bytes per vertex.
+
+    hashing : str, optional (default='dfs')
+        Hash function: 'dfs' splits DFS post-order into `width` ranges of
+        consecutive vertices, 'random' assigns random bits.
+
+    seed : int or None, optional (default=None)
+        Seed for the random hash function, for reproducible labels.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict
+        Dictionary with 'out' and 'in' keys, storing L_out and L_in labels:
+        dicts with nodes as keys and bit vectors as ints as values; for
+        CSRGraph these are (N, width/64) arrays of uint64 indexed by node
+        identifier
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "Bloom filter labels are not defined on undirected graphs.")
+    if width <= 0 or width % 64 != 0:
+        raise ValueError("width must be a positive multiple of 64, got {!r}".format(width))
+
+    G = DG if isinstance(DG, CSRGraph) else CSRGraph.from_networkx(DG)
+    L_out, L_in, acyclic = _bloom_filter_bits(G, width, hashing=hashing, seed=seed)
+    if check_acyclic and not acyclic:
+        raise nx.NetworkXNotImplemented(
+            "Bloom filter labels are not defined on directed graphs with loops")
+
+    if isinstance(DG, CSRGraph):
+        return {'out': _bits_to_array(L_out, width),
+                'in': _bits_to_array(L_in, width)}
+    return {'out': dict(zip(G.oids, L_out)),
+            'in': dict(zip(G.oids, L_in))}
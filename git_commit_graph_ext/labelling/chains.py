@@ -0,0 +1,239 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07g_chains.ipynb.
+
+# %% auto 0
+__all__ = ['find_chain_cover_labels']
+
+# %% ../../07g_chains.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs, _first_parent_chains
+
+# %% ../../07g_chains.ipynb 8
+_CHAIN_COVERS = ('first-parent', 'greedy', 'minimum')
+
+
+def _greedy_chains(G):
+    """Decompose `CSRGraph` into disjoint chains following the first uncovered parent
+
+    Returns (chain, position) int32 arrays, like `_first_parent_chains()`.
+    """
+    n = G.number_of_nodes()
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    postorder, _, _ = _csr_dfs(G)
+
+    chain = [-1] * n
+    position = [0] * n
+    n_chains = 0
+    for start in reversed(postorder):
+        if chain[start] >= 0:
+            continue
+        u, pos = start, 0
+        while u >= 0:
+            chain[u], position[u] = n_chains, pos
+            pos += 1
+            u = next((p for p in parents[offsets[u]:offsets[u + 1]] if chain[p] < 0), -1)
+        n_chains += 1
+
+    return np.array(chain, dtype=np.int32), np.array(position, dtype=np.int32)
+
+
+def _minimum_chains(G):
+    """Decompose `CSRGraph` into the smallest number of disjoint chains that are paths
+
+    Chains are given by a maximum matching between commits and their parents,
+    found with the Hopcroft-Karp algorithm, starting from the greedy chains.
+
+    Returns (chain, position) int32 arrays, like `_first_parent_chains()`.
+    """
+    n = G.number_of_nodes()
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    postorder, _, _ = _csr_dfs(G)
+
+    # next_[u] is the parent following u in its chain, prev[p] the child before p
+    next_ = [-1] * n
+    prev = [-1] * n
+    chain, position = _greedy_chains(G)
+    order = np.lexsort((position, chain))
+    same_chain = chain[order[1:]] == chain[order[:-1]]
+    for u, p in zip(order[:-1][same_chain].tolist(), order[1:][same_chain].tolist()):
+        next_[u], prev[p] = p, u
+
+    while True:
+        # BFS layers of alternating paths from commits that end their chains
+        dist = [-1] * n
+        queue = [u for u in range(n) if next_[u] < 0]
+        for u in queue:
+            dist[u] = 0
+        found = False
+        for u in queue:
+            for p in parents[offsets[u]:offsets[u + 1]]:
+                w = prev[p]
+                if w < 0:
+                    found = True
+                elif dist[w] < 0:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        if not found:
+            break
+
+        # DFS for augmenting paths along the layers, ending at a chain start
+        edge = offsets[:-1]
+        for root in range(n):
+            if next_[root] >= 0 or dist[root] != 0:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                if edge[u] == offsets[u + 1]:
+                    dist[u] = -1
+                    stack.pop()
+                    continue
+                p = parents[edge[u]]
+                edge[u] += 1
+                w = prev[p]
+                if w < 0:
+                    for v in stack:
+                        p = parents[edge[v] - 1]
+                        next_[v], prev[p] = p, v
+                    break
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+
+    chain = [-1] * n
+    position = [0] * n
+    n_chains = 0
+    for start in reversed(postorder):
+        if prev[start] >= 0:
+            continue
+        u, pos = start, 0
+        while u >= 0:
+            chain[u], position[u] = n_chains, pos
+            pos += 1
+            u = next_[u]
+        n_chains += 1
+
+    return np.array(chain, dtype=np.int32), np.array(position, dtype=np.int32)
+
+# %% ../../07g_chains.ipynb 10
+def _chain_labels(G, chain, position):
+    """Compute sparse chain cover labels of CSRGraph G, given its chain decomposition
+
+    Returns (row, offsets, chains, positions) int32 arrays, where the label
+    of node u is given by chains[offsets[row[u]]:offsets[row[u] + 1]] and
+    by the same slice of positions, sorted by chain.
+    """
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    chain_list = chain.tolist()
+    postorder, _, _ = _csr_dfs(G)
+
+    row = [0] * G.number_of_nodes()
+    rows = []
+    for u in postorder:
+        u_parents = parents[offsets[u]:offsets[u + 1]]
+        if len(u_parents) == 1 and chain_list[u_parents[0]] == chain_list[u]:
+            row[u] = row[u_parents[0]]
+            continue
+
+        row[u] = len(rows)
+        if not u_parents:
+            rows.append((chain[:0], position[:0]))
+            continue
+        u_chains = np.concatenate([chain[u_parents]] + [rows[row[p]][0] for p in u_parents])
+        u_positions = np.concatenate([position[u_parents]] + [rows[row[p]][1] for p in u_parents])
+        # smallest position for each chain, without the chain of u
+        order = np.lexsort((u_positions, u_chains))
+        u_chains, u_positions = u_chains[order], u_positions[order]
+        keep = np.r_[True, u_chains[1:] != u_chains[:-1]] & (u_chains != chain_list[u])
+        rows.append((u_chains[keep], u_positions[keep]))
+
+    row_offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+    row_offsets[1:] = np.cumsum([len(r[0]) for r in rows])
+    return (np.array(row, dtype=np.int32), row_offsets,
+            np.concatenate([chain[:0]] + [r[0] for r in rows]).astype(np.int32),
+            np.concatenate([position[:0]] + [r[1] for r in rows]).astype(np.int32))
+
+# %% ../../07g_chains.ipynb 11
+def find_chain_cover_labels(DG, cover='first-parent', check_acyclic=True):
+    """Find chain cover reachability labels of all vertices in graph G
+
+    The graph is decomposed into disjoint chains, and each vertex 'u' gets
+    a label with, for each chain reachable from 'u' other than its own, the
+    smallest position in the chain of a vertex reachable from 'u'.  Then v
+    in chain i at position k is reachable from u if and only if u and v are
+    in the same chain and u is not after v, or the label of u has an entry
+    for chain i with position not larger than k.
+
+    This is based on the chain compression of transitive closure from [1].
+
+    References:
+    -----------
+    [1] H. V. Jagadish "A compression technique to materialize transitive
+        closure" (1990) ACM Transactions on Database Systems 15(4),
+        pp. 558-598, https://doi.org/10.1145/99935.99944
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    cover : str, optional (default='first-parent')
+        How to decompose the graph into chains, one of 'first-parent'
+        (chains follow first parents), 'greedy' (chains follow the first
+        parent not yet in any chain), or 'minimum' (the fewest chains that
+        are paths in the graph, from maximum matching).
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict
+        Dictionary with the following keys:
+         * 'chain', 'position' - chain of each vertex, and its position in
+           the chain (0 for the newest commit of the chain), as dicts with
+           nodes as keys, or for CSRGraph as int32 arrays indexed by node
+           identifier
+         * 'labels' - dict with nodes as keys and labels as values, each
+           label being a dict with chains as keys and positions as values;
+           labels of vertices in the same row are the same object
+         * 'row', 'offsets', 'chains', 'positions' - only for CSRGraph,
+           int32 arrays with labels in the CSR format: the label of u
+           consists of chains[offsets[row[u]]:offsets[row[u]+1]], sorted,
+           and the positions at the same indices
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "Chain cover labels are not defined on undirected graphs.")
+    if cover not in _CHAIN_COVERS:
+        raise ValueError("unknown chain cover {!r}, expected one of: {}".format(
+            cover, ', '.join(_CHAIN_COVERS)))
+
+    G = DG if isinstance(DG, CSRGraph) else CSRGraph.from_networkx(DG)
+    if check_acyclic and not _csr_dfs(G)[2]:
+        raise nx.NetworkXNotImplemented(
+            "Chain cover labels are not defined on directed graphs with loops")
+
+    if cover == 'greedy':
+        chain, position = _greedy_chains(G)
+    elif cover == 'minimum':
+        chain, position = _minimum_chains(G)
+    else:
+        chain, position = _first_parent_chains(G)
+    row, offsets, chains, positions = _chain_labels(G, chain, position)
+
+    if isinstance(DG, CSRGraph):
+        return {'chain': chain, 'position': position,
+                'row': row, 'offsets': offsets,
+                'chains': chains, 'positions': positions}
+    offsets = offsets.tolist()
+    labels = [dict(zip(chains[offsets[r]:offsets[r + 1]].tolist(),
+                       positions[offsets[r]:offsets[r + 1]].tolist()))
+              for r in range(len(offsets) - 1)]
+    return {'chain': dict(zip(G.oids, chain.tolist())),
+            'position': dict(zip(G.oids, position.tolist())),
+            'labels': {node: labels[r] for node, r in zip(G.oids, row.tolist())}}
@@ -0,0 +1,111 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../06a_corrected_dates.ipynb.
+
+# %% auto 0
+__all__ = ['find_corrected_dates', 'corrected_date_offsets']
+
+# %% ../../06a_corrected_dates.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs
+
+# %% ../../06a_corrected_dates.ipynb 8
+def find_corrected_dates(DG, dates, attr=None, check_acyclic=True):
+    """Find corrected commit dates (generation number v2) of all vertices in graph G
+
+    The corrected commit date of a commit is its commit date, or one more
+    than the maximum of corrected commit dates of its parents, whichever
+    is larger.  For commits without parents it is its commit date.
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph, with edges going from commit to its parents.
+
+    dates : dict or array-like of ints
+        Commit dates (committer timestamps, as seconds since epoch) of
+        all vertices: dict keyed by node, or, for CSRGraph, array indexed
+        by node identifier, or dict keyed by object identifier (`oids`).
+
+    attr : str, optional (default=None)
+        If set, name of a node attribute under which store corrected date.
+        Not supported for CSRGraph.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict of ints
+        Dictionary, where keys are node indices, and values are corrected
+        commit dates; for CSRGraph it is an array of int64 indexed by node
+        identifier
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "Corrected commit date is not defined on undirected graphs.")
+
+    if isinstance(DG, CSRGraph):
+        if attr is not None:
+            raise ValueError("CSRGraph does not support node attributes")
+        return _find_corrected_dates_csr(DG, dates, check_acyclic=check_acyclic)
+
+    if check_acyclic and not nx.is_directed_acyclic_graph(DG):
+        raise nx.NetworkXNotImplemented(
+            "Corrected commit date is not defined on directed graphs with loops")
+
+    cdate = {}
+    # it can be any post-order ordering
+    for node in nx.dfs_postorder_nodes(DG):
+        cdate[node] = max([dates[node]] +
+                          [cdate[neigh] + 1 for neigh in DG.successors(node)])
+
+    if attr is not None:
+        for node, value in cdate.items():
+            DG.nodes[node][attr] = value
+
+    return cdate
+
+
+def _find_corrected_dates_csr(G, dates, check_acyclic=True):
+    """Find corrected commit dates of all vertices in CSRGraph G, as int64 array"""
+    if isinstance(dates, dict):
+        dates = [dates[oid] for oid in G.oid_names()]
+    dates = np.asarray(dates, dtype=np.int64).tolist()
+
+    postorder, _, acyclic = _csr_dfs(G)
+    if check_acyclic and not acyclic:
+        raise nx.NetworkXNotImplemented(
+            "Corrected commit date is not defined on directed graphs with loops")
+
+    offsets = G.offsets.tolist()
+    parents = G.parents.tolist()
+    cdate = dates[:]
+    for node in postorder:
+        for neigh in parents[offsets[node]:offsets[node + 1]]:
+            if cdate[neigh] >= cdate[node]:
+                cdate[node] = cdate[neigh] + 1
+
+    return np.array(cdate, dtype=np.int64)
+
+
+def corrected_date_offsets(cdate, dates):
+    """Corrected commit date offsets, as stored by Git in the commit-graph file
+
+    Parameters
+    ----------
+    cdate : dict or numpy.ndarray
+        Corrected commit dates, e.g. result of `find_corrected_dates()`.
+
+    dates : dict or array-like of ints
+        Commit dates, in the same format as `cdate`.
+
+    Returns
+    -------
+    dict of ints or numpy.ndarray
+        Differences between corrected commit dates and commit dates.
+    """
+    if isinstance(cdate, dict):
+        return {node: value - dates[node] for node, value in cdate.items()}
+    return np.asarray(cdate) - np.asarray(dates, dtype=np.int64)
@@ -1,19 +1,21 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../07_interval_labels.ipynb.
 
 # %% auto 0
-__all__ = ['find_dfs_spanning', 'find_dfs_intervals', 'find_dfs_intervals_extra']
+__all__ = ['find_dfs_spanning', 'find_dfs_intervals', 'find_dfs_intervals_extra', 'update_dfs_intervals_extra']
 
 # %% ../../07_interval_labels.ipynb 4
 import networkx as nx
-from copy import deepcopy
+import numpy as np
+
+from ..csr_graph import CSRGraph
 
 # %% ../../07_interval_labels.ipynb 63
 def find_dfs_spanning(G):
   """Find edges of the DFS spanning tree for graph G
 
   This is used to visualize the spanning tree (spanning forest,
-  tree cover) in example small graphs.  This function is also used
-  to compute DFS intervals, among others in `find_dfs_intervals()`
+  tree cover) in example small graphs.  DFS intervals are computed
+  without creating the spanning tree, see `find_dfs_intervals()`
 
   Parameters
   ----------
@@ -40,6 +42,91 @@ def find_dfs_spanning(G):
   return list(nx.dfs_edges(G))
 
 # %% ../../07_interval_labels.ipynb 77
+def _dfs_labels(G, extra=False):
+    """Compute DFS-derived labels of all vertices of CSRGraph G in a single pass
+
+    Roots of the DFS are tried in node order, and successors of each node
+    are visited in the order they are stored, like in NetworkX
+    `dfs_postorder_nodes()`.
+
+    Returns
+    -------
+    dict of numpy.ndarray
+        Arrays of int32, indexed by node identifier, under keys 'min', 'post',
+        and 'f_min', and if `extra` is true also 'f_gap' and 'p_tree' (where
+        -1 stands for None); see `find_dfs_intervals_extra()`.
+    """
+    n = G.number_of_nodes()
+    labels = {'min': np.zeros(n, dtype=np.int32),
+              'post': np.zeros(n, dtype=np.int32),
+              'f_min': np.zeros(n, dtype=np.int32)}
+    if extra:
+        labels['f_gap'] = np.full(n, -1, dtype=np.int32)
+        labels['p_tree'] = np.full(n, -1, dtype=np.int32)
+    # fast scalar access to arrays
+    offsets, parents = memoryview(G.offsets), memoryview(G.parents)
+    d_min, d_post, f_min = (memoryview(labels[name]) for name in ['min', 'post', 'f_min'])
+    if extra:
+        f_gap, p_tree = memoryview(labels['f_gap']), memoryview(labels['p_tree'])
+
+    visited = bytearray(n)
+    pos = 0
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack_nodes = [root]
+        stack_pos = [offsets[root]]
+        while stack_nodes:
+            node = stack_nodes[-1]
+            i = stack_pos[-1]
+            if i < offsets[node + 1]:
+                # visit next successor, if not visited yet
+                stack_pos[-1] = i + 1
+                neigh = parents[i]
+                if not visited[neigh]:
+                    visited[neigh] = 1
+                    stack_nodes.append(neigh)
+                    stack_pos.append(offsets[neigh])
+                continue
+
+            # all successors of node are finished, finish node
+            stack_nodes.pop()
+            stack_pos.pop()
+            pos += 1
+            d_post[node] = pos
+            # the first finished child in DFS tree has the lowest 'min'
+            if d_min[node] == 0:
+                d_min[node] = pos
+            if stack_nodes and d_min[stack_nodes[-1]] == 0:
+                d_min[stack_nodes[-1]] = d_min[node]
+
+            # min-post graph interval (min over whole graph)
+            succ = parents[offsets[node]:offsets[node + 1]]
+            f_min[node] = min([pos] + [f_min[neigh] for neigh in succ])
+
+            # PReaCH specific extensions
+            if not extra or not succ:
+                continue
+
+            node_min = d_min[node]
+            f_gap[node] = max([d_post[neigh] for neigh in succ
+                               if d_post[neigh] < node_min] +
+                              [f_gap[neigh] for neigh in succ
+                               if f_gap[neigh] >= 0],
+                              default=-1)
+            p_tree_candidates = \
+                [p_tree[neigh] for neigh in succ
+                 if p_tree[neigh] >= 0 and d_post[neigh] < node_min] + \
+                [neigh for neigh in succ
+                 if d_post[neigh] < node_min]
+            if p_tree_candidates:
+                p_tree[node] = max(p_tree_candidates,
+                                   key=lambda w: d_post[w] - d_min[w])
+
+    return labels
+
+# %% ../../07_interval_labels.ipynb 80
 def find_dfs_intervals(DG, attr=None):
   """Find min-post labeling of all vertices in graph G, using DFS spanning-tree
 
@@ -51,45 +138,39 @@ def find_dfs_intervals(DG, attr=None):
 
   Parameters:
   -----------
-  DG : NetworkX DiGraph
+  DG : NetworkX DiGraph or CSRGraph
       Directed acyclic graph.
 
   attr : str, optional (default=None)
       If set, name of a node attribute under which store min-post intervals.
+      Not supported for CSRGraph.
 
   Returns:
   --------
   dict of two-element lists of ints
       Dictionary, where keys are node indices, and values are two element
-      lists storing min-post interval (of integers)
+      lists storing min-post interval (of integers); for CSRGraph it is
+      an (N, 2) array of ints indexed by node identifier
   """
-  ivl = {}
-  # create graph of spanning tree (DFS spanning tree) of DG
-  span=nx.DiGraph()
-  span.add_nodes_from(DG)
-  span.add_edges_from(find_dfs_spanning(DG))
-  # DEBUG
-  #print('span=%r' % find_dfs_spanning(DG))
-
-  # any post-order ordering would be good
-  nodelist = nx.dfs_postorder_nodes(DG)
-  for pos, node in enumerate(nodelist, start=1):
-    ivl[node] = [pos, pos]
-    if span.out_degree(node) > 0:
-      ivl[node][0] = min(pos,
-                         *[ivl[neigh][0]
-                           for neigh in span.successors(node)])
-    # DEBUG
-    #print('node=%s [%d,%d] -> %r' %
-    #      (node, ivl[node][0],ivl[node][1],list(span.successors(node))))
+  if isinstance(DG, CSRGraph):
+    if attr is not None:
+      raise ValueError("CSRGraph does not support node attributes")
+    labels = _dfs_labels(DG)
+    return np.column_stack((labels['min'], labels['post']))
+
+  # single DFS pass over compact copy of the graph
+  G = CSRGraph.from_networkx(DG)
+  labels = _dfs_labels(G)
+  ivl = {node: [s, e]
+         for node, s, e in zip(G.oids, labels['min'].tolist(), labels['post'].tolist())}
 
   if attr is not None:
-    for node, interval in ivl.items():
-      DG.nodes[node][attr] = deepcopy(interval)
+    for node, (s, e) in ivl.items():
+      DG.nodes[node][attr] = [s, e]
 
   return ivl
 
-# %% ../../07_interval_labels.ipynb 86
+# %% ../../07_interval_labels.ipynb 89
 def find_dfs_intervals_extra(DG, extra=False):
     """Find DFS-derived data of all vertices in graph G
 
@@ -128,7 +209,7 @@ def find_dfs_intervals_extra(DG, extra=False):
 
     Parameters:
     -----------
-    DG : NetworkX DiGraph
+    DG : NetworkX DiGraph or CSRGraph
         Directed acyclic graph.
 
     extra : bool, optional (default=False)
@@ -138,84 +219,145 @@ def find_dfs_intervals_extra(DG, extra=False):
     --------
     dict of dicts
         Dictionary, where keys are node indices, and values are dictionaries
-        with various DFS spanning-tree derived data.
+        with various DFS spanning-tree derived data.  For CSRGraph it is
+        a NumPy structured array indexed by node identifier, with the same
+        names for fields, where -1 stands for None.
     """
-    data = {}
-    # create graph of spanning tree (DFS spanning tree) of DG
-    span = nx.DiGraph()
-    span.add_nodes_from(DG)
-    span.add_edges_from(find_dfs_spanning(DG))
-
-    # needs depth-first search for some of indices to actually work
-    nodelist = nx.dfs_postorder_nodes(DG)
-    for pos, node in enumerate(nodelist, start=1):
-        data[node] = {}
-
-        # DEBUG
-        # print('node=%s\n -> %r\n => %r' %
-        #      (node,
-        #       list(span.successors(node)),
-        #       list(DG.successors(node))))
-
-        data[node]['post'] = pos
-        if span.out_degree(node) == 0:
-            data[node]['min'] = pos
-        else:
-            data[node]['min'] = min(pos,
-                                    *[data[neigh]['min']
-                                      for neigh in span.successors(node)])
-
-        # print("data[%s]: %r" % (node, data[node]))
-
-        # min-post graph interval (min over whole graph)
-        if DG.out_degree(node) == 0:
-            data[node]['f_min'] = pos
-        else:
-            data[node]['f_min'] = min(pos,
-                                      *[data[neigh]['f_min']
-                                        for neigh in DG.successors(node)])
+    if isinstance(DG, CSRGraph):
+        labels = _dfs_labels(DG, extra=extra)
+        data = np.empty(DG.number_of_nodes(),
+                        dtype=[(name, np.int32) for name in labels])
+        for name, values in labels.items():
+            data[name] = values
+        return data
+
+    # single DFS pass over compact copy of the graph
+    G = CSRGraph.from_networkx(DG)
+    labels = {name: values.tolist()
+              for name, values in _dfs_labels(G, extra=extra).items()}
 
+    data = {}
+    for u, node in enumerate(G.oids):
+        data[node] = {
+            'post': labels['post'][u],
+            'min': labels['min'][u],
+            'f_min': labels['f_min'][u],
+        }
         # PReaCH specific extensions
-        if not extra:
-            continue
+        if extra:
+            f_gap, p_tree = labels['f_gap'][u], labels['p_tree'][u]
+            data[node]['f_gap'] = f_gap if f_gap >= 0 else None
+            data[node]['p_tree'] = G.oids[p_tree] if p_tree >= 0 else None
 
-        if DG.out_degree(node) == 0:
-            data[node]['f_gap'] = None
-            data[node]['p_tree'] = None
-        else:
-            f_gap_candidates = \
-                [data[neigh]['post']
-                 for neigh in DG.successors(node)
-                 if data[neigh]['post'] < data[node]['min']] + \
-                [data[neigh]['f_gap']
-                 for neigh in DG.successors(node)
-                 if data[neigh]['f_gap'] is not None]
-            if f_gap_candidates:
-                data[node]['f_gap'] = max(f_gap_candidates)
-            else:
-                data[node]['f_gap'] = None
-            # print("f_gap[%s]: %r" % (node, data[node]['f_gap']))
+    return data
 
-            # print("p_tree: %r (candidates, part 1)" %
-            #      [data[neigh]['p_tree']
-            #       for neigh in DG.successors(node)])
-            p_tree_candidates = \
-                [data[neigh]['p_tree']
-                 for neigh in DG.successors(node)
-                 if data[neigh]['p_tree'] is not None and
-                    data[neigh]['post'] < data[node]['min']] + \
-                [neigh
-                 for neigh in DG.successors(node)
-                 if data[neigh]['post'] < data[node]['min']]
-            if p_tree_candidates:
-                data[node]['p_tree'] = max(
-                    p_tree_candidates,
-                    key=lambda n: data[n]['post'] - data[n]['min']
-                )
-                # print("p_tree[%s]: %r" % (node, data[node]['p_tree']))
+# %% ../../07_interval_labels.ipynb 99
+def _dfs_labels_of_new_nodes(successors, new_nodes, old_labels, start=0):
+    """DFS-derived labels of new nodes, continuing DFS of old nodes, as a dict of lists
+
+    The `successors` parameter is a function returning list of successors
+    of a node, `old_labels` is a function returning (min, post, f_min)
+    of old node, and `start` is the largest post-order number used.
+    """
+    new_set = set(new_nodes)
+    labels = {}
+    pos = start
+
+    def label(node):
+        return labels[node] if node in new_set else old_labels(node)
+
+    for root in new_nodes:
+        if root in labels:
+            continue
+        labels[root] = [0, 0, 0]
+        stack = [(root, iter(successors(root)))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neigh in neighbors:
+                if neigh in new_set and neigh not in labels:
+                    labels[neigh] = [0, 0, 0]
+                    stack.append((neigh, iter(successors(neigh))))
+                    break
             else:
-                data[node]['p_tree'] = None
+                # all successors of node are finished, finish node
+                stack.pop()
+                pos += 1
+                node_label = labels[node]
+                node_label[1] = pos
+                succ = successors(node)
+                # the first finished child in DFS tree has the lowest 'min'
+                if node_label[0] == 0:
+                    node_label[0] = pos
+                # extend interval by adjacent intervals of successors
+                for neigh_label in sorted((label(neigh) for neigh in succ),
+                                          key=lambda l: l[1], reverse=True):
+                    if neigh_label[1] == node_label[0] - 1:
+                        node_label[0] = neigh_label[0]
+                if stack and labels[stack[-1][0]][0] == 0:
+                    labels[stack[-1][0]][0] = node_label[0]
+                node_label[2] = min([pos] + [label(neigh)[2] for neigh in succ])
+
+    return labels
+
+
+def update_dfs_intervals_extra(DG, data, new_nodes):
+    """Find DFS-derived data of new vertices added to graph G, given data of old vertices
+
+    The depth-first search is continued from new vertices, in the order
+    given, after all old vertices, so data of old vertices do not change,
+    and new vertices get post-order numbers after all old vertices.
+    This takes time proportional to the number of new vertices and their
+    edges.  New vertices can be added only together with edges from them
+    to old vertices or to other new vertices.
+
+    Min-post intervals of new vertices are extended by intervals of their
+    successors that end just before them, so that a commit added on top of
+    an old commit has interval including the interval of that old commit.
+    Because of that, intervals can be larger than in DFS spanning tree;
+    all nodes in the interval are still reachable from the given node.
+
+    Only the min-post interval and 'f_min' are supported, that is the data
+    computed by `find_dfs_intervals_extra()` with `extra=False`.
+
+    Parameters:
+    -----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph, with new vertices already added.
+
+    data : dict of dicts or NumPy structured array
+        DFS-derived data of old vertices, for example the result of
+        `find_dfs_intervals_extra()` for the graph before adding new
+        vertices.  For NetworkX DiGraph this dict is updated in place.
 
-        # print("\n")
+    new_nodes : iterable
+        Vertices added to the graph.  For CSRGraph they must be all node
+        identifiers from len(data) onwards.
 
+    Returns:
+    --------
+    dict of dicts
+        Dictionary, where keys are node indices, and values are dictionaries
+        with 'min', 'post' and 'f_min' keys, i.e. updated `data`; for
+        CSRGraph it is a new NumPy structured array indexed by node identifier.
+    """
+    if isinstance(DG, CSRGraph):
+        if data.dtype.names != ('min', 'post', 'f_min'):
+            raise ValueError("only 'min', 'post' and 'f_min' data can be updated")
+        new_nodes = [int(node) for node in new_nodes]
+        if sorted(new_nodes) != list(range(len(data), DG.number_of_nodes())):
+            raise ValueError("new nodes of CSRGraph must be all nodes from {:d} onwards".format(len(data)))
+        labels = _dfs_labels_of_new_nodes(lambda u: DG.successors(u).tolist(), new_nodes,
+                                          lambda u: data[u].tolist(), start=len(data))
+        new_data = np.empty(len(labels), dtype=data.dtype)
+        new_data[:] = [tuple(labels[u]) for u in range(len(data), DG.number_of_nodes())]
+        return np.concatenate([data, new_data])
+
+    new_nodes = list(new_nodes)
+    if new_nodes and data and set(next(iter(data.values()))) != {'min', 'post', 'f_min'}:
+        raise ValueError("only 'min', 'post' and 'f_min' data can be updated")
+    labels = _dfs_labels_of_new_nodes(lambda u: list(DG.successors(u)), new_nodes,
+                                      lambda u: (data[u]['min'], data[u]['post'], data[u]['f_min']),
+                                      start=len(data))
+    for node, (d_min, d_post, f_min) in labels.items():
+        data[node] = {'post': d_post, 'min': d_min, 'f_min': f_min}
     return data
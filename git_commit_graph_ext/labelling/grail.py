@@ -0,0 +1,148 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07b_grail.ipynb.
+
+# %% auto 0
+__all__ = ['find_grail_intervals']
+
+# %% ../../07b_grail.ipynb 6
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs
+
+# %% ../../07b_grail.ipynb 8
+def _grail_traversal(offsets, parents, seed):
+    """Compute one GRAIL interval of all vertices with randomized DFS
+
+    Parameters
+    ----------
+    offsets, parents : numpy.ndarray
+        CSR arrays of the graph, see `CSRGraph`.
+
+    seed : int
+        Seed for the random order of roots and of successors.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (N, 2) array of int32 indexed by node identifier, with the lowest
+        post-order rank of reachable vertices and the post-order rank (from 1)
+        of the vertex itself as columns.
+    """
+    n = len(offsets) - 1
+    rng = random.Random(seed)
+    low = np.zeros(n, dtype=np.int32)
+    post = np.zeros(n, dtype=np.int32)
+    # fast scalar access to arrays
+    offsets, parents = memoryview(offsets), memoryview(parents)
+    low_mv, post_mv = memoryview(low), memoryview(post)
+
+    def shuffled_successors(node):
+        succ = list(parents[offsets[node]:offsets[node + 1]])
+        rng.shuffle(succ)
+        return succ
+
+    roots = np.flatnonzero(np.bincount(parents, minlength=n) == 0).tolist()
+    rng.shuffle(roots)
+    visited = bytearray(n)
+    pos = 0
+    for root in roots:
+        visited[root] = 1
+        stack = [(root, shuffled_successors(root))]
+        while stack:
+            node, succ = stack[-1]
+            if succ:
+                # visit next successor, if not visited yet
+                neigh = succ.pop()
+                if not visited[neigh]:
+                    visited[neigh] = 1
+                    stack.append((neigh, shuffled_successors(neigh)))
+                continue
+
+            # all successors of node are finished, finish node
+            stack.pop()
+            pos += 1
+            post_mv[node] = pos
+            low_mv[node] = min([pos] + [low_mv[neigh] for neigh in
+                                        parents[offsets[node]:offsets[node + 1]]])
+
+    return np.column_stack((low, post))
+
+# %% ../../07b_grail.ipynb 9
+def find_grail_intervals(DG, k=5, seed=None, n_jobs=None, check_acyclic=True):
+    """Find GRAIL labels (k randomized graph intervals) of all vertices in graph G
+
+    Each of the k labels of vertex 'u' is an interval [low_u, post_u], where
+    post_u is the rank of 'u' in the post-order of randomized depth-first
+    traversal of the graph (ranks begin at 1), and low_u is the lowest rank
+    of any vertex reachable from 'u' (including 'u').  If v is reachable
+    from u, then each interval of v is contained in the respective interval
+    of u; if it is not so for any of the k intervals, v is not reachable.
+
+    Traversals are computed in parallel, in a pool of worker processes.
+
+    References:
+    -----------
+    [1] Hilmi Yıldırım, Vineet Chaoji, Mohammed J. Zaki "GRAIL: Scalable
+        Reachability Index for Large Graphs" (2010) Proceedings of the VLDB
+        Endowment 3(1-2), pp. 276-284
+        https://doi.org/10.14778/1920841.1920879
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    k : int, optional (default=5)
+        Number of randomized traversals, that is number of intervals per
+        vertex; larger k gives larger labels, but better pruning.
+
+    seed : int or None, optional (default=None)
+        Seed for the random number generator, for reproducible labels.
+        With the same seed, labels for smaller k are the first intervals
+        of labels for larger k.
+
+    n_jobs : int or None, optional (default=None)
+        Number of worker processes; None means the number of processors,
+        but no more than k.  With n_jobs=1 no processes are created.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict of lists of two-element lists of ints
+        Dictionary, where keys are node indices, and values are lists of k
+        intervals (two element lists of integers); for CSRGraph it is
+        an (N, k, 2) array of ints indexed by node identifier
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "GRAIL labels are not defined on undirected graphs.")
+    if k < 1:
+        raise ValueError("number of traversals k must be positive, got {!r}".format(k))
+
+    G = DG if isinstance(DG, CSRGraph) else CSRGraph.from_networkx(DG)
+    if check_acyclic and not _csr_dfs(G)[2]:
+        raise nx.NetworkXNotImplemented(
+            "GRAIL labels are not defined on directed graphs with loops")
+
+    seeds = np.random.RandomState(seed).randint(0, 2**31 - 1, size=k).tolist()
+    if n_jobs is None:
+        n_jobs = min(k, os.cpu_count() or 1)
+    if n_jobs == 1:
+        intervals = [_grail_traversal(G.offsets, G.parents, s) for s in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            intervals = list(executor.map(_grail_traversal,
+                                          repeat(G.offsets), repeat(G.parents), seeds))
+    labels = np.stack(intervals, axis=1)
+
+    if isinstance(DG, CSRGraph):
+        return labels
+    return dict(zip(G.oids, labels.tolist()))
@@ -0,0 +1,146 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07d_landmarks.ipynb.
+
+# %% auto 0
+__all__ = ['find_landmark_labels']
+
+# %% ../../07d_landmarks.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs, _first_parent_chains
+from .levels import find_levels
+
+# %% ../../07d_landmarks.ipynb 8
+_LANDMARK_ORDERS = ('degree', 'level', 'first-parent')
+
+
+def _trailing_zeros(values):
+    """Number of trailing zero bits of each of positive integers in array"""
+    values = np.asarray(values, dtype=np.int64)
+    return np.log2(values & -values).astype(np.int32)
+
+
+def _landmark_order(G, order='level'):
+    """Order nodes of CSRGraph G by importance as landmarks, as an int32 array"""
+    degree = (G.in_degree().astype(np.int64) + 1) * (G.out_degree() + 1)
+    if order == 'degree':
+        keys = (-degree,)
+    elif order == 'level':
+        level = find_levels(G)
+        keys = (-degree, -_trailing_zeros(level + 1))
+    elif order == 'first-parent':
+        chain, position = _first_parent_chains(G)
+        chain_length = np.bincount(chain)[chain]
+        keys = (-chain_length, -_trailing_zeros(position + 1))
+    else:
+        raise ValueError("unknown landmark order {!r}, expected one of: {}".format(
+            order, ', '.join(_LANDMARK_ORDERS)))
+    # np.lexsort sorts by the last key first; it is a stable sort
+    return np.lexsort(keys).astype(np.int32)
+
+# %% ../../07d_landmarks.ipynb 10
+def _labels_to_csr(labels):
+    """Convert list of lists of ints into (offsets, values) int32 arrays"""
+    offsets = np.zeros(len(labels) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(label) for label in labels])
+    values = np.fromiter((rank for label in labels for rank in label),
+                         dtype=np.int32, count=int(offsets[-1]))
+    return offsets, values
+
+
+def _pruned_landmark_labels(G, landmarks):
+    """Compute pruned landmark labels of CSRGraph G, for given order of landmarks"""
+    n = G.number_of_nodes()
+    offsets, parents = G.offsets.tolist(), G.parents.tolist()
+    child_offsets, children = (a.tolist() for a in G.reverse_arrays())
+    L_out = [[] for _ in range(n)]
+    L_in = [[] for _ in range(n)]
+    # adjacency to search, labels of the landmark used for pruning, labels to extend
+    forward = (offsets, parents, L_out, L_in)
+    backward = (child_offsets, children, L_in, L_out)
+
+    mark = [0] * n
+    stamp = 0
+    for rank, k in enumerate(landmarks.tolist()):
+        for adj_offsets, adj, L_from, L_to in (forward, backward):
+            # forward: prune at w if r(k,w) is already answered by labels,
+            # backward: prune at w if r(w,k) is already answered by labels
+            hubs = set(L_from[k])
+            stamp += 1
+            mark[k] = stamp
+            stack = [k]
+            while stack:
+                w = stack.pop()
+                if not hubs.isdisjoint(L_to[w]):
+                    continue
+                L_to[w].append(rank)
+                for x in adj[adj_offsets[w]:adj_offsets[w + 1]]:
+                    if mark[x] != stamp:
+                        mark[x] = stamp
+                        stack.append(x)
+
+    return L_out, L_in
+
+# %% ../../07d_landmarks.ipynb 11
+def find_landmark_labels(DG, order='first-parent', check_acyclic=True):
+    """Find pruned landmark 2-hop reachability labels of all vertices in graph G
+
+    Each vertex 'u' gets two sorted lists of landmarks: L_out(u), landmarks
+    reachable from 'u', and L_in(u), landmarks from which 'u' is reachable,
+    such that v is reachable from u if and only if u = v or the intersection
+    of L_out(u) and L_in(v) is not empty.  Landmarks are represented by their
+    rank in the order of landmarks.
+
+    This is based on pruned landmark labelling from [1].
+
+    References:
+    -----------
+    [1] Yosuke Yano, Takuya Akiba, Yoichi Iwata, Yuichi Yoshida "Fast and
+        Scalable Reachability Queries on Graphs by Pruned Labeling with
+        Landmarks and Paths" (2013) In: Proc. 22nd ACM International
+        Conference on Information & Knowledge Management (CIKM)
+        https://doi.org/10.1145/2505515.2505724
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    order : str, optional (default='first-parent')
+        Order of landmarks, one of 'degree', 'level' or 'first-parent'.
+        The 'degree' order, good for general graphs, can give very large
+        labels for commit graphs with long chains.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict
+        Dictionary with 'landmarks' key, storing nodes in the order of
+        landmarks (node with rank 0 first), and 'out' and 'in' keys storing
+        L_out and L_in labels: dicts with nodes as keys and sorted lists of
+        landmark ranks as values; for CSRGraph landmarks are an int32 array
+        of node identifiers, and labels are (offsets, values) tuples of int32
+        arrays in the CSR format.
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "Landmark labels are not defined on undirected graphs.")
+
+    G = DG if isinstance(DG, CSRGraph) else CSRGraph.from_networkx(DG)
+    if check_acyclic and not _csr_dfs(G)[2]:
+        raise nx.NetworkXNotImplemented(
+            "Landmark labels are not defined on directed graphs with loops")
+
+    landmarks = _landmark_order(G, order=order)
+    L_out, L_in = _pruned_landmark_labels(G, landmarks)
+
+    if isinstance(DG, CSRGraph):
+        return {'landmarks': landmarks,
+                'out': _labels_to_csr(L_out),
+                'in': _labels_to_csr(L_in)}
+    return {'landmarks': [G.oids[k] for k in landmarks.tolist()],
+            'out': dict(zip(G.oids, L_out)),
+            'in': dict(zip(G.oids, L_in))}
@@ -1,13 +1,88 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../06_levels.ipynb.
 
 # %% auto 0
-__all__ = ['find_levels']
+__all__ = ['find_levels', 'update_levels']
 
 # %% ../../06_levels.ipynb 14
 import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph, _csr_dfs
 
 # %% ../../06_levels.ipynb 16
-def find_levels(DG, attr=None):
+def _find_levels_csr(G):
+  """Find levels of all vertices in CSRGraph G, as an int32 array"""
+  postorder, _, acyclic = _csr_dfs(G)
+  if not acyclic:
+    raise nx.NetworkXNotImplemented(
+      "Vertex level is not defined on directed graphs with loops")
+
+  offsets = G.offsets.tolist()
+  parents = G.parents.tolist()
+  lvl = [0] * G.number_of_nodes()
+  for node in postorder:
+    start, end = offsets[node], offsets[node + 1]
+    if start < end:
+      lvl[node] = max([lvl[neigh] for neigh in parents[start:end]]) + 1
+
+  return np.array(lvl, dtype=np.int32)
+
+# %% ../../06_levels.ipynb 18
+# frontiers up to this size are processed one node at a time
+_SMALL_FRONTIER = 64
+
+
+def _find_levels_frontier(G, check_acyclic=True):
+  """Find levels of all vertices in CSRGraph G layer by layer, as an int32 array"""
+  n = G.number_of_nodes()
+  child_offsets, children = G.reverse_arrays()
+  # number of successors with not yet computed level
+  remaining = G.out_degree().astype(np.int32)
+  lvl = np.zeros(n, dtype=np.int32)
+  # fast scalar access to the same memory, for narrow frontiers
+  child_offsets_mv, children_mv = memoryview(child_offsets), memoryview(children)
+  remaining_mv, lvl_mv = memoryview(remaining), memoryview(lvl)
+
+  processed = 0
+  level = 0
+  frontier = np.flatnonzero(remaining == 0).tolist()
+  while frontier:
+    processed += len(frontier)
+
+    if len(frontier) <= _SMALL_FRONTIER:
+      next_frontier = []
+      for node in frontier:
+        lvl_mv[node] = level
+        for pred in children_mv[child_offsets_mv[node]:child_offsets_mv[node + 1]]:
+          remaining_mv[pred] -= 1
+          if remaining_mv[pred] == 0:
+            next_frontier.append(pred)
+      frontier = next_frontier
+
+    else:
+      frontier = np.array(frontier, dtype=np.int32)
+      lvl[frontier] = level
+      # gather predecessors of all nodes in the frontier: indices into
+      # `children` are concatenated ranges [start, start+count)
+      starts = child_offsets[frontier]
+      counts = child_offsets[frontier + 1] - starts
+      total = int(counts.sum())
+      shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+      preds, decrements = np.unique(children[shifts + np.arange(total)], return_counts=True)
+
+      remaining[preds] -= decrements
+      frontier = preds[remaining[preds] == 0].tolist()
+
+    level += 1
+
+  if check_acyclic and processed != n:
+    raise nx.NetworkXNotImplemented(
+      "Vertex level is not defined on directed graphs with loops")
+
+  return lvl
+
+# %% ../../06_levels.ipynb 20
+def find_levels(DG, attr=None, check_acyclic=True, method=None):
   """Find levels (generation number) of all vertices in graph G
   
   The backward topological level of a vertex v, which we denote as l_v or l(v),
@@ -30,16 +105,28 @@ def find_levels(DG, attr=None):
   
   Parameters:
   -----------
-  DG : NetworkX DiGraph
+  DG : NetworkX DiGraph or CSRGraph
       Directed acyclic graph.
       
   attr : str, optional (default=None)
       If set, name of a node attribute under which store vertex level.
+      Not supported for CSRGraph.
+      
+  check_acyclic : bool, optional (default=True)
+      Whether to check that the graph is acyclic, and raise exception
+      if it is not.  Can be turned off for graphs known to be acyclic,
+      like commit graphs, to avoid the extra traversal of the graph.
+      
+  method : {'dfs', 'frontier'} or None, optional (default=None)
+      Whether to compute levels in DFS post-order, or layer by layer
+      (Kahn-style frontiers) with NumPy batch operations.  By default
+      'dfs' is used for NetworkX DiGraph, and 'frontier' for CSRGraph.
       
   Returns:
   --------
   dict of ints
-      Dictionary, where keys are node indices, and values are node levels
+      Dictionary, where keys are node indices, and values are node levels;
+      for CSRGraph it is an array of ints indexed by node identifier
   """
   lvl = {}
   
@@ -47,22 +134,115 @@ def find_levels(DG, attr=None):
   if not DG.is_directed():
     raise nx.NetworkXNotImplemented(
       "Vertex level is not defined on undirected graphs.")
-  if not nx.is_directed_acyclic_graph(DG):
-    raise nx.NetworkXNotImplemented(
-      "Vertex level is not defined on directed graphs with loops")
-  
-  # it can be any post-order ordering
-  nodelist = nx.dfs_postorder_nodes(DG)
-  for node in nodelist:
-    if DG.out_degree(node) == 0:
-      lvl[node] = 0
-      continue
-    
-    lvl[node] = max([lvl[neigh] 
-                     for neigh in DG.successors(node)]) + 1
+  if isinstance(DG, CSRGraph):
+    if attr is not None:
+      raise ValueError("CSRGraph does not support node attributes")
+    if method == 'dfs':
+      return _find_levels_csr(DG)
+    return _find_levels_frontier(DG, check_acyclic=check_acyclic)
+  if method == 'frontier':
+    G = CSRGraph.from_networkx(DG)
+    lvl = dict(zip(G.oids, _find_levels_frontier(G, check_acyclic=check_acyclic).tolist()))
+  else:
+    if check_acyclic and not nx.is_directed_acyclic_graph(DG):
+      raise nx.NetworkXNotImplemented(
+        "Vertex level is not defined on directed graphs with loops")
   
+    # it can be any post-order ordering
+    nodelist = nx.dfs_postorder_nodes(DG)
+    for node in nodelist:
+      if DG.out_degree(node) == 0:
+        lvl[node] = 0
+        continue
+      
+      lvl[node] = max([lvl[neigh] 
+                       for neigh in DG.successors(node)]) + 1
+
   if attr is not None:
     for node, level in lvl.items():
       DG.nodes[node][attr] = level
   
   return lvl
+
+# %% ../../06_levels.ipynb 36
+def _levels_of_new_nodes(successors, new_nodes, lvl):
+  """Levels of new nodes, in DFS post-order restricted to new nodes, as a dict
+
+  The `successors` parameter is a function returning list of successors
+  of a node, and `lvl` gives levels of old nodes.
+  """
+  new_set = set(new_nodes)
+  new_lvl = {}
+  # 1 = on the DFS stack, 2 = finished
+  state = {}
+  for root in new_nodes:
+    if root in state:
+      continue
+    state[root] = 1
+    stack = [(root, iter(successors(root)))]
+    while stack:
+      node, neighbors = stack[-1]
+      for neigh in neighbors:
+        if neigh not in new_set:
+          continue
+        if neigh not in state:
+          state[neigh] = 1
+          stack.append((neigh, iter(successors(neigh))))
+          break
+        if state[neigh] == 1:
+          raise nx.NetworkXNotImplemented(
+            "Vertex level is not defined on directed graphs with loops")
+      else:
+        stack.pop()
+        state[node] = 2
+        new_lvl[node] = max([new_lvl[neigh] if neigh in new_set else lvl[neigh]
+                             for neigh in successors(node)], default=-1) + 1
+
+  return new_lvl
+
+
+def update_levels(DG, lvl, new_nodes):
+  """Find levels of new vertices added to graph G, given levels of old vertices
+
+  New vertices, added together with edges from them to old vertices
+  or to other new vertices, do not change levels of old vertices, so only
+  levels of new vertices are computed, in time proportional to the number
+  of new vertices and their edges.  The result is the same as computing
+  levels of the whole graph with `find_levels()`.
+
+  Parameters:
+  -----------
+  DG : NetworkX DiGraph or CSRGraph
+      Directed acyclic graph, with new vertices already added.
+
+  lvl : dict of ints or array of ints
+      Levels of old vertices, for example result of `find_levels()` for
+      the graph before adding new vertices.  For NetworkX DiGraph this
+      dict is updated in place.
+
+  new_nodes : iterable
+      Vertices added to the graph.  For CSRGraph they must be all node
+      identifiers from len(lvl) onwards.
+
+  Returns:
+  --------
+  dict of ints
+      Dictionary, where keys are node indices, and values are node levels,
+      i.e. updated `lvl`; for CSRGraph it is a new array of ints indexed
+      by node identifier
+  """
+  if not DG.is_directed():
+    raise nx.NetworkXNotImplemented(
+      "Vertex level is not defined on undirected graphs.")
+  if isinstance(DG, CSRGraph):
+    new_nodes = [int(node) for node in new_nodes]
+    if sorted(new_nodes) != list(range(len(lvl), DG.number_of_nodes())):
+      raise ValueError("new nodes of CSRGraph must be all nodes from {:d} onwards".format(len(lvl)))
+    new_lvl = _levels_of_new_nodes(lambda u: DG.successors(u).tolist(), new_nodes, lvl)
+    lvl = np.concatenate([np.asarray(lvl, dtype=np.int32), np.zeros(len(new_nodes), dtype=np.int32)])
+    lvl[list(new_lvl)] = list(new_lvl.values())
+    return lvl
+
+  new_lvl = _levels_of_new_nodes(lambda u: list(DG.successors(u)), list(new_nodes), lvl)
+  lvl.update(new_lvl)
+  return lvl
@@ -0,0 +1,142 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../07c_preach.ipynb.
+
+# %% auto 0
+__all__ = ['find_contraction_ranks', 'find_preach_index']
+
+# %% ../../07c_preach.ipynb 6
+import networkx as nx
+import numpy as np
+
+from ..csr_graph import CSRGraph
+from .dfs_intervals import find_dfs_intervals_extra
+
+# %% ../../07c_preach.ipynb 8
+def _contraction_ranks(G, check_acyclic=True):
+    """Find contraction ranks of all vertices of CSRGraph G, as an int32 array"""
+    n = G.number_of_nodes()
+    offsets, parents = memoryview(G.offsets), memoryview(G.parents)
+    child_offsets, children = (memoryview(a) for a in G.reverse_arrays())
+    # number of not yet contracted successors and predecessors
+    out_degree = G.out_degree().astype(np.int32)
+    in_degree = G.in_degree().astype(np.int32)
+    rank = np.full(n, -1, dtype=np.int32)
+    out_degree_mv, in_degree_mv, rank_mv = \
+        memoryview(out_degree), memoryview(in_degree), memoryview(rank)
+
+    sinks = np.flatnonzero(out_degree == 0).tolist()
+    sources = np.flatnonzero((in_degree == 0) & (out_degree > 0)).tolist()
+    contracted = 0
+    r = 0
+    while sinks or sources:
+        contracted += len(sinks) + len(sources)
+        for node in sinks:
+            rank_mv[node] = 2 * r
+        for node in sources:
+            rank_mv[node] = 2 * r + 1
+
+        next_sinks = []
+        for node in sinks:
+            for pred in children[child_offsets[node]:child_offsets[node + 1]]:
+                if rank_mv[pred] < 0:
+                    out_degree_mv[pred] -= 1
+                    if out_degree_mv[pred] == 0:
+                        next_sinks.append(pred)
+        next_sources = []
+        for node in sources:
+            for succ in parents[offsets[node]:offsets[node + 1]]:
+                if rank_mv[succ] < 0:
+                    in_degree_mv[succ] -= 1
+                    # vertex which is both sink and source is contracted as sink
+                    if in_degree_mv[succ] == 0 and out_degree_mv[succ] > 0:
+                        next_sources.append(succ)
+        sinks, sources = next_sinks, next_sources
+        r += 1
+
+    if check_acyclic and contracted != n:
+        raise nx.NetworkXNotImplemented(
+            "PReaCH index is not defined on directed graphs with loops")
+
+    return rank
+
+# %% ../../07c_preach.ipynb 9
+def find_contraction_ranks(DG, check_acyclic=True):
+    """Find contraction hierarchy ranks of all vertices in graph G
+
+    Vertices are contracted in rounds; in each round all sinks of the
+    remaining graph are contracted first, and then all its sources, so no
+    shortcut edges are needed.  Sinks contracted in round r get rank 2r,
+    and sources get rank 2r+1, so that ranks along any path first increase
+    and then decrease.
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict of ints
+        Dictionary, where keys are node indices, and values are contraction
+        ranks; for CSRGraph it is an array of int32 indexed by node identifier
+    """
+    if not DG.is_directed():
+        raise nx.NetworkXNotImplemented(
+            "PReaCH index is not defined on undirected graphs.")
+
+    if isinstance(DG, CSRGraph):
+        return _contraction_ranks(DG, check_acyclic=check_acyclic)
+
+    G = CSRGraph.from_networkx(DG)
+    return dict(zip(G.oids, _contraction_ranks(G, check_acyclic=check_acyclic).tolist()))
+
+# %% ../../07c_preach.ipynb 10
+def find_preach_index(DG, check_acyclic=True):
+    """Find PReaCH reachability index of graph G
+
+    The index consists of contraction hierarchy ranks, and DFS-derived
+    data (min-post intervals with PReaCH extensions) for the graph and for
+    the graph with reversed edges.  It is used by `preach_is_reachable()`.
+
+    References:
+    -----------
+    [1] Florian Merz, Peter Sanders "PReaCH: A Fast Lightweight
+        Reachability Index using Pruning and Contraction Hierarchies" (2014)
+        In: Schulz A.S., Wagner D. (eds) Algorithms - ESA 2014. ESA 2014.
+        Lecture Notes in Computer Science, vol 8737. Springer, Berlin,
+        Heidelberg (Conference Paper: European Symposium on Algorithms)
+        https://doi.org/10.1007/978-3-662-44777-2_58
+        http://arxiv.org/abs/1404.4465
+
+    Parameters
+    ----------
+    DG : NetworkX DiGraph or CSRGraph
+        Directed acyclic graph.
+
+    check_acyclic : bool, optional (default=True)
+        Whether to check that the graph is acyclic, and raise exception
+        if it is not.
+
+    Returns
+    -------
+    dict
+        Dictionary with contraction ranks under 'rank' key (result of
+        `find_contraction_ranks()`), and DFS-derived data for forward
+        search under 'fwd' key and for backward search under 'bwd' key
+        (results of `find_dfs_intervals_extra(..., extra=True)`).
+    """
+    rank = find_contraction_ranks(DG, check_acyclic=check_acyclic)
+    if isinstance(DG, CSRGraph):
+        child_offsets, children = DG.reverse_arrays()
+        reverse = CSRGraph(child_offsets, children, oids=DG.oids)
+    else:
+        reverse = DG.reverse(copy=False)
+
+    return {
+        'rank': rank,
+        'fwd': find_dfs_intervals_extra(DG, extra=True),
+        'bwd': find_dfs_intervals_extra(reverse, extra=True),
+    }
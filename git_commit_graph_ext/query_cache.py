@@ -0,0 +1,235 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../08a_query_cache.ipynb.
+
+# %% auto 0
+__all__ = ['ReachabilityCache']
+
+# %% ../08a_query_cache.ipynb 5
+from collections import OrderedDict
+
+from .reachability import generic_is_reachable_bfs
+
+# %% ../08a_query_cache.ipynb 6
+class ReachabilityCache:
+    """Bounded cache of answers to reachability queries on graph DG
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph; it can grow (nodes can be added) while
+        the cache is used, which invalidates the cache.  The graph can
+        also be replaced with `update()`.
+
+    query : callable, optional (default=generic_is_reachable_bfs)
+        Reachability query function, called as
+        `query(DG, u, v, stats=stats, **labels)`.
+
+    maxsize : int, optional (default=100000)
+        Maximum number of cached entries, both answers and facts.
+
+    policy : {'lru', 'lfu'}, optional (default='lru')
+        Which entries to evict when the cache is full: the least recently
+        used ones, or the least frequently used ones.
+
+    max_facts : int, optional (default=64)
+        Maximum number of facts found by the walk to store for each query;
+        0 stores only answers to the queries themselves.
+
+    **labels
+        Reachability labels passed to the query function, for example
+        `l=find_levels(DG)` or `II=find_dfs_intervals_extra(DG)`.  They
+        have to be updated together with the graph, e.g. with
+        `update_reachability_labels()`, and passed to `update()` if the
+        updated labels are new objects.
+
+    Attributes
+    ----------
+    stats : dict
+        Counters: 'hits' (answers found in cache), 'fact_hits' (answers
+        found among facts stored by earlier walks), 'misses', 'evictions'
+        and 'invalidations'.
+    """
+
+    def __init__(self, DG, query=generic_is_reachable_bfs, maxsize=100000,
+                 policy='lru', max_facts=64, **labels):
+        if policy not in ('lru', 'lfu'):
+            raise ValueError("Unknown cache policy '{}', expected 'lru' or 'lfu'".format(policy))
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.DG = DG
+        self.query = query
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_facts = max_facts
+        self.labels = labels
+        self.stats = {'hits': 0, 'fact_hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        # number of calls to update(), part of the version
+        self._updates = 0
+        self.version = self.graph_version()
+        self.clear()
+
+    def __repr__(self):
+        return '<{} {} of {:d}/{:d} entries, hit rate {:.3f}>'.format(
+            self.__class__.__name__, self.policy.upper(), len(self), self.maxsize, self.hit_rate())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def graph_version(self):
+        """Version of the graph, which changes when nodes are added, or on `update()`"""
+        return self._updates, self.DG.number_of_nodes()
+
+    def update(self, DG=None, **labels):
+        """Use updated graph and reachability labels, invalidating the cache
+
+        Labels updated by `update_reachability_labels()` are new objects
+        for `CSRGraph` (NumPy arrays), or after recomputing them from scratch,
+        and queries would use stale labels without this call.
+
+        Parameters
+        ----------
+        DG : NetworkX digraph or CSRGraph, optional (default=None)
+            New graph, for example rebuilt after full rescan of the
+            repository; by default the current graph is kept.
+
+        **labels
+            New values of reachability labels passed to the query
+            function; labels not given are kept.
+        """
+        if DG is not None:
+            self.DG = DG
+        self.labels.update(labels)
+        self._updates += 1
+        self._check_version()
+
+    def hit_rate(self):
+        """Fraction of queries answered from the cache, including facts"""
+        hits = self.stats['hits'] + self.stats['fact_hits']
+        total = hits + self.stats['misses']
+        return hits / total if total > 0 else 0.0
+
+    def clear(self):
+        """Drop all cached entries, keeping counters"""
+        # key -> [answer, whether it is fact found by walk, frequency]
+        self._entries = {}
+        # LRU: keys in order of use; LFU: keys with given frequency, in order of use
+        self._order = OrderedDict()
+        self._buckets = {}
+        self._min_freq = 0
+
+    def _check_version(self):
+        version = self.graph_version()
+        if version != self.version:
+            self.version = version
+            self.stats['invalidations'] += 1
+            self.clear()
+
+    def _touch(self, key, entry):
+        if self.policy == 'lru':
+            self._order.move_to_end(key)
+            return
+        freq = entry[2]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        entry[2] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def _coldest(self):
+        """Key of the entry to evict first"""
+        if self.policy == 'lru':
+            return next(iter(self._order))
+        return next(iter(self._buckets[self._min_freq]))
+
+    def _evict(self):
+        key = self._coldest()
+        if self.policy == 'lru':
+            del self._order[key]
+        else:
+            bucket = self._buckets[self._min_freq]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[self._min_freq]
+                self._min_freq = min(self._buckets, default=0)
+        del self._entries[key]
+        self.stats['evictions'] += 1
+
+    def _put(self, key, answer, fact):
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not fact:
+                # the answer to the query itself is no longer just a fact
+                entry[1] = False
+                self._touch(key, entry)
+            return
+        if len(self._entries) >= self.maxsize:
+            # facts may only replace other facts
+            if fact and not self._entries[self._coldest()][1]:
+                return
+            self._evict()
+        # facts not used yet are the first to be evicted: they are put
+        # at the least recently used end, or with frequency 0
+        freq = 0 if fact else 1
+        self._entries[key] = [answer, fact, freq]
+        if self.policy == 'lru':
+            self._order[key] = None
+            if fact:
+                self._order.move_to_end(key, last=False)
+        else:
+            self._buckets.setdefault(freq, OrderedDict())[key] = None
+            self._min_freq = min(self._min_freq, freq) if len(self._entries) > 1 else freq
+
+    def _walk_facts(self, u, v, answer, stats):
+        """Facts r(x,y) found by the walk answering r(u,v), as ((x, y), answer) pairs"""
+        forward = stats.get('walk', []) + stats.get('forward', [])
+        for x in stats.get('path', []) + stats.get('backward', []):
+            yield (x, v), True
+        for cut, nodes in stats.get('negative-cut', {}).items():
+            # 'visited' lists nodes seen again, not nodes excluded by a cut
+            if cut != 'visited':
+                for w in nodes:
+                    yield (w, v), False
+        for x in forward:
+            yield (u, x), True
+            if not answer:
+                yield (x, v), False
+
+    def is_reachable(self, u, v):
+        """Whether $v$ is reachable from $u$, answered from cache if possible
+
+        Parameters
+        ----------
+        u : node
+            Source node.
+
+        v : node
+            Target node.
+
+        Returns
+        -------
+        r(u,v) : bool
+            Whether v is reachable from u
+        """
+        self._check_version()
+        key = (self.version, u, v)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.stats['fact_hits' if entry[1] else 'hits'] += 1
+            self._touch(key, entry)
+            return entry[0]
+
+        self.stats['misses'] += 1
+        stats = {}
+        answer = bool(self.query(self.DG, u, v, stats=stats, **self.labels))
+        if self.max_facts > 0:
+            recorded = 0
+            for (x, y), fact in self._walk_facts(u, v, answer, stats):
+                if recorded >= self.max_facts:
+                    break
+                if x != y and (x, y) != (u, v):
+                    self._put((self.version, x, y), fact, fact=True)
+                    recorded += 1
+        self._put(key, answer, fact=False)
+        return answer
@@ -2,12 +2,56 @@
 
 # %% auto 0
 __all__ = ['generic_is_reachable', 'generic_is_reachable_dfs', 'reachable_positive_cut', 'reachable_negative_cut',
-           'walk_spanning', 'generic_is_reachable_bfs']
+           'walk_spanning', 'generic_is_reachable_bfs', 'preach_is_reachable', 'landmark_is_reachable',
+           'bitmap_is_reachable', 'bitmap_count_reachable', 'chain_is_reachable', 'batch_is_reachable',
+           'generic_is_reachable_bidir', 'generic_is_reachable_heap', 'merge_bases', 'ahead_behind', 'tips_contain']
 
 # %% ../08_reach.ipynb 4
 from collections import deque
 
-# %% ../08_reach.ipynb 9
+import numpy as np
+
+# %% ../08_reach.ipynb 6
+def _has_labels(labels):
+    """Whether labels (dict, list or NumPy array) were given and are not empty"""
+    return labels is not None and len(labels) > 0
+
+
+def _is_dfs_extra(II, u):
+    """Whether II is result of `find_dfs_intervals_extra()`, not of `find_dfs_intervals()`"""
+    if isinstance(II, np.ndarray):
+        return II.dtype.names is not None
+    return isinstance(II[u], dict)
+
+
+def _has_label_field(II, u, field):
+    """Whether `find_dfs_intervals_extra()` data II includes given field"""
+    if isinstance(II, np.ndarray):
+        return field in II.dtype.names
+    return field in II[u]
+
+
+def _label_field(II, u, field):
+    """Value of `find_dfs_intervals_extra()` data field, with -1 in arrays as None"""
+    value = II[u][field]
+    if isinstance(II, np.ndarray) and value < 0:
+        return None
+    return value
+
+
+def _bits_subset(bits, a, b):
+    """Whether Bloom filter bits[a] is a subset of bits[b] (ints, or rows of uint64 words)"""
+    if isinstance(bits, np.ndarray):
+        return not np.any(bits[a] & ~bits[b])
+    return bits[a] & ~bits[b] == 0
+
+
+def _grail_excludes(grail, u, v):
+    """Whether some GRAIL interval of v is not contained in that of u, i.e. ¬r(u,v)"""
+    return any(v_low < u_low or v_post > u_post
+               for (u_low, u_post), (v_low, v_post) in zip(grail[u], grail[v]))
+
+# %% ../08_reach.ipynb 11
 def generic_is_reachable(DG, u, v,
                          II=None, l=None,
                          stats=None, verbose=None):
@@ -23,7 +67,7 @@ def generic_is_reachable(DG, u, v,
   
     Parameters
     ----------
-    DG : NetworkX digraph
+    DG : NetworkX digraph or CSRGraph
          Directed acyclic graph.
   
     u : node
@@ -74,7 +118,7 @@ def generic_is_reachable(DG, u, v,
 
     # II_v ⊆ II_u <=> π(v) ∈ II_u (positive cut)
     # II_v = [min_{w∈T_v}(π(w)),π(v)]
-    if II and II[u][0] <= II[v][1] <= II[u][1]:
+    if _has_labels(II) and II[u][0] <= II[v][1] <= II[u][1]:
         if verbose:
             print('%s->%s min-post resolved %s ∈ %r ⊆ %r' %
                   (u, v, II[v][1], II[v], II[u]))
@@ -84,12 +128,12 @@ def generic_is_reachable(DG, u, v,
 
     # debugging
     if verbose:
-        if l and not l[v] < l[u]:
+        if _has_labels(l) and not l[v] < l[u]:
             print('%s->%s level cut ¬%d < %d' %
                   (u, v, l[v], l[u]))
 
     # l_v < l_u (no negative cut)
-    if (l and l[v] < l[u]) or (not l):
+    if (_has_labels(l) and l[v] < l[u]) or (not _has_labels(l)):
         # debugging
         if verbose:
             print('%s->%r' % (u, list(DG.successors(u))))
@@ -114,15 +158,15 @@ def generic_is_reachable(DG, u, v,
     else:
         # negative cut, but which one
         if isinstance(stats, dict):
-            if l and not l[v] < l[u]:
+            if _has_labels(l) and not l[v] < l[u]:
                 stats['level'].append(u)
 
     return False
 
-# %% ../08_reach.ipynb 19
+# %% ../08_reach.ipynb 21
 def generic_is_reachable_dfs(DG, u, v,
-                             II=None, l=None,
-                             stats=None):
+                             II=None, l=None, cdate=None, fel=None, grail=None,
+                             bfl=None, stats=None):
     """Whether in large graph DG $v$ is reachable from $u$, utilizing given indices
   
     Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
@@ -133,7 +177,7 @@ def generic_is_reachable_dfs(DG, u, v,
   
     Parameters
     ----------
-    DG : NetworkX digraph
+    DG : NetworkX digraph or CSRGraph
          Directed acyclic graph.
   
     u : node
@@ -152,12 +196,36 @@ def generic_is_reachable_dfs(DG, u, v,
         (vertex level is also known as generation number), e.g. result of
         find_levels().
   
+    cdate : dict or None, optional (default=None)
+        A dictionary with nodes as keys and corrected commit dates as values
+        (generation number v2), e.g. result of find_corrected_dates().
+  
+    fel : dict or None, optional (default=None)
+        A dictionary with nodes as keys and FELINE index (X, Y) coordinates
+        as values (2-element lists), e.g. result of find_feline_index().
+  
+    grail : dict or None, optional (default=None)
+        A dictionary with nodes as keys and lists of k GRAIL intervals
+        as values, e.g. result of find_grail_intervals().
+  
+    bfl : dict or None, optional (default=None)
+        A dictionary with 'out' and 'in' keys, storing Bloom filters of
+        descendants and ancestors, e.g. result of find_bloom_filter_labels().
+  
     stats : dict or None, optional (default=None)
         A dictionary gathering statistics about calls.  Currently supported
         are:
          * 'access' key, counting the number of intermediate vertices it
            checks / accesses.
          * 'level-filter' key, storing nodes that level index stopped searching at
+         * 'cdate-filter' key, storing nodes that corrected commit dates
+           stopped searching at
+         * 'feline-filter' key, storing nodes that FELINE index
+           stopped searching at
+         * 'grail-filter' key, storing nodes that GRAIL intervals
+           stopped searching at
+         * 'bfl-filter' key, storing nodes that Bloom filter labels
+           stopped searching at
          * 'walk' key, storing all walked nodes
          * 'min-post' key, storing node where min-post filter found reachable
          * 'max-depth' key, with maximum stack depth
@@ -170,8 +238,16 @@ def generic_is_reachable_dfs(DG, u, v,
     # initialize stats
     if isinstance(stats, dict):
         stats['access'] = 0
-        if l:
+        if _has_labels(l):
             stats['level-filter'] = []
+        if _has_labels(cdate):
+            stats['cdate-filter'] = []
+        if _has_labels(fel):
+            stats['feline-filter'] = []
+        if _has_labels(grail):
+            stats['grail-filter'] = []
+        if _has_labels(bfl):
+            stats['bfl-filter'] = []
         stats['walk'] = []
         stats['max-depth'] = 0
         stats['visited-filter'] = 0
@@ -194,13 +270,23 @@ def generic_is_reachable_dfs(DG, u, v,
 
         # II_v ⊆ II_u <=> π(v) ∈ II_u (positive cut)
         # II_v = [min_{w∈T_v}(π(w)), π(v)]
-        if II and II[u][0] <= II[v][1] <= II[u][1]:
+        if _has_labels(II) and II[u][0] <= II[v][1] <= II[u][1]:
             if isinstance(stats, dict):
                 stats['min-post'] = u
             return True
 
-        # l_v < l_u (no negative cut; note: u != v)
-        if (l and l[v] < l[u]) or (not l):
+        # l_v < l_u and d'_v < d'_u (no negative cut; note: u != v)
+        level_cut = _has_labels(l) and not l[v] < l[u]
+        cdate_cut = _has_labels(cdate) and not cdate[v] < cdate[u]
+        # X_u < X_v and Y_u < Y_v (u dominates v in FELINE index)
+        feline_cut = _has_labels(fel) and \
+            not (fel[u][0] < fel[v][0] and fel[u][1] < fel[v][1])
+        # L_v ⊆ L_u for each of GRAIL intervals
+        grail_cut = _has_labels(grail) and _grail_excludes(grail, u, v)
+        # L_out(v) ⊆ L_out(u) and L_in(u) ⊆ L_in(v) for Bloom filters
+        bfl_cut = _has_labels(bfl) and \
+            not (_bits_subset(bfl['out'], v, u) and _bits_subset(bfl['in'], u, v))
+        if not (level_cut or cdate_cut or feline_cut or grail_cut or bfl_cut):
 
             # TODO: sort successors
             for w in DG.successors(u):
@@ -217,8 +303,16 @@ def generic_is_reachable_dfs(DG, u, v,
         else:
             # negative cut, but which one
             if isinstance(stats, dict):
-                if l and not l[v] < l[u]:
+                if level_cut:
                     stats['level-filter'].append(u)
+                if cdate_cut:
+                    stats['cdate-filter'].append(u)
+                if feline_cut:
+                    stats['feline-filter'].append(u)
+                if grail_cut:
+                    stats['grail-filter'].append(u)
+                if bfl_cut:
+                    stats['bfl-filter'].append(u)
 
         # next iteration
         if stack:
@@ -231,7 +325,7 @@ def generic_is_reachable_dfs(DG, u, v,
     # haven't found v
     return False
 
-# %% ../08_reach.ipynb 24
+# %% ../08_reach.ipynb 26
 def reachable_positive_cut(u, v,
                            II=None,
                            stats=None):
@@ -255,8 +349,6 @@ def reachable_positive_cut(u, v,
         (2-element lists, representing intervals), e.g. result of
         `find_dfs_intervals()`.
 
-        TODO:
-        -----
         Or a dictionary with nodes as keys and dict describing DFS-derived
         info, with keys such as 'min' and 'post' describing min-post interval,
         and 'f_min', 'f_gap' and 'p_tree' - like in PReaCH paper; e.g result
@@ -273,11 +365,11 @@ def reachable_positive_cut(u, v,
     if stats is None:
         stats = {}
     # no data to indicate that v is reachable from u
-    if not II:
+    if not _has_labels(II):
         return False
 
     # find_dfs_intervals() case
-    if isinstance(II[u], list):
+    if not _is_dfs_extra(II, u):
         # II_v ⊆ II_u (positive cut)
         if II[u][0] <= II[v][1] <= II[u][1]:
             stats['positive-cut'] = {
@@ -297,24 +389,25 @@ def reachable_positive_cut(u, v,
             }
             return True
 
-        # elif II[u]['p_tree'] is not None:
-        #    p = II[u]['p_tree']
-        #    # r(u,p_tree) ∧ ϕ(v) ∈ range(p_tree)  ⇒  r(u,v)
-        #    if II[p]['min'] <= II[v]['post'] <= II[p]['post']:
-        #        stats['positive-cut'] = {
-        #            'type': 'min-post(p_tree)',
-        #            'p_tree': p,
-        #            'node': u
-        #        }
-        #        return True
+        elif _has_label_field(II, u, 'p_tree') and \
+                _label_field(II, u, 'p_tree') is not None:
+            p = _label_field(II, u, 'p_tree')
+            # r(u,p_tree) ∧ π(v) ∈ range(p_tree)  ⇒  r(u,v)
+            if II[p]['min'] <= II[v]['post'] <= II[p]['post']:
+                stats['positive-cut'] = {
+                    'type': 'min-post(p_tree)',
+                    'p_tree': p,
+                    'node': u
+                }
+                return True
 
     # no positive cut
     return False
 
 
 def reachable_negative_cut(u, v,
-                           II=None, l=None,
-                           stats=None):
+                           II=None, l=None, cdate=None, fel=None, grail=None,
+                           bfl=None, stats=None):
     """Whether given indices say that $v$ is not reachable from $u$
 
     Given (u, v) ∈ V², a negative cut happens if the index implies that
@@ -335,8 +428,6 @@ def reachable_negative_cut(u, v,
         (2-element lists, representing intervals), e.g. result of
         `find_dfs_intervals()`.
 
-        TODO:
-        -----
         Or a dictionary with nodes as keys and dict describing DFS-derived
         info, with keys such as 'min' and 'post' describing min-post interval,
         and 'f_min', 'f_gap' and 'p_tree' - like in PReaCH paper; e.g result
@@ -347,6 +438,22 @@ def reachable_negative_cut(u, v,
         (vertex level is also known as generation number), e.g. result of
         `find_levels()`.
 
+    cdate : dict or None, optional (default=None)
+        A dictionary with nodes as keys and corrected commit dates as values
+        (generation number v2), e.g. result of `find_corrected_dates()`.
+
+    fel : dict or None, optional (default=None)
+        A dictionary with nodes as keys and FELINE index (X, Y) coordinates
+        as values (2-element lists), e.g. result of `find_feline_index()`.
+
+    grail : dict or None, optional (default=None)
+        A dictionary with nodes as keys and lists of k GRAIL intervals
+        as values, e.g. result of `find_grail_intervals()`.
+
+    bfl : dict or None, optional (default=None)
+        A dictionary with 'out' and 'in' keys, storing Bloom filters of
+        descendants and ancestors, e.g. result of `find_bloom_filter_labels()`.
+
     stats : dict or None, optional (default=None)
         A dictionary gathering statistics about calls (negative cuts).
 
@@ -362,7 +469,7 @@ def reachable_negative_cut(u, v,
     result = False  # no negative cut
 
     # we can use levels filter
-    if l:
+    if _has_labels(l):
         # r(u,v)    ∧ u ≠ v  ⇒  l_v < l_u, thus
         # l_u ≤ l_v ∧ u ≠ v  ⇒  ¬r(u,v)
         if l[u] < l[v]:
@@ -373,11 +480,47 @@ def reachable_negative_cut(u, v,
             stats['negative-cut']['level_full'].append(u)
             result = True
 
+    # we can use Bloom filter labels (BFL) filter
+    if _has_labels(bfl):
+        # r(u,v)  ⇒  L_out(v) ⊆ L_out(u)  ∧  L_in(u) ⊆ L_in(v), thus
+        # L_out(v) ⊄ L_out(u)  ⇒  ¬r(u,v)
+        if not _bits_subset(bfl['out'], v, u):
+            stats['negative-cut']['bfl_out'].append(u)
+            result = True
+        # L_in(u) ⊄ L_in(v)  ⇒  ¬r(u,v)
+        if not _bits_subset(bfl['in'], u, v):
+            stats['negative-cut']['bfl_in'].append(u)
+            result = True
+
+    # we can use corrected commit dates filter
+    if _has_labels(cdate):
+        # r(u,v)      ∧ u ≠ v  ⇒  d'_v < d'_u, thus
+        # d'_u ≤ d'_v ∧ u ≠ v  ⇒  ¬r(u,v)
+        if u != v and cdate[u] <= cdate[v]:
+            stats['negative-cut']['cdate'].append(u)
+            result = True
+
+    # we can use FELINE index filter
+    if _has_labels(fel):
+        # r(u,v)                 ∧ u ≠ v  ⇒  X_u < X_v ∧ Y_u < Y_v, thus
+        # (X_v ≤ X_u ∨ Y_v ≤ Y_u) ∧ u ≠ v  ⇒  ¬r(u,v)
+        if u != v and (fel[v][0] <= fel[u][0] or fel[v][1] <= fel[u][1]):
+            stats['negative-cut']['feline'].append(u)
+            result = True
+
+    # we can use GRAIL intervals filter
+    if _has_labels(grail):
+        # r(u,v)        ⇒  L^i_v ⊆ L^i_u for all i, thus
+        # L^i_v ⊄ L^i_u  ⇒  ¬r(u,v)
+        if _grail_excludes(grail, u, v):
+            stats['negative-cut']['grail'].append(u)
+            result = True
+
     # we can use DFS numbering filter
     # from `find_dfs_intervals_extended()`
-    if II and isinstance(II[u], dict):
+    if _has_labels(II) and _is_dfs_extra(II, u):
         pos = II[v]['post']
-        if 'f_min' in II[u] and pos < II[u]['f_min']:
+        if _has_label_field(II, u, 'f_min') and pos < II[u]['f_min']:
             stats['negative-cut']['f_min'].append(u)
             result = True
 
@@ -385,11 +528,13 @@ def reachable_negative_cut(u, v,
             stats['negative-cut']['f_max'].append(u)
             result = True
 
-        # if 'f_gap' in II[u] and \
-        #   II[u]['f_gap'] is not None and \
-        #   II[u]['f_gap'] < pos < II[u]['min']:
-        #    stats['negative-cut']['f_gap'].append(u)
-        #    result = True
+        # nodes reachable from u outside its DFS subtree have π ≤ f_gap,
+        # or there are no such nodes (f_gap is None)
+        if _has_label_field(II, u, 'f_gap'):
+            f_gap = _label_field(II, u, 'f_gap')
+            if (f_gap is None or f_gap < pos) and pos < II[u]['min']:
+                stats['negative-cut']['f_gap'].append(u)
+                result = True
 
     # no further checks
     return result
@@ -409,16 +554,16 @@ def walk_spanning(DG, u, v, II):
                 u = w
                 path.append(u)
                 break
-            else:
-                # should not happen - cannot walk spanning tree to v
-                return None
+        else:
+            # should not happen - cannot walk spanning tree to v
+            return None
 
     return path
 
 
 def generic_is_reachable_bfs(DG, u, v,
-                             II=None, l=None,
-                             stats=None):
+                             II=None, l=None, cdate=None, fel=None, grail=None,
+                             bfl=None, stats=None):
     """Whether in large graph DG $v$ is reachable from $u$, utilizing given indices
 
     Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
@@ -429,7 +574,7 @@ def generic_is_reachable_bfs(DG, u, v,
 
     Parameters
     ----------
-    DG : NetworkX digraph
+    DG : NetworkX digraph or CSRGraph
         Directed acyclic graph.
 
     u : node
@@ -443,8 +588,6 @@ def generic_is_reachable_bfs(DG, u, v,
         (2-element lists, representing intervals), e.g. result of
         `find_dfs_intervals()`.
 
-        TODO:
-        -----
         Or a dictionary with nodes as keys and dict describing DFS-derived
         info, with keys such as 'min' and 'post' describing min-post interval,
         and 'f_min', 'f_gap' and 'p_tree' - like in PReaCH paper; e.g result
@@ -455,6 +598,22 @@ def generic_is_reachable_bfs(DG, u, v,
         (vertex level is also known as generation number), e.g. result of
         `find_levels()`.
 
+    cdate : dict or None, optional (default=None)
+        A dictionary with nodes as keys and corrected commit dates as values
+        (generation number v2), e.g. result of `find_corrected_dates()`.
+
+    fel : dict or None, optional (default=None)
+        A dictionary with nodes as keys and FELINE index (X, Y) coordinates
+        as values (2-element lists), e.g. result of `find_feline_index()`.
+
+    grail : dict or None, optional (default=None)
+        A dictionary with nodes as keys and lists of k GRAIL intervals
+        as values, e.g. result of `find_grail_intervals()`.
+
+    bfl : dict or None, optional (default=None)
+        A dictionary with 'out' and 'in' keys, storing Bloom filters of
+        descendants and ancestors, e.g. result of `find_bloom_filter_labels()`.
+
     stats : dict or None, optional (default=None)
         A dictionary gathering statistics about calls.
 
@@ -480,17 +639,30 @@ def generic_is_reachable_bfs(DG, u, v,
 
     # gather info about negative and positive cuts
     stats['negative-cut'] = {}
-    if l:
+    if _has_labels(l):
         # using topological levels / generation numbers for negative cut
         stats['negative-cut']['level_lite'] = []
         stats['negative-cut']['level_full'] = []
-    if II and isinstance(II[u], dict):
+    if _has_labels(bfl):
+        # using Bloom filters of descendants and ancestors for negative cut
+        stats['negative-cut']['bfl_out'] = []
+        stats['negative-cut']['bfl_in'] = []
+    if _has_labels(cdate):
+        # using corrected commit dates (generation number v2) for negative cut
+        stats['negative-cut']['cdate'] = []
+    if _has_labels(fel):
+        # using FELINE index (dominance drawing) for negative cut
+        stats['negative-cut']['feline'] = []
+    if _has_labels(grail):
+        # using GRAIL randomized graph intervals for negative cut
+        stats['negative-cut']['grail'] = []
+    if _has_labels(II) and _is_dfs_extra(II, u):
         # using DFS traversal data from PReaCH paper for negative cut
         stats['negative-cut']['f_max'] = []
-        if 'f_min' in II[u]:
+        if _has_label_field(II, u, 'f_min'):
             stats['negative-cut']['f_min'] = []
-        # if 'f_gap' in II[u]:
-        #    stats['negative-cut']['f_gap'] = []
+        if _has_label_field(II, u, 'f_gap'):
+            stats['negative-cut']['f_gap'] = []
     # do not visit any node twice
     stats['negative-cut']['visited'] = []
 
@@ -531,29 +703,1101 @@ def generic_is_reachable_bfs(DG, u, v,
         # end search (in the future: find full path to 'v')
         if reachable_positive_cut(u, v, II=II, stats=stats):
             stats['path-pre'] = calc_path(u)
-            stats['path-post'] = walk_spanning(DG, u, v, II=II)
             stats['len-pre'] = len(stats['path-pre']) - 1
+            stats['depth'] = stats['depth'][u]
+            # only the spanning tree path from 'u' to 'v' is known
+            if stats['positive-cut']['type'] == 'min-post(p_tree)':
+                return True
+            stats['path-post'] = walk_spanning(DG, u, v, II=II)
             stats['len-post'] = len(stats['path-post']) - 1
             stats['path'] = stats['path-pre'][:-1] + stats['path-post']
             stats['len'] = stats['len-pre'] + stats['len-post']
-            stats['depth'] = stats['depth'][u]
             return True
 
         # negative cut: we know that 'v' is not reachable from 'u'
         # continue with next node on the list
-        if reachable_negative_cut(u, v, l=l, II=II, stats=stats):
+        if reachable_negative_cut(u, v, l=l, II=II, cdate=cdate, fel=fel, grail=grail,
+                                  bfl=bfl, stats=stats):
             continue
 
         # walk unvisited parents / successors if not known
         for w in DG.successors(u):
             stats['access'] += 1
 
-            if w not in visited:
+            if w in visited:
+                stats['negative-cut']['visited'].append(w)
+            elif w not in stats['prev']:
+                # enqueue each node only once, when first reached, which in
+                # breadth-first walk is by the shortest path; otherwise every
+                # merge would walk the same ancestors again
                 queue.append(w)
                 stats['depth'][w] = stats['depth'][u] + 1
                 stats['prev'][w] = u
-            else:
-                stats['negative-cut']['visited'].append(w)
 
     # we have exhausted search space
     return False
+
+# %% ../08_reach.ipynb 57
+def preach_is_reachable(DG, u, v, index, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, using PReaCH index
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), whether vertex v is reachable from vertex u.
+
+    This runs pruned bidirectional breadth-first search over contraction
+    hierarchy, following only edges to vertices with higher rank, like
+    in the PReaCH paper.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    index : dict
+        PReaCH index, with contraction ranks under 'rank' key, and DFS-derived
+        data for the graph and for the reversed graph under 'fwd' and 'bwd'
+        keys; result of `find_preach_index()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'walk' key, storing nodes expanded by forward search
+         * 'walk-backward' key, storing nodes expanded by backward search
+         * 'negative-cut' and 'negative-cut-backward' keys, with nodes
+           pruned using forward and backward DFS data, respectively
+         * 'positive-cut' key, describing positive cut that ended search
+         * 'meet' key, with the node where the searches met
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+    """
+    if stats is None:
+        stats = {}
+    rank, fwd, bwd = index['rank'], index['fwd'], index['bwd']
+    # cuts with backward data, i.e. for the reversed graph, are gathered separately
+    bwd_stats = {}
+    for s in (stats, bwd_stats):
+        s['negative-cut'] = {'f_min': [], 'f_max': [], 'f_gap': []}
+    stats['access'] = 0
+    stats['walk'] = []
+    stats['walk-backward'] = []
+
+    def positive_cut(x, y):
+        # r(x,y) in graph ⇔ r(y,x) in reversed graph
+        if reachable_positive_cut(x, y, II=fwd, stats=stats):
+            return True
+        if reachable_positive_cut(y, x, II=bwd, stats=bwd_stats):
+            stats['positive-cut'] = bwd_stats['positive-cut']
+            stats['positive-cut']['reversed'] = True
+            return True
+        return False
+
+    def negative_cut(x, y):
+        # evaluate both, so that stats do not depend on check order
+        fwd_cut = reachable_negative_cut(x, y, II=fwd, stats=stats)
+        bwd_cut = reachable_negative_cut(y, x, II=bwd, stats=bwd_stats)
+        return fwd_cut or bwd_cut
+
+    def finish(result):
+        stats['negative-cut-backward'] = bwd_stats['negative-cut']
+        return result
+
+    if u == v or positive_cut(u, v):
+        return finish(True)
+    if negative_cut(u, v):
+        return finish(False)
+
+    visited_fwd = {u}
+    visited_bwd = {v}
+    queue_fwd = deque([u])
+    queue_bwd = deque([v])
+    while queue_fwd or queue_bwd:
+        # expand the side with the smaller (non-empty) queue
+        forward = queue_fwd and (not queue_bwd or len(queue_fwd) <= len(queue_bwd))
+        if forward:
+            x = queue_fwd.popleft()
+            stats['walk'].append(x)
+            neighbors = DG.successors(x)
+            visited, other_visited, queue = visited_fwd, visited_bwd, queue_fwd
+        else:
+            x = queue_bwd.popleft()
+            stats['walk-backward'].append(x)
+            neighbors = DG.predecessors(x)
+            visited, other_visited, queue = visited_bwd, visited_fwd, queue_bwd
+
+        for w in neighbors:
+            stats['access'] += 1
+            # go only up in the contraction hierarchy
+            if rank[w] < rank[x] or w in visited:
+                continue
+            if w in other_visited:
+                stats['meet'] = w
+                return finish(True)
+            visited.add(w)
+
+            if forward:
+                if positive_cut(w, v):
+                    return finish(True)
+                if not negative_cut(w, v):
+                    queue.append(w)
+            else:
+                if positive_cut(u, w):
+                    return finish(True)
+                if not negative_cut(u, w):
+                    queue.append(w)
+
+    # searches did not meet
+    return finish(False)
+
+# %% ../08_reach.ipynb 67
+def _landmark_label(label, u):
+    """Sorted list of landmark ranks for node u, for dict or CSR (offsets, values) labels"""
+    if isinstance(label, tuple):
+        offsets, values = label
+        return values[offsets[u]:offsets[u + 1]].tolist()
+    return label[u]
+
+
+def landmark_is_reachable(DG, u, v, labels,
+                          stats=None, verbose=None):
+    """Whether in graph DG $v$ is reachable from $u$, using 2-hop landmark labels
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), that is whether vertex v is reachable from vertex u.
+
+    The answer is given by intersecting sorted lists of landmarks: those
+    reachable from u, and those from which v is reachable; the graph
+    itself is not walked.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+         Directed acyclic graph (not used, kept for the same signature
+         as the other query functions).
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    labels : dict
+        Pruned landmark labels, with 'landmarks', 'out' and 'in' keys,
+        e.g. result of `find_landmark_labels()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of label entries compared
+         * 'landmark' key, storing the common landmark, if found
+
+    verbose : bool or None, optional (default=None)
+        Whether to print debugging information.  If set to None (the default),
+        it prints debugging information if stats parameter is set.
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+    """
+    if isinstance(stats, dict):
+        if verbose is None:
+            verbose = True
+        stats.setdefault('access', 0)
+
+    if u == v:
+        return True
+
+    # L_out(u) ∩ L_in(v) ≠ ∅  ⇔  r(u,v), with a merge of sorted lists
+    out_u = _landmark_label(labels['out'], u)
+    in_v = _landmark_label(labels['in'], v)
+    i = j = 0
+    while i < len(out_u) and j < len(in_v):
+        if isinstance(stats, dict):
+            stats['access'] += 1
+        if out_u[i] == in_v[j]:
+            landmark = labels['landmarks'][out_u[i]]
+            if verbose:
+                print('%s->%s via landmark %s' % (u, v, landmark))
+            if isinstance(stats, dict):
+                stats['landmark'] = landmark
+            return True
+        if out_u[i] < in_v[j]:
+            i += 1
+        else:
+            j += 1
+
+    if verbose:
+        print('%s->%s no common landmark in %r and %r' % (u, v, out_u, in_v))
+    return False
+
+# %% ../08_reach.ipynb 72
+def _runs_contain(runs, bit):
+    """Whether bit is set in run-length compressed bitmap, given as sorted run boundaries"""
+    return int(np.searchsorted(runs, bit, side='right')) % 2 == 1
+
+
+def bitmap_is_reachable(DG, u, v, index, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, using reachability bitmaps
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), whether vertex v is reachable from vertex u.
+
+    This runs breadth-first search from u, which does not go past
+    commits with bitmaps.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    index : dict
+        Bitmap index, with bits of nodes under 'bit' key, and bitmaps of
+        selected commits under 'bitmaps' key; result of
+        `find_reachability_bitmaps()` or `load_reachability_bitmaps()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'walk' key, storing all walked nodes
+         * 'bitmaps' key, storing walked nodes with bitmaps
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+    """
+    if stats is None:
+        stats = {}
+    stats['access'] = 0
+    stats['walk'] = []
+    stats['bitmaps'] = []
+    bit, bitmaps = index['bit'], index['bitmaps']
+    v_bit = bit[v]
+
+    # r(u,v)  ⇒  π(v) ≤ π(u)
+    if bit[u] < v_bit:
+        return False
+
+    queue = deque([u])
+    visited = {u}
+    while queue:
+        w = queue.popleft()
+        stats['walk'].append(w)
+        if w == v:
+            return True
+
+        runs = bitmaps.get(w)
+        if runs is not None:
+            # the bitmap includes all nodes reachable from w
+            stats['bitmaps'].append(w)
+            if _runs_contain(runs, v_bit):
+                return True
+            continue
+
+        for x in DG.successors(w):
+            stats['access'] += 1
+            if x not in visited and bit[x] >= v_bit:
+                visited.add(x)
+                queue.append(x)
+
+    return False
+
+
+def bitmap_count_reachable(DG, u, index, stats=None):
+    """Number of nodes reachable from $u$ in graph DG (including u), using reachability bitmaps
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    u : node
+        Source node.
+
+    index : dict
+        Bitmap index, result of `find_reachability_bitmaps()` or
+        `load_reachability_bitmaps()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls, with the same keys
+        as for `bitmap_is_reachable()`.
+
+    Returns
+    -------
+    int
+        Number of nodes reachable from u
+    """
+    if stats is None:
+        stats = {}
+    stats['access'] = 0
+    stats['walk'] = []
+    stats['bitmaps'] = []
+    bit, bitmaps = index['bit'], index['bitmaps']
+    mask = np.zeros(len(bit), dtype=bool)
+
+    mask[bit[u]] = True
+    stack = [u]
+    while stack:
+        w = stack.pop()
+        stats['walk'].append(w)
+        runs = bitmaps.get(w)
+        if runs is not None:
+            stats['bitmaps'].append(w)
+            for start, end in runs.reshape(-1, 2).tolist():
+                mask[start:end] = True
+            continue
+
+        for x in DG.successors(w):
+            stats['access'] += 1
+            if not mask[bit[x]]:
+                mask[bit[x]] = True
+                stack.append(x)
+
+    return int(np.count_nonzero(mask))
+
+# %% ../08_reach.ipynb 80
+def _chain_label_position(index, u, c):
+    """Smallest position in chain c reachable from u according to chain cover labels, or None"""
+    labels = index.get('labels')
+    if labels is not None:
+        return labels[u].get(c)
+    row = index['row'][u]
+    start, end = int(index['offsets'][row]), int(index['offsets'][row + 1])
+    i = start + int(np.searchsorted(index['chains'][start:end], c))
+    if i < end and index['chains'][i] == c:
+        return int(index['positions'][i])
+    return None
+
+
+def chain_is_reachable(DG, u, v, index, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, using chain cover labels
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), whether vertex v is reachable from vertex u.
+
+    This does not walk the graph; it is a single lookup in the label of u.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph; not used, present for compatibility with
+        other query functions.
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    index : dict
+        Chain cover labels, result of `find_chain_cover_labels()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of label lookups
+         * 'position' key, storing the smallest position in the chain
+           of v reachable from u, if known
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+    """
+    if stats is None:
+        stats = {}
+    chain, position = index['chain'], index['position']
+    c = chain[v]
+
+    # the same chain: positions can be compared directly
+    if chain[u] == c:
+        stats['access'] = 0
+        stats['position'] = position[u]
+        return position[u] <= position[v]
+
+    stats['access'] = 1
+    stats['position'] = _chain_label_position(index, u, c)
+    return stats['position'] is not None and stats['position'] <= position[v]
+
+# %% ../08_reach.ipynb 87
+from concurrent.futures import ProcessPoolExecutor
+
+# %% ../08_reach.ipynb 88
+def _batch_field(II, nodes, field):
+    """Values of the given field of min-post interval labels II for array of nodes"""
+    if isinstance(II, np.ndarray):
+        if II.dtype.names is not None:
+            return II[field][np.asarray(nodes)]
+        return II[np.asarray(nodes), ['min', 'post'].index(field)]
+    if _is_dfs_extra(II, nodes[0]):
+        # f_min of None cannot give negative cut
+        return np.array([-1 if II[n].get(field) is None else II[n][field] for n in nodes])
+    return np.array([II[n][['min', 'post'].index(field)] for n in nodes])
+
+
+def _batch_labels(labels, nodes):
+    """Values of per-node labels (dict or NumPy array) for array of nodes"""
+    if isinstance(labels, np.ndarray):
+        return labels[np.asarray(nodes)]
+    return np.array([labels[n] for n in nodes])
+
+
+# graph and labels in worker process, set by `_batch_search_init()`
+_batch_search_data = None
+
+
+def _batch_search_init(DG, II, l):
+    global _batch_search_data
+    _batch_search_data = (DG, II, l)
+
+
+def _batch_search_one(DG, u, v, II, l):
+    """Run `generic_is_reachable_bfs()`, return result and number of accesses"""
+    stats = {}
+    result = generic_is_reachable_bfs(DG, u, v, II=II, l=l, stats=stats)
+    return result, stats['access']
+
+
+def _batch_search(pair):
+    """Run `generic_is_reachable_bfs()` in worker process, return result and number of accesses"""
+    DG, II, l = _batch_search_data
+    return _batch_search_one(DG, pair[0], pair[1], II, l)
+
+
+def batch_is_reachable(DG, pairs, II=None, l=None, processes=None, chunksize=64, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, for many (u, v) pairs at once
+
+    First the cuts that need only the labels of $u$ and $v$ are applied
+    to all pairs at once, using comparisons of NumPy arrays:
+
+     * u = v  ⇒  r(u,v)
+     * l_u ≤ l_v  ⇒  ¬r(u,v)  (for u ≠ v; level cut)
+     * π(v) > π(u)  ⇒  ¬r(u,v)  (f_max cut)
+     * π(v) < f_min(u)  ⇒  ¬r(u,v)  (f_min cut, if II includes f_min)
+     * π(v) ∈ [min(u), π(u)]  ⇒  r(u,v)  (min-post interval positive cut)
+
+    Then `generic_is_reachable_bfs()` is run only for the remaining
+    pairs, serially or in a pool of worker processes.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    pairs : iterable of (node, node), or numpy.ndarray of shape (k, 2)
+        Pairs (u, v) of source and target nodes.
+
+    II : dict or numpy.ndarray or None, optional (default=None)
+        Min-post interval index, e.g. result of `find_dfs_intervals()`,
+        or `find_dfs_intervals_extra()`.
+
+    l : dict or numpy.ndarray or None, optional (default=None)
+        Vertex levels (generation numbers), e.g. result of `find_levels()`.
+
+    processes : int or None, optional (default=None)
+        Number of worker processes searching the graph for the pairs not
+        decided by the cuts; if None, the search runs in this process.
+
+    chunksize : int, optional (default=64)
+        Number of pairs sent at once to a worker process.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about the call:
+         * 'cuts' key, with the number of pairs decided by each cut
+           (by the first cut that applies, in the order given above)
+         * 'searched' key, with the number of pairs that needed search
+         * 'access' key, counting the number of edges accessed by searches
+
+    Returns
+    -------
+    numpy.ndarray of bool
+        Whether v is reachable from u, for each pair
+    """
+    if stats is None:
+        stats = {}
+    pairs = list(pairs)
+    result = np.zeros(len(pairs), dtype=bool)
+    stats['cuts'] = {}
+    stats['searched'] = 0
+    stats['access'] = 0
+    if not pairs:
+        return result
+
+    us = [u for u, _ in pairs]
+    vs = [v for _, v in pairs]
+    undecided = np.ones(len(pairs), dtype=bool)
+
+    def decide(cut, mask, value):
+        mask &= undecided
+        result[mask] = value
+        undecided[mask] = False
+        stats['cuts'][cut] = int(np.count_nonzero(mask))
+
+    decide('equal', np.array([u == v for u, v in pairs]), True)
+    if _has_labels(l):
+        decide('level', _batch_labels(l, us) <= _batch_labels(l, vs), False)
+    if _has_labels(II):
+        u_min, u_post = _batch_field(II, us, 'min'), _batch_field(II, us, 'post')
+        v_post = _batch_field(II, vs, 'post')
+        decide('f_max', v_post > u_post, False)
+        if _is_dfs_extra(II, us[0]) and _has_label_field(II, us[0], 'f_min'):
+            decide('f_min', v_post < _batch_field(II, us, 'f_min'), False)
+        decide('min-post', u_min <= v_post, True)
+
+    remaining = np.flatnonzero(undecided)
+    stats['searched'] = len(remaining)
+    if processes is None:
+        searches = (_batch_search_one(DG, us[i], vs[i], II, l) for i in remaining)
+        for i, (reachable, access) in zip(remaining, searches):
+            result[i] = reachable
+            stats['access'] += access
+    elif len(remaining) > 0:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_batch_search_init,
+                                 initargs=(DG, II, l)) as executor:
+            searches = executor.map(_batch_search, [(us[i], vs[i]) for i in remaining],
+                                    chunksize=chunksize)
+            for i, (reachable, access) in zip(remaining, searches):
+                result[i] = reachable
+                stats['access'] += access
+
+    return result
+
+# %% ../08_reach.ipynb 96
+def generic_is_reachable_bidir(DG, u, v, II=None, l=None, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, using bidirectional search
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), whether vertex v is reachable from vertex u.
+
+    This runs breadth-first search forward from u and backward from v at
+    the same time, expanding the smaller frontier at each step, until both
+    searches meet, or one of them runs out of nodes.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    II : dict or None, optional (default=None)
+        A dictionary with nodes as keys and min-post interval index as values,
+        e.g. result of `find_dfs_intervals()`, or dict describing DFS-derived
+        info, e.g result of `find_dfs_intervals_extra()`; see
+        `generic_is_reachable_bfs()`.
+
+    l : dict or None, optional (default=None)
+        A dictionary with nodes as keys and vertex level as values
+        (vertex level is also known as generation number), e.g. result of
+        `find_levels()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'forward' and 'backward' keys, storing nodes walked by each side
+         * 'meet' key, storing the node where both searches met, if any
+         * 'negative-cut' and 'positive-cut' keys, like for
+           `generic_is_reachable_bfs()`
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+    """
+    if stats is None:
+        stats = {}
+    stats['negative-cut'] = {}
+    if _has_labels(l):
+        stats['negative-cut']['level_lite'] = []
+        stats['negative-cut']['level_full'] = []
+    if _has_labels(II) and _is_dfs_extra(II, u):
+        stats['negative-cut']['f_max'] = []
+        if _has_label_field(II, u, 'f_min'):
+            stats['negative-cut']['f_min'] = []
+        if _has_label_field(II, u, 'f_gap'):
+            stats['negative-cut']['f_gap'] = []
+    stats['access'] = 0
+    stats['forward'] = []
+    stats['backward'] = []
+    stats['meet'] = None
+
+    if u == v:
+        stats['meet'] = u
+        return True
+    if reachable_negative_cut(u, v, II=II, l=l, stats=stats):
+        return False
+    if reachable_positive_cut(u, v, II=II, stats=stats):
+        return True
+
+    forward, backward = [u], [v]
+    forward_seen, backward_seen = {u}, {v}
+    while forward and backward:
+        if len(forward) <= len(backward):
+            # forward step, over parents (successors) of nodes reachable from u
+            frontier = []
+            for w in forward:
+                stats['forward'].append(w)
+                for x in DG.successors(w):
+                    stats['access'] += 1
+                    if x in backward_seen:
+                        stats['meet'] = x
+                        return True
+                    if x in forward_seen:
+                        continue
+                    forward_seen.add(x)
+                    # r(u,x) ∧ r(x,v)  ⇒  r(u,v)
+                    if reachable_positive_cut(x, v, II=II, stats=stats):
+                        return True
+                    # ¬r(x,v), so x is not on any path from u to v
+                    if reachable_negative_cut(x, v, II=II, l=l, stats=stats):
+                        continue
+                    frontier.append(x)
+            forward = frontier
+        else:
+            # backward step, over children (predecessors) of nodes reaching v
+            frontier = []
+            for w in backward:
+                stats['backward'].append(w)
+                for x in DG.predecessors(w):
+                    stats['access'] += 1
+                    if x in forward_seen:
+                        stats['meet'] = x
+                        return True
+                    if x in backward_seen:
+                        continue
+                    backward_seen.add(x)
+                    # r(u,x) ∧ r(x,v)  ⇒  r(u,v)
+                    if reachable_positive_cut(u, x, II=II, stats=stats):
+                        return True
+                    # ¬r(u,x), so x is not on any path from u to v
+                    if reachable_negative_cut(u, x, II=II, l=l, stats=stats):
+                        continue
+                    frontier.append(x)
+            backward = frontier
+
+    # one of the searches exhausted its search space
+    return False
+
+# %% ../08_reach.ipynb 105
+from heapq import heappush, heappop
+
+# %% ../08_reach.ipynb 106
+def _generation_key(l=None, cdate=None):
+    """Key function for min-heap, giving nodes with higher level (and corrected date) first"""
+    if _has_labels(l) and _has_labels(cdate):
+        return lambda w: (-l[w], -cdate[w])
+    if _has_labels(l):
+        return lambda w: (-l[w],)
+    if _has_labels(cdate):
+        return lambda w: (-cdate[w],)
+    raise ValueError("Either levels or corrected commit dates are needed")
+
+
+def generic_is_reachable_heap(DG, u, v, l=None, cdate=None, stats=None):
+    """Whether in graph DG $v$ is reachable from $u$, walking in generation order
+
+    Given (u, v) ∈ V², two vertices in the DAG given by the DG parameter,
+    calculate r(u,v), whether vertex v is reachable from vertex u.
+
+    This walks nodes reachable from u in the order of decreasing
+    generation number (level, then corrected commit date), using priority
+    queue, and stops as soon as the node with the highest generation left
+    in the queue has lower generation than v.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    u : node
+        Source node.
+
+    v : node
+        Target node.
+
+    l : dict or None, optional (default=None)
+        A dictionary with nodes as keys and vertex level as values
+        (vertex level is also known as generation number), e.g. result of
+        `find_levels()`.
+
+    cdate : dict or None, optional (default=None)
+        A dictionary with nodes as keys and corrected commit dates as values
+        (generation number v2), e.g. result of `find_corrected_dates()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'walk' key, storing all walked nodes
+
+    Returns
+    -------
+    r(u,v) : bool
+        Whether v is reachable from u
+
+    Raises
+    ------
+    ValueError
+        If neither levels nor corrected commit dates are given.
+    """
+    key = _generation_key(l, cdate)
+    if stats is None:
+        stats = {}
+    stats['access'] = 0
+    stats['walk'] = []
+
+    v_key = key(v)
+    # the sequence number keeps order of nodes with the same generation stable,
+    # and avoids comparing nodes themselves
+    queue = [(key(u), 0, u)]
+    seen = {u}
+    while queue:
+        w_key, _, w = heappop(queue)
+        if w == v:
+            return True
+        # no node left in the queue has generation higher than v
+        if w_key > v_key:
+            return False
+        stats['walk'].append(w)
+        # w ≠ v with the same generation as v cannot reach v
+        if w_key == v_key:
+            continue
+
+        for x in DG.successors(w):
+            stats['access'] += 1
+            if x not in seen:
+                seen.add(x)
+                heappush(queue, (key(x), len(seen), x))
+
+    return False
+
+
+def merge_bases(DG, commits, labels, stats=None):
+    """Find all best common ancestors of two or more commits in graph DG
+
+    Best common ancestors of commits are those nodes reachable from all
+    of the given commits, that are not reachable from any other such
+    common ancestor, like with `git merge-base --all` for two commits, or
+    `git merge-base --octopus` for more commits.
+
+    This paints nodes reachable from each commit with its own flag,
+    walking them in the order of decreasing generation number, like Git's
+    `paint_down_to_common()`.  A node painted with flags of all commits is
+    a merge base, and all nodes reachable from it are marked as stale.
+    The walk stops when there are only stale nodes left in the queue.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph, with edges going from commit to its parents.
+
+    commits : list of nodes
+        Two or more commits to find merge bases of.
+
+    labels : dict
+        Generation numbers of nodes: levels under the 'lvl' key (e.g.
+        result of `find_levels()`), and / or corrected commit dates
+        under the 'cdate' key (e.g. result of `find_corrected_dates()`).
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'visited' key, counting the number of nodes taken from the queue
+
+    Returns
+    -------
+    list
+        Merge bases, in the order of decreasing generation; empty list if
+        the commits have no common ancestor.
+
+    Raises
+    ------
+    ValueError
+        If fewer than two commits are given, or if neither levels nor
+        corrected commit dates are given.
+    """
+    commits = list(commits)
+    if len(commits) < 2:
+        raise ValueError("At least two commits are needed to find merge bases")
+    key = _generation_key(labels.get('lvl'), labels.get('cdate'))
+    if stats is None:
+        stats = {}
+    stats['access'] = 0
+    stats['visited'] = 0
+
+    all_flags = (1 << len(commits)) - 1
+    stale = 1 << len(commits)
+    flags = {}
+    for i, commit in enumerate(commits):
+        flags[commit] = flags.get(commit, 0) | (1 << i)
+    queue = []
+    for commit in flags:
+        heappush(queue, (key(commit), len(queue), commit))
+    pushed = len(queue)
+    # number of nodes in the queue that are not stale
+    nonstale = len(queue)
+
+    result = []
+    while nonstale > 0:
+        _, _, w = heappop(queue)
+        stats['visited'] += 1
+        w_flags = flags[w]
+        if not w_flags & stale:
+            nonstale -= 1
+            if w_flags == all_flags:
+                # as children are walked before parents, no other merge base
+                # can reach w, so there is no need to remove redundant ones
+                result.append(w)
+                w_flags |= stale
+
+        for x in DG.successors(w):
+            stats['access'] += 1
+            x_flags = flags.get(x)
+            if x_flags is None:
+                flags[x] = w_flags
+                heappush(queue, (key(x), pushed, x))
+                pushed += 1
+                if not w_flags & stale:
+                    nonstale += 1
+            elif x_flags | w_flags != x_flags:
+                flags[x] = x_flags | w_flags
+                if w_flags & stale and not x_flags & stale:
+                    nonstale -= 1
+
+    return result
+
+# %% ../08_reach.ipynb 115
+def ahead_behind(DG, base, tips, labels, stats=None):
+    """Number of commits each of tips is ahead of and behind the base commit
+
+    For each tip, find the number of commits reachable from the tip but
+    not from the base (ahead), and the number of commits reachable from
+    the base but not from the tip (behind), all in a single walk in the
+    order of decreasing generation number shared by all tips.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph, with edges going from commit to its parents.
+
+    base : node
+        Base commit, e.g. the tip of the main branch.
+
+    tips : list of nodes
+        Commits to compare with the base commit, e.g. tips of branches.
+
+    labels : dict
+        Generation numbers of nodes: levels under the 'lvl' key (e.g.
+        result of `find_levels()`), and / or corrected commit dates
+        under the 'cdate' key (e.g. result of `find_corrected_dates()`).
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'visited' key, counting the number of nodes taken from the queue
+
+    Returns
+    -------
+    list of (int, int)
+        Number of commits ahead and behind, for each of tips.
+
+    Raises
+    ------
+    ValueError
+        If neither levels nor corrected commit dates are given.
+    """
+    tips = list(tips)
+    key = _generation_key(labels.get('lvl'), labels.get('cdate'))
+    if stats is None:
+        stats = {}
+    stats['access'] = 0
+    stats['visited'] = 0
+
+    # bit 0 is the flag of the base, bit i+1 the flag of tips[i]
+    all_flags = (1 << (len(tips) + 1)) - 1
+    flags = {base: 1}
+    for i, tip in enumerate(tips):
+        flags[tip] = flags.get(tip, 0) | (1 << (i + 1))
+    queue = []
+    for commit in flags:
+        heappush(queue, (key(commit), len(queue), commit))
+    pushed = len(queue)
+    # number of nodes in the queue without all flags
+    incomplete = sum(1 for commit in flags if flags[commit] != all_flags)
+
+    # number of walked nodes with given flags
+    counts = {}
+    while incomplete > 0:
+        _, _, w = heappop(queue)
+        stats['visited'] += 1
+        w_flags = flags[w]
+        if w_flags != all_flags:
+            incomplete -= 1
+            counts[w_flags] = counts.get(w_flags, 0) + 1
+
+        for x in DG.successors(w):
+            stats['access'] += 1
+            x_flags = flags.get(x)
+            if x_flags is None:
+                flags[x] = w_flags
+                heappush(queue, (key(x), pushed, x))
+                pushed += 1
+                if w_flags != all_flags:
+                    incomplete += 1
+            elif x_flags | w_flags != x_flags:
+                flags[x] = x_flags | w_flags
+                if flags[x] == all_flags:
+                    incomplete -= 1
+
+    result = []
+    for i in range(len(tips)):
+        tip_flag = 1 << (i + 1)
+        ahead = sum(count for f, count in counts.items() if f & tip_flag and not f & 1)
+        behind = sum(count for f, count in counts.items() if f & 1 and not f & tip_flag)
+        result.append((ahead, behind))
+    return result
+
+# %% ../08_reach.ipynb 122
+def tips_contain(DG, tips, v, II=None, l=None, stats=None):
+    """Whether $v$ is reachable from each of tips in graph DG
+
+    Given tips, a list of vertices in the DAG given by the DG parameter,
+    and vertex v, calculate r(u,v) for each u in tips, sharing results
+    found for intermediate nodes between the searches from all tips.
+
+    Parameters
+    ----------
+    DG : NetworkX digraph or CSRGraph
+        Directed acyclic graph.
+
+    tips : list of nodes
+        Source nodes, e.g. tips of branches, or tagged commits.
+
+    v : node
+        Target node.
+
+    II : dict or None, optional (default=None)
+        A dictionary with nodes as keys and min-post interval index as values,
+        e.g. result of `find_dfs_intervals()`, or dict describing DFS-derived
+        info, e.g result of `find_dfs_intervals_extra()`; see
+        `generic_is_reachable_bfs()`.
+
+    l : dict or None, optional (default=None)
+        A dictionary with nodes as keys and vertex level as values
+        (vertex level is also known as generation number), e.g. result of
+        `find_levels()`.
+
+    stats : dict or None, optional (default=None)
+        A dictionary gathering statistics about calls.  Currently supported
+        are:
+         * 'access' key, counting the number of edges it checks / accesses
+         * 'walk' key, storing all walked nodes
+         * 'memo' key, counting the number of times a remembered verdict
+           was used
+         * 'negative-cut' and 'positive-cut' keys, like for
+           `generic_is_reachable_bfs()`
+
+    Returns
+    -------
+    list of bool
+        Whether v is reachable from each of tips
+    """
+    tips = list(tips)
+    if stats is None:
+        stats = {}
+    stats['negative-cut'] = {}
+    if _has_labels(l):
+        stats['negative-cut']['level_lite'] = []
+        stats['negative-cut']['level_full'] = []
+    if _has_labels(II) and _is_dfs_extra(II, v):
+        stats['negative-cut']['f_max'] = []
+        if _has_label_field(II, v, 'f_min'):
+            stats['negative-cut']['f_min'] = []
+        if _has_label_field(II, v, 'f_gap'):
+            stats['negative-cut']['f_gap'] = []
+    stats['access'] = 0
+    stats['walk'] = []
+    stats['memo'] = 0
+
+    # whether v is reachable from node, for all nodes with known verdict
+    verdict = {}
+
+    def cut_verdict(w):
+        """Verdict for w if given by the cuts, or None"""
+        if w == v:
+            return True
+        if reachable_negative_cut(w, v, II=II, l=l, stats=stats):
+            return False
+        if reachable_positive_cut(w, v, II=II, stats=stats):
+            return True
+        return None
+
+    result = []
+    for tip in tips:
+        if tip in verdict:
+            stats['memo'] += 1
+            result.append(verdict[tip])
+            continue
+        found = cut_verdict(tip)
+        if found is not None:
+            verdict[tip] = found
+            result.append(found)
+            continue
+
+        # depth-first walk, with the current path from the tip on the stack
+        found = False
+        stats['walk'].append(tip)
+        stack = [(tip, iter(DG.successors(tip)))]
+        while stack and not found:
+            w, parents = stack[-1]
+            for x in parents:
+                stats['access'] += 1
+                x_verdict = verdict.get(x)
+                if x_verdict is not None:
+                    stats['memo'] += 1
+                else:
+                    x_verdict = cut_verdict(x)
+                    if x_verdict is None:
+                        # walk x before continuing with other parents of w
+                        stats['walk'].append(x)
+                        stack.append((x, iter(DG.successors(x))))
+                        break
+                    verdict[x] = x_verdict
+                if x_verdict:
+                    found = True
+                    break
+            else:
+                # no parent of w can reach v
+                verdict[w] = False
+                stack.pop()
+
+        # all nodes on the path from the tip to the found node reach v
+        for w, _ in stack:
+            verdict[w] = True
+        result.append(found)
+
+    return result